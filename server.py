@@ -9,14 +9,33 @@ from flask_cors import CORS
 import subprocess
 import json
 import os
+import re
 import sys
 
+# Shared text analysis lives alongside the training scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'training'))
+from text_features import extract_features
+from multilingual_index import load_language_indexes
+from text_normalizer import fold
+from tile_parser import parse_tiles, split_emoji
+from semantic_retrieval import SemanticIndex
+
 app = Flask(__name__)
 CORS(app)  # Allow browser to connect
 
+# Per-language node indexes, built once at startup
+LANGUAGE_INDEXES = load_language_indexes(os.path.dirname(os.path.abspath(__file__)))
+
+# Nearest curated example tier; None until `python training/semantic_retrieval.py --embedder minilm`
+# builds it. Hashing-built indexes match on shared words, not meaning, and are refused.
+SEMANTIC_INDEX = SemanticIndex.load(semantic_only=True)
+
 # Path to the Rust binary - Hospital Grade
 RUST_BINARY = "./target/release/hospital_grade_complete"
 
+# "1. ✅ Yes! (confidence: 0.85)" -> tile text, confidence
+NUMBERED_LINE = re.compile(r'^\s*\d+[.)]\s*(.*?)\s*(?:\(confidence:\s*([0-9.]+)\))?\s*$')
+
 @app.route('/')
 def index():
     """Serve the main HTML interface"""
@@ -28,8 +47,24 @@ def get_suggestions():
     try:
         data = request.json
         question = data.get('question', '')
+        lang = data.get('lang', 'en')
         
-        print(f"🧠 Received question: {question}")
+        print(f"🧠 Received question ({lang}): {question}")
+        
+        # Other languages are answered from their own node index only
+        if lang != 'en':
+            if lang not in LANGUAGE_INDEXES:
+                return jsonify({
+                    'success': False,
+                    'error': f"Unsupported language: {lang}",
+                    'languages': ['en'] + sorted(LANGUAGE_INDEXES)
+                }), 400
+            return jsonify({
+                'success': True,
+                'suggestions': LANGUAGE_INDEXES[lang].suggest(question),
+                'question': question,
+                'lang': lang
+            })
         
         # FIRST: Try calling the actual Rust AI engine
         try:
@@ -51,7 +86,20 @@ def get_suggestions():
         except Exception as rust_error:
             print(f"❌ Rust engine error: {rust_error}")
         
-        # SECOND: Try Ollama with trained model  
+        # SECOND: Answer from the nearest curated example if it is close enough
+        if SEMANTIC_INDEX is not None:
+            retrieved = SEMANTIC_INDEX.suggest(question)
+            if retrieved:
+                print(f"🧭 Using curated match: {retrieved['match']['input']} "
+                      f"(similarity {retrieved['match']['similarity']})")
+                return jsonify({
+                    'success': True,
+                    'suggestions': retrieved['suggestions'],
+                    'question': question,
+                    'match': retrieved['match']
+                })
+        
+        # THIRD: Try Ollama with trained model  
         try:
             prompt = f"""You are helping a non-verbal person communicate. They were asked: "{question}"
 Generate exactly 6 appropriate response tiles. Each tile should be a possible answer.
@@ -93,13 +141,14 @@ Responses for "{question}":"""
         except Exception as ollama_error:
             print(f"❌ Ollama error: {ollama_error}")
         
-        # THIRD: Use dynamic fallback (better than hardcoded)
+        # FOURTH: Use dynamic fallback (better than hardcoded)
         print(f"💡 Using dynamic analysis fallback")
         suggestions = get_dynamic_suggestions(question)
         return jsonify({
             'success': True,
             'suggestions': suggestions,
-            'question': question
+            'question': question,
+            'analysis': extract_features(question)
         })
         
     except Exception as e:
@@ -161,31 +210,19 @@ def parse_suggestions(output, question):
     """Parse suggestion output from Rust engine"""
     suggestions = []
     
-    # Try to extract suggestions from the output
-    lines = output.split('\n')
-    for line in lines:
-        if '.' in line and any(emoji in line for emoji in ['✅', '❌', '🤷', '🤔', '😊', '😢', '💊', '💧', '🍽️']):
-            # Parse lines that look like: "1. ✅ Yes! (confidence: 0.85)"
-            parts = line.strip().split(' ', 2)
-            if len(parts) >= 3:
-                emoji = parts[1]
-                text_and_conf = parts[2]
-                text = text_and_conf.split('(')[0].strip()
-                
-                # Extract confidence if present
-                confidence = 0.85
-                if 'confidence:' in text_and_conf:
-                    try:
-                        conf_str = text_and_conf.split('confidence:')[1].strip('() ')
-                        confidence = float(conf_str)
-                    except:
-                        pass
-                
-                suggestions.append({
-                    'emoji': emoji,
-                    'text': text,
-                    'confidence': confidence
-                })
+    # Lines look like: "1. ✅ Yes! (confidence: 0.85)"
+    for line in output.split('\n'):
+        match = NUMBERED_LINE.match(line)
+        if not match:
+            continue
+        emoji, text = split_emoji(match.group(1))
+        if not emoji or not text:
+            continue
+        suggestions.append({
+            'emoji': emoji,
+            'text': text,
+            'confidence': float(match.group(2)) if match.group(2) else 0.85
+        })
     
     # If no suggestions found, return fallback
     if not suggestions:
@@ -196,31 +233,26 @@ def parse_suggestions(output, question):
 def parse_ollama_freeform(output, question):
     """Try to parse freeform Ollama output into tiles"""
     suggestions = []
-    lines = output.split('\n')
     
-    for line in lines:
+    for line in output.split('\n'):
         line = line.strip()
-        if line and not line.startswith('#'):
-            # Try to extract emoji and text
-            import re
-            emoji_pattern = r'[😀-🙏🌀-🗿🚀-🛿🏠-🏿✨-➿☀-♿️🎀-🏿]+'
-            emojis = re.findall(emoji_pattern, line)
-            
-            if emojis:
-                emoji = emojis[0]
-                text = line.replace(emoji, '').strip(' -,.:')
-                if text:
-                    suggestions.append({
-                        'emoji': emoji,
-                        'text': text[:20],  # Limit text length
-                        'confidence': 0.80 + (len(suggestions) * 0.03)
-                    })
+        if not line or line.startswith('#'):
+            continue
+        # A line may hold one tile or a comma-separated tile list
+        for tile in parse_tiles(line, require_emoji=True, require_words=True, tile_ids=False):
+            text = tile['words'].strip(' -.:')
+            if text:
+                suggestions.append({
+                    'emoji': tile['emoji'],
+                    'text': text[:20],  # Limit text length
+                    'confidence': 0.80 + (len(suggestions) * 0.03)
+                })
     
     return suggestions
 
 def get_dynamic_suggestions(question):
     """Generate dynamic context-aware suggestions for ANY question"""
-    q = question.lower()
+    q = fold(question)
     
     # Sleep related
     if any(word in q for word in ['sleep', 'rest', 'tired', 'nap', 'bed']):
@@ -348,6 +380,9 @@ if __name__ == '__main__':
     print("🎤 Make sure to allow microphone access for speech input")
     print("-" * 50)
     
+    for lang, index in sorted(LANGUAGE_INDEXES.items()):
+        print(f"🌍 Loaded {lang} index: {len(index.nodes)} nodes")
+    
     # Check if Rust binary exists
     if not os.path.exists(RUST_BINARY):
         print("⚠️  Warning: Rust binary not found. Running in fallback mode.")
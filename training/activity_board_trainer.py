@@ -3,8 +3,9 @@
 Activity Board Integration Trainer
 Links TinkyBink to step-by-step activity guides and how-to boards
 """
-import subprocess
 import json
+from model_backend import make_model_backend
+from model_registry import ModelRegistry
 
 def create_activity_boards():
     """Create comprehensive activity boards with step-by-step instructions"""
@@ -140,7 +141,7 @@ def create_activity_boards():
     
     return activity_boards
 
-def create_activity_integrated_model():
+def create_activity_integrated_model(registry):
     """Create TinkyBink model with activity board integration"""
     print("\n🔗 Creating Activity-Integrated TinkyBink Model")
     print("=" * 60)
@@ -223,27 +224,22 @@ TEMPLATE """{{ .System }}
     with open('Modelfile.activity_integrated', 'w') as f:
         f.write(modelfile_content)
     
-    # Remove existing models
-    subprocess.run(['ollama', 'rm', 'tinkybink'], capture_output=True)
-    subprocess.run(['ollama', 'rm', 'tinkybink_activity'], capture_output=True)
-    
     # Create activity integrated model
-    result = subprocess.run(['ollama', 'create', 'tinkybink_activity', '-f', 'Modelfile.activity_integrated'],
-                          capture_output=True, text=True)
+    ok, error = registry.ensure('tinkybink_activity', 'Modelfile.activity_integrated', ['activity_boards.json'])
     
-    if result.returncode == 0:
+    if ok:
         print("✅ Activity-Integrated Model Created!")
         
         # Update main tinkybink model
-        subprocess.run(['ollama', 'create', 'tinkybink', '-f', 'Modelfile.activity_integrated'])
+        registry.promote('tinkybink', 'tinkybink_activity')
         print("✅ Updated main 'tinkybink' model with activity boards")
         
         return 'tinkybink_activity'
     else:
-        print(f"❌ Failed: {result.stderr}")
+        print(f"❌ Failed: {error}")
         return None
 
-def test_activity_integration(model_name):
+def test_activity_integration(model_name, registry):
     """Test the activity board integration"""
     print(f"\n📋 Testing Activity Board Integration: {model_name}")
     print("=" * 70)
@@ -281,12 +277,10 @@ def test_activity_integration(model_name):
         print(f"Input: '{test_input}'")
         
         try:
-            result = subprocess.run(['ollama', 'run', model_name],
-                                  input=test_input, text=True,
-                                  capture_output=True, timeout=15)
+            output = registry.models.run(model_name, test_input, timeout=15)
             
-            if result.stdout:
-                response = result.stdout.strip().split('\n')[0]
+            if output:
+                response = output.strip().split('\n')[0]
                 if response.startswith('Response:'):
                     response = response[9:].strip()
                 
@@ -325,6 +319,7 @@ def test_activity_integration(model_name):
     total_tests = len(activity_tests)
     success_rate = (perfect_count / total_tests) * 100
     activity_rate = (activity_count / 14) * 100  # 14 activity-specific tests
+    registry.record_score(model_name, success_rate / 10)
     
     print(f"\n📋 ACTIVITY INTEGRATION RESULTS")
     print("=" * 40)
@@ -352,11 +347,13 @@ def main():
     activity_boards = create_activity_boards()
     
     # Create integrated model
-    model_name = create_activity_integrated_model()
+    models = make_model_backend()
+    registry = ModelRegistry(models)
+    model_name = create_activity_integrated_model(registry)
     
     if model_name:
         # Test the integration
-        success = test_activity_integration(model_name)
+        success = test_activity_integration(model_name, registry)
         
         if success:
             print("\n🎊 ACTIVITY INTEGRATION SUCCESS!")
@@ -2,11 +2,13 @@
 """
 Add ALL Remaining Specialized Topics
 Complete coverage of every possible human communication domain
+Scenarios live in scenarios/all_remaining_topics.jsonl
 """
-import json
-import random
+from scenario_engine import write_scenarios
 
-def add_all_remaining_topics():
+SCENARIOS = 'all_remaining_topics'
+
+def add_all_remaining_topics(sections=None, categories=None):
     """Add every remaining specialized topic and domain"""
     
     print("🌟 TinkyBink ALL Remaining Topics Creator")
@@ -16,807 +18,22 @@ def add_all_remaining_topics():
     print("🔥 No stone left unturned")
     print()
     
-    all_new_examples = []
-    
-    # SPECIALIZED DOMAINS
-    
-    # 1. ASTRONOMY & SPACE (30 examples)
-    astronomy_examples = create_astronomy_space()
-    all_new_examples.extend(astronomy_examples)
-    print(f"✅ Astronomy & Space: {len(astronomy_examples)} examples")
-    
-    # 2. MARINE & OCEAN LIFE (25 examples)
-    marine_examples = create_marine_ocean()
-    all_new_examples.extend(marine_examples)
-    print(f"✅ Marine & Ocean Life: {len(marine_examples)} examples")
-    
-    # 3. GEOLOGY & EARTH SCIENCES (25 examples)
-    geology_examples = create_geology_earth()
-    all_new_examples.extend(geology_examples)
-    print(f"✅ Geology & Earth Sciences: {len(geology_examples)} examples")
-    
-    # 4. MATHEMATICS & STATISTICS (30 examples)
-    math_examples = create_mathematics_statistics()
-    all_new_examples.extend(math_examples)
-    print(f"✅ Mathematics & Statistics: {len(math_examples)} examples")
-    
-    # 5. ARCHITECTURE & DESIGN (25 examples)
-    architecture_examples = create_architecture_design()
-    all_new_examples.extend(architecture_examples)
-    print(f"✅ Architecture & Design: {len(architecture_examples)} examples")
-    
-    # 6. ANTHROPOLOGY & ARCHAEOLOGY (25 examples)
-    anthropology_examples = create_anthropology_archaeology()
-    all_new_examples.extend(anthropology_examples)
-    print(f"✅ Anthropology & Archaeology: {len(anthropology_examples)} examples")
-    
-    # 7. PSYCHOLOGY & COGNITIVE SCIENCE (30 examples)
-    psychology_examples = create_psychology_cognitive()
-    all_new_examples.extend(psychology_examples)
-    print(f"✅ Psychology & Cognitive Science: {len(psychology_examples)} examples")
-    
-    # 8. LINGUISTICS & LANGUAGE (25 examples)
-    linguistics_examples = create_linguistics_language()
-    all_new_examples.extend(linguistics_examples)
-    print(f"✅ Linguistics & Language: {len(linguistics_examples)} examples")
-    
-    # 9. AGRICULTURE & FARMING (25 examples)
-    agriculture_examples = create_agriculture_farming()
-    all_new_examples.extend(agriculture_examples)
-    print(f"✅ Agriculture & Farming: {len(agriculture_examples)} examples")
-    
-    # 10. MANUFACTURING & INDUSTRY (25 examples)
-    manufacturing_examples = create_manufacturing_industry()
-    all_new_examples.extend(manufacturing_examples)
-    print(f"✅ Manufacturing & Industry: {len(manufacturing_examples)} examples")
-    
-    # 11. LOGISTICS & SUPPLY CHAIN (20 examples)
-    logistics_examples = create_logistics_supply()
-    all_new_examples.extend(logistics_examples)
-    print(f"✅ Logistics & Supply Chain: {len(logistics_examples)} examples")
-    
-    # 12. INSURANCE & RISK MANAGEMENT (20 examples)
-    insurance_examples = create_insurance_risk()
-    all_new_examples.extend(insurance_examples)
-    print(f"✅ Insurance & Risk Management: {len(insurance_examples)} examples")
-    
-    # 13. REAL ESTATE & PROPERTY (25 examples)
-    realestate_examples = create_realestate_property()
-    all_new_examples.extend(realestate_examples)
-    print(f"✅ Real Estate & Property: {len(realestate_examples)} examples")
-    
-    # 14. ENERGY & UTILITIES (25 examples)
-    energy_examples = create_energy_utilities()
-    all_new_examples.extend(energy_examples)
-    print(f"✅ Energy & Utilities: {len(energy_examples)} examples")
-    
-    # 15. MINING & EXTRACTION (20 examples)
-    mining_examples = create_mining_extraction()
-    all_new_examples.extend(mining_examples)
-    print(f"✅ Mining & Extraction: {len(mining_examples)} examples")
-    
-    # 16. TEXTILES & FASHION (20 examples)
-    textiles_examples = create_textiles_fashion()
-    all_new_examples.extend(textiles_examples)
-    print(f"✅ Textiles & Fashion: {len(textiles_examples)} examples")
-    
-    # 17. FOOD SERVICE & HOSPITALITY (25 examples)
-    foodservice_examples = create_foodservice_hospitality()
-    all_new_examples.extend(foodservice_examples)
-    print(f"✅ Food Service & Hospitality: {len(foodservice_examples)} examples")
-    
-    # 18. AUTOMOTIVE & MECHANICS (25 examples)
-    automotive_examples = create_automotive_mechanics()
-    all_new_examples.extend(automotive_examples)
-    print(f"✅ Automotive & Mechanics: {len(automotive_examples)} examples")
-    
-    # 19. AVIATION & AEROSPACE (25 examples)
-    aviation_examples = create_aviation_aerospace()
-    all_new_examples.extend(aviation_examples)
-    print(f"✅ Aviation & Aerospace: {len(aviation_examples)} examples")
-    
-    # 20. MARITIME & SHIPPING (20 examples)
-    maritime_examples = create_maritime_shipping()
-    all_new_examples.extend(maritime_examples)
-    print(f"✅ Maritime & Shipping: {len(maritime_examples)} examples")
-    
-    # 21. RAILWAY & TRAINS (20 examples)
-    railway_examples = create_railway_trains()
-    all_new_examples.extend(railway_examples)
-    print(f"✅ Railway & Trains: {len(railway_examples)} examples")
-    
-    # 22. TELECOMMUNICATIONS (20 examples)
-    telecom_examples = create_telecommunications()
-    all_new_examples.extend(telecom_examples)
-    print(f"✅ Telecommunications: {len(telecom_examples)} examples")
-    
-    # 23. BROADCASTING & MEDIA (20 examples)
-    broadcasting_examples = create_broadcasting_media()
-    all_new_examples.extend(broadcasting_examples)
-    print(f"✅ Broadcasting & Media: {len(broadcasting_examples)} examples")
-    
-    # 24. PUBLISHING & LITERATURE (20 examples)
-    publishing_examples = create_publishing_literature()
-    all_new_examples.extend(publishing_examples)
-    print(f"✅ Publishing & Literature: {len(publishing_examples)} examples")
-    
-    # 25. MUSEUMS & CULTURAL INSTITUTIONS (20 examples)
-    museums_examples = create_museums_cultural()
-    all_new_examples.extend(museums_examples)
-    print(f"✅ Museums & Cultural Institutions: {len(museums_examples)} examples")
-    
-    # 26. LIBRARIES & INFORMATION SCIENCE (20 examples)
-    libraries_examples = create_libraries_information()
-    all_new_examples.extend(libraries_examples)
-    print(f"✅ Libraries & Information Science: {len(libraries_examples)} examples")
-    
-    # 27. ZOOS & WILDLIFE CONSERVATION (20 examples)
-    zoos_examples = create_zoos_wildlife()
-    all_new_examples.extend(zoos_examples)
-    print(f"✅ Zoos & Wildlife Conservation: {len(zoos_examples)} examples")
-    
-    # 28. PARKS & RECREATION MANAGEMENT (20 examples)
-    parks_examples = create_parks_recreation()
-    all_new_examples.extend(parks_examples)
-    print(f"✅ Parks & Recreation Management: {len(parks_examples)} examples")
-    
-    # 29. WASTE MANAGEMENT & RECYCLING (18 examples)
-    waste_examples = create_waste_recycling()
-    all_new_examples.extend(waste_examples)
-    print(f"✅ Waste Management & Recycling: {len(waste_examples)} examples")
-    
-    # 30. SECURITY & SURVEILLANCE (20 examples)
-    security_examples = create_security_surveillance()
-    all_new_examples.extend(security_examples)
-    print(f"✅ Security & Surveillance: {len(security_examples)} examples")
-    
-    # 31. FORENSICS & INVESTIGATION (20 examples)
-    forensics_examples = create_forensics_investigation()
-    all_new_examples.extend(forensics_examples)
-    print(f"✅ Forensics & Investigation: {len(forensics_examples)} examples")
-    
-    # 32. METEOROLOGY & WEATHER SCIENCE (18 examples)
-    meteorology_examples = create_meteorology_weather()
-    all_new_examples.extend(meteorology_examples)
-    print(f"✅ Meteorology & Weather Science: {len(meteorology_examples)} examples")
-    
-    # 33. SEISMOLOGY & EARTHQUAKE SCIENCE (15 examples)
-    seismology_examples = create_seismology_earthquake()
-    all_new_examples.extend(seismology_examples)
-    print(f"✅ Seismology & Earthquake Science: {len(seismology_examples)} examples")
-    
-    # 34. VOLCANOLOGY & GEOLOGICAL HAZARDS (15 examples)
-    volcanology_examples = create_volcanology_hazards()
-    all_new_examples.extend(volcanology_examples)
-    print(f"✅ Volcanology & Geological Hazards: {len(volcanology_examples)} examples")
-    
-    # 35. ROBOTICS & AUTOMATION (25 examples)
-    robotics_examples = create_robotics_automation()
-    all_new_examples.extend(robotics_examples)
-    print(f"✅ Robotics & Automation: {len(robotics_examples)} examples")
-    
-    # 36. ARTIFICIAL INTELLIGENCE & MACHINE LEARNING (25 examples)
-    ai_examples = create_ai_machine_learning()
-    all_new_examples.extend(ai_examples)
-    print(f"✅ AI & Machine Learning: {len(ai_examples)} examples")
-    
-    # 37. CYBERSECURITY & DIGITAL FORENSICS (25 examples)
-    cybersecurity_examples = create_cybersecurity_digital()
-    all_new_examples.extend(cybersecurity_examples)
-    print(f"✅ Cybersecurity & Digital Forensics: {len(cybersecurity_examples)} examples")
-    
-    # 38. QUANTUM COMPUTING & PHYSICS (20 examples)
-    quantum_examples = create_quantum_computing()
-    all_new_examples.extend(quantum_examples)
-    print(f"✅ Quantum Computing & Physics: {len(quantum_examples)} examples")
-    
-    # 39. BIOTECHNOLOGY & GENETIC ENGINEERING (25 examples)
-    biotech_examples = create_biotechnology_genetic()
-    all_new_examples.extend(biotech_examples)
-    print(f"✅ Biotechnology & Genetic Engineering: {len(biotech_examples)} examples")
+    # Save all remaining topics
+    output_file = "tinkybink_all_remaining_topics.jsonl"
+    counts = write_scenarios(SCENARIOS, output_file, sections=sections, categories=categories)
     
-    # 40. NANOTECHNOLOGY & MATERIALS SCIENCE (20 examples)
-    nanotech_examples = create_nanotechnology_materials()
-    all_new_examples.extend(nanotech_examples)
-    print(f"✅ Nanotechnology & Materials Science: {len(nanotech_examples)} examples")
+    for label, count in counts.items():
+        print(f"✅ {label}: {count} examples")
     
-    total_new = len(all_new_examples)
+    total_new = sum(counts.values())
     
     print(f"\n🎯 TOTAL ALL REMAINING TOPICS: {total_new:,}")
-    
-    # Save all remaining topics
-    output_file = "tinkybink_all_remaining_topics.jsonl"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for example in all_new_examples:
-            f.write(json.dumps(example, ensure_ascii=False) + '\n')
-    
     print(f"✅ Saved: {output_file}")
     print(f"🏆 ABSOLUTE COMPLETE COVERAGE ACHIEVED!")
     
     return total_new
 
-def create_astronomy_space():
-    """Astronomy and space exploration examples"""
-    examples = []
-    
-    scenarios = [
-        ("Learning about planets", "🪐 Saturn has rings, 🌍 Earth is home, 🔴 Mars looks red, 🌙 Moon orbits us", "astronomy"),
-        ("Space exploration", "🚀 Rockets reach space, 👩‍🚀 Astronauts float weightless, 🛰️ Satellites orbit Earth, 🌌 Stars infinite distance", "astronomy"),
-        ("Solar system", "☀️ Sun center everything, 🪐 Eight planets orbit, ☄️ Comets visit sometimes, 🌑 Asteroids between Mars", "astronomy"),
-        ("Black holes", "🕳️ Nothing escapes gravity, ⭐ Stars collapse inward, 🌌 Space time bends, 🔬 Scientists study mysteries", "astronomy"),
-        ("Constellations", "⭐ Star patterns sky, 🐻 Ursa Major bear, 🦅 Eagle soars overhead, 📍 Navigation helps sailors", "astronomy"),
-        ("Space missions", "🚀 NASA launches rockets, 🛰️ Hubble telescope amazing, 🔴 Mars rovers explore, 👩‍🚀 International space station", "astronomy"),
-        ("Galaxies", "🌌 Milky Way home, 🌀 Spiral arms rotating, 💫 Billions stars together, 🔭 Telescope reveals distant", "astronomy"),
-        ("Moon phases", "🌑 New moon dark, 🌓 Crescent thin slice, 🌕 Full moon bright, 🌘 Waning getting smaller", "astronomy"),
-        ("Meteor showers", "☄️ Space rocks burning, 🌃 Night sky fireworks, 💫 Wishes on shooting, ⏰ Annual shower dates", "astronomy"),
-        ("Telescope observation", "🔭 Magnifies distant objects, 👁️ Eye piece viewing, 🌟 Stars appear closer, 📸 Photography captures images", "astronomy"),
-        ("Space weather", "☀️ Solar flares dangerous, ⚡ Aurora lights beautiful, 📡 Satellites affected sometimes, 🌍 Magnetic field protects", "astronomy"),
-        ("Exoplanets", "🪐 Planets outside system, 🔍 Search for life, 🌍 Earth-like worlds exist, 🔬 Scientists discover more", "astronomy"),
-        ("Space suits", "👩‍🚀 Pressurized protection needed, 💨 Oxygen supply essential, 🌡️ Temperature control important, 🛡️ Radiation shielding required", "astronomy"),
-        ("Rocket science", "🚀 Physics propulsion systems, ⛽ Fuel combustion thrust, 🧮 Calculations trajectory paths, 🎯 Precision landing required", "astronomy"),
-        ("International cooperation", "🌍 Countries work together, 🤝 Shared space missions, 💰 Costs split multiple, 🕊️ Peace through exploration", "astronomy"),
-        ("Astrobiology", "🧬 Life beyond Earth, 🦠 Microbes extreme environments, 💧 Water essential ingredient, 🔬 Laboratory experiments simulate", "astronomy"),
-        ("Space colonization", "🏠 Mars settlement plans, 🌱 Growing food space, 🏭 Manufacturing in orbit, 👶 Future generations born", "astronomy"),
-        ("Cosmic phenomena", "💥 Supernovas explode violently, 🌀 Pulsars spin rapidly, ⚫ Neutron stars dense, 🌈 Nebulas colorful clouds", "astronomy"),
-        ("Space junk", "🗑️ Orbital debris dangerous, 🛰️ Old satellites floating, 🧹 Cleanup missions needed, ⚠️ Collision risks high", "astronomy"),
-        ("Deep space exploration", "🚀 Voyager probes distant, 📡 Communication delays long, 🔋 Power systems failing, 📊 Data still transmitting", "astronomy"),
-        ("Planetarium visit", "🌟 Dome ceiling projection, 👥 Educational programs offered, 🎫 Tickets advance purchase, 📚 Learning astronomy basics", "astronomy"),
-        ("Amateur astronomy", "🔭 Backyard telescope setup, 📱 Star chart apps, 👥 Astronomy club meetings, 📸 Astrophotography hobby growing", "astronomy"),
-        ("Space tourism", "🚀 Commercial flights beginning, 💰 Expensive tickets currently, 👩‍🚀 Training required first, 🌍 View Earth orbit", "astronomy"),
-        ("Satellite technology", "📡 Communication relay stations, 🗺️ GPS navigation systems, 🌦️ Weather monitoring constantly, 📺 Television broadcasting globally", "astronomy"),
-        ("Solar eclipses", "🌑 Moon blocks sun, 👓 Special glasses required, ⏰ Brief totality period, 📸 Photography challenging but", "astronomy"),
-        ("Space elevator", "🏗️ Theoretical construction project, 🚇 Cable reaches orbit, 💰 Cheaper space access, 🔬 Engineering challenges enormous", "astronomy"),
-        ("Asteroid mining", "⛏️ Space resources extraction, 💎 Precious metals abundant, 🚀 Robotic mining missions, 💰 Economic potential huge", "astronomy"),
-        ("Gravitational waves", "🌊 Space time ripples, 🔬 LIGO detectors sensitive, ⚫ Black holes colliding, 🏆 Nobel prize discovery", "astronomy"),
-        ("Mars terraforming", "🔴 Red planet transformation, 🌱 Atmosphere modification needed, 💧 Water ice melting, 🏠 Human settlements possible", "astronomy"),
-        ("Cosmic microwave background", "📡 Universe baby picture, 💥 Big bang afterglow, 🌡️ Temperature variations tiny, 🔬 Cosmology research foundation", "astronomy")
-    ]
-    
-    for input_text, output_text, category in scenarios:
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"In space, I see {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": "AAC Astronomy Space",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category,
-                    "emotion_level": "high",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-def create_marine_ocean():
-    """Marine and ocean life examples"""
-    examples = []
-    
-    scenarios = [
-        ("Ocean exploration", "🌊 Deep sea mysterious, 🐙 Octopus intelligence amazing, 🐋 Whales migrate far, 🔬 Scientists discover new", "marine"),
-        ("Coral reefs", "🪸 Colorful living structures, 🐠 Fish communities thrive, 🌡️ Temperature changes threaten, 🤿 Snorkeling reveals beauty", "marine"),
-        ("Marine conservation", "🐢 Sea turtles endangered, 🚫 Plastic pollution harmful, 🛡️ Protected areas needed, 🤝 Everyone helps ocean", "marine"),
-        ("Tide pools", "🌊 Low tide reveals, 🦀 Crabs scurry quickly, ⭐ Sea stars cling, 🐚 Shells wash ashore", "marine"),
-        ("Deep sea creatures", "🐙 Bioluminescent organisms glow, 🦑 Giant squid mysterious, 🐟 Anglerfish lure prey, 🌑 Darkness eternal depth", "marine"),
-        ("Ocean currents", "🌊 Water moves constantly, 🌡️ Temperature drives flow, 🐋 Marine life follows, ⛵ Ships use assistance", "marine"),
-        ("Fishing industry", "🎣 Commercial boats harvest, 🐟 Fish populations declining, 📋 Regulations protect species, 🤝 Sustainable practices important", "marine"),
-        ("Aquarium visit", "🐠 Marine life display, 👶 Children learn ocean, 🔬 Research happens here, 🎫 Educational programs offered", "marine"),
-        ("Beach cleanup", "🗑️ Trash harms wildlife, 🤝 Volunteers collect debris, ♻️ Recycling plastic important, 🌊 Clean ocean healthier", "marine"),
-        ("Surfing waves", "🏄 Riding ocean energy, 🌊 Waves created wind, ⚖️ Balance skill required, 🏖️ Beach culture lifestyle", "marine"),
-        ("Marine biology", "🔬 Study ocean life, 🐋 Whale behavior research, 📊 Data collection diving, 🎓 Career studying sea", "marine"),
-        ("Underwater photography", "📸 Capture sea beauty, 💧 Waterproof equipment needed, 🐠 Fish portraits challenging, 🎨 Art meets science", "marine"),
-        ("Shipwrecks", "⚓ Sunken vessels history, 🐠 Artificial reefs formed, 🤿 Diving exploration dangerous, 🏺 Treasures sometimes found", "marine"),
-        ("Lighthouse", "💡 Ships navigation safety, 🌊 Rocky coastline warning, ⚓ Harbor entrance marking, 🏠 Keeper traditional job", "marine"),
-        ("Sea ice", "🧊 Polar regions frozen, 🐧 Penguins need ice, 🌡️ Climate change melting, 🐻‍❄️ Polar bears hunting", "marine"),
-        ("Submarine", "🚢 Underwater vessel travels, 💨 Ballast tanks control, 🔬 Ocean research platform, ⚓ Military defense system", "marine"),
-        ("Plankton", "🦠 Microscopic life forms, 🐋 Whales filter feed, 💨 Oxygen production important, 🔬 Food chain foundation", "marine"),
-        ("Sea level rise", "🌊 Ocean expanding higher, 🏝️ Islands disappearing slowly, 🏠 Coastal flooding increases, 🌡️ Ice melting cause", "marine"),
-        ("Marine sanctuary", "🛡️ Protected ocean areas, 🐋 Wildlife refuge safe, 🚫 Fishing restricted zones, 🔬 Research stations established", "marine"),
-        ("Seaweed farming", "🌱 Underwater agriculture growing, 🍃 Kelp forests important, 🍽️ Food source sustainable, 💨 Carbon absorption natural", "marine"),
-        ("Pearl diving", "🦪 Oysters create gems, 🤿 Traditional diving methods, 💎 Natural pearls rare, 🏺 Cultural pearl history", "marine"),
-        ("Ocean acidification", "🧪 pH levels changing, 🪸 Coral bleaching increases, 🐚 Shell formation harder, 🔬 Scientists monitor changes", "marine"),
-        ("Tsunami warning", "🌊 Earthquake triggers waves, 📡 Detection systems alert, 🏃 Evacuation routes planned, 🏔️ High ground safety", "marine"),
-        ("Marine archaeology", "🏺 Underwater historical sites, 🤿 Diving excavation work, 📜 Ancient civilizations submerged, 🔬 Preservation techniques specialized", "marine"),
-        ("Dolphin communication", "🐬 Clicks whistles language, 🧠 Intelligence studies reveal, 🤝 Human dolphin interaction, 🔬 Research behavior patterns", "marine")
-    ]
-    
-    for input_text, output_text, category in scenarios:
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"In the ocean, I discover {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": "AAC Marine Ocean",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category,
-                    "emotion_level": "medium",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-def create_geology_earth():
-    """Geology and earth sciences examples"""
-    examples = []
-    
-    scenarios = [
-        ("Rock formation", "⛰️ Mountains rise slowly, 🌋 Volcanic activity creates, 🏔️ Erosion shapes landscapes, ⏰ Millions years process", "geology"),
-        ("Fossil discovery", "🦕 Ancient life preserved, 🔨 Paleontologists dig carefully, 📚 History earth revealed, 🏺 Museums display finds", "geology"),
-        ("Earthquake science", "🌍 Tectonic plates moving, 📊 Seismographs measure shaking, 🏠 Building codes important, 📡 Early warning systems", "geology"),
-        ("Mineral identification", "💎 Crystals form underground, 🔍 Microscope examination needed, 📊 Chemical composition analysis, ⛏️ Mining extraction processes", "geology"),
-        ("Sedimentary layers", "📚 Earth's history books, 🏔️ Grand Canyon reveals, ⏰ Time periods visible, 🔬 Geologists read stories", "geology"),
-        ("Volcanic eruption", "🌋 Magma reaches surface, 🔥 Lava flows destroy, 💨 Ash clouds dangerous, 🏃 Evacuation necessary sometimes", "geology"),
-        ("Cave exploration", "🕳️ Underground chambers hidden, 💧 Water carved slowly, 🔦 Headlamps required always, 🦇 Bats live here", "geology"),
-        ("Glacial movement", "🧊 Ice rivers flow, 🏔️ Valleys carved deep, 🌡️ Climate change melting, 💧 Sea level affected", "geology"),
-        ("Soil composition", "🌱 Plants need nutrients, 🪱 Earthworms help mix, 🧪 Chemical testing important, 👨‍🌾 Farmers monitor quality", "geology"),
-        ("Diamond formation", "💎 Carbon under pressure, 🌋 Volcanic pipes transport, ⏰ Billion years creation, ⛏️ Mining dangerous work", "geology"),
-        ("Plate tectonics", "🌍 Earth's crust moving, 🗺️ Continents drift apart, 🌊 Ocean floors spreading, 🏔️ Mountain building process", "geology"),
-        ("Landslide hazards", "⛰️ Unstable slopes dangerous, 🌧️ Heavy rain triggers, 🏠 Houses risk damage, 🚧 Warning signs posted", "geology"),
-        ("Groundwater", "💧 Underground water sources, 🚰 Wells tap aquifers, 🌧️ Rain slowly recharges, 🏭 Pollution threatens supply", "geology"),
-        ("Gemstone hunting", "💎 Precious stones found, 🔍 Careful searching required, 🏞️ Public collecting areas, 💰 Value depends rarity", "geology"),
-        ("Geological survey", "🗺️ Mapping rock formations, 📊 Resource exploration important, 🔬 Laboratory analysis needed, 📋 Reports government agencies", "geology"),
-        ("Meteorite impact", "☄️ Space rocks hit, 🕳️ Craters mark impacts, 🔬 Scientists study composition, 🏺 Museums display specimens", "geology"),
-        ("Oil geology", "⛽ Petroleum formed ancient, 🔍 Exploration techniques advanced, 🏭 Drilling operations complex, 💰 Economic importance huge", "geology"),
-        ("Coal formation", "🌿 Ancient plants compressed, ⏰ Millions years heat, ⛏️ Mining operations dangerous, 🔥 Fuel source diminishing", "geology"),
-        ("Weathering processes", "🌧️ Rain dissolves rocks, ❄️ Freeze thaw cycles, 🌪️ Wind erosion constant, ⏰ Slow landscape changes", "geology"),
-        ("Geological time", "⏰ Earth 4.6 billion, 🦕 Dinosaurs recent relatively, 👤 Humans tiny blip, 📚 Textbooks teach scale", "geology"),
-        ("Geothermal energy", "🌋 Earth's heat utilized, ♨️ Hot springs natural, 💡 Electricity generation clean, 🏠 Home heating efficient", "geology"),
-        ("Rock climbing", "🧗 Geological formations vertical, 🪨 Rock quality important, 🧗‍♀️ Safety equipment essential, 🏔️ Mountain climbing adventure", "geology"),
-        ("Sand dunes", "🏜️ Wind deposits particles, 🌪️ Dunes migrate slowly, 🐪 Desert life adapted, 💧 Water scarce resource", "geology"),
-        ("Coastal erosion", "🌊 Waves wear cliffs, 🏠 Houses risk collapse, 🪨 Seawalls protection built, 🌡️ Sea level rising", "geology"),
-        ("Geological mapping", "🗺️ Survey teams measure, 📐 Instruments precise readings, 💻 Computer modeling used, 📊 Data analysis reveals", "geology")
-    ]
-    
-    for input_text, output_text, category in scenarios:
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"In geology, I study {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": "AAC Geology Earth Sciences",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category,
-                    "emotion_level": "medium",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-def create_mathematics_statistics():
-    """Mathematics and statistics examples"""
-    examples = []
-    
-    scenarios = [
-        ("Learning algebra", "🔢 Variables represent unknowns, ➕ Equations balance both, 🎯 Solve for x, 📚 Practice problems daily", "mathematics"),
-        ("Geometry shapes", "📐 Triangle three angles, ⚪ Circle perfect round, 📏 Measure perimeter carefully, 📊 Area calculations important", "mathematics"),
-        ("Statistics analysis", "📊 Data tells stories, 📈 Trends show patterns, 🎯 Average typical value, 📋 Survey results meaningful", "mathematics"),
-        ("Probability theory", "🎲 Chance governs outcomes, 🃏 Cards random draw, 📊 Percentages express likelihood, 🎯 Predictions based math", "mathematics"),
-        ("Calculus concepts", "📈 Rate of change, 🌊 Curves smooth continuous, 📐 Derivatives show slope, 📊 Integration finds area", "mathematics"),
-        ("Number theory", "🔢 Prime numbers special, 🧮 Divisibility rules helpful, ♾️ Infinity concept mind, 🎯 Patterns numbers everywhere", "mathematics"),
-        ("Mathematical proof", "✅ Logic chains reasoning, 📚 Theorems proven true, 🧠 Thinking step step, 🎯 Conclusions follow premises", "mathematics"),
-        ("Applied mathematics", "🏗️ Engineering uses math, 💰 Finance calculations important, 🔬 Science needs equations, 💻 Computers process numbers", "mathematics"),
-        ("Math homework", "📚 Practice problems assigned, ⏰ Due date tomorrow, 🤝 Study group helpful, 💡 Understanding concepts key", "mathematics"),
-        ("Calculator use", "🧮 Tool makes easier, 📱 Phone apps available, ✏️ Still show work, 🧠 Mental math important", "mathematics"),
-        ("Word problems", "📖 Stories hide math, 🔍 Find important numbers, 🎯 Choose right operation, ✅ Check answer reasonable", "mathematics"),
-        ("Math competition", "🏆 Problem solving contest, ⏱️ Time pressure intense, 🧠 Quick thinking required, 🥇 Awards top performers", "mathematics"),
-        ("Graphing functions", "📈 Plot points carefully, 📊 Patterns become visible, 💻 Software helps visualization, 🎯 Equations create pictures", "mathematics"),
-        ("Measurement units", "📏 Metric system logical, 📐 Conversion factors needed, ⚖️ Precision matters science, 📊 Error margins acceptable", "mathematics"),
-        ("Mathematical modeling", "🔬 Real world simplified, 📊 Equations describe behavior, 🎯 Predictions made possible, 💻 Computers run simulations", "mathematics"),
-        ("Fraction operations", "🍕 Pizza slice analogy, ➕ Adding requires denominators, ✖️ Multiply across top, 📚 Common denominators first", "mathematics"),
-        ("Percentage calculations", "💯 Out of hundred, 💰 Discounts shopping deals, 📊 Data comparison tool, 🎯 Proportions made clear", "mathematics"),
-        ("Negative numbers", "❄️ Below zero temperature, 💳 Bank account overdrawn, 📊 Number line extends, ➖ Subtraction creates negatives", "mathematics"),
-        ("Exponents powers", "2️⃣ Square means twice, 3️⃣ Cube three dimensions, 📈 Growth exponential fast, 💻 Scientific notation useful", "mathematics"),
-        ("Mathematical patterns", "🔢 Fibonacci sequence nature, 🌀 Golden ratio beautiful, 📊 Sequences follow rules, 🎯 Predict next terms", "mathematics"),
-        ("Data visualization", "📊 Charts show information, 📈 Graphs reveal trends, 🎨 Colors code categories, 👁️ Pictures worth numbers", "mathematics"),
-        ("Survey design", "❓ Questions carefully worded, 👥 Sample represents population, 📋 Bias avoided important, 📊 Results statistically valid", "mathematics"),
-        ("Random sampling", "🎲 Every person chance, 📊 Reduces bias errors, 🎯 Representative results expected, 📋 Survey methodology critical", "mathematics"),
-        ("Correlation analysis", "📊 Variables relationship measured, 📈 Positive correlation rises, 📉 Negative correlation falls, ⚠️ Causation different thing", "mathematics"),
-        ("Standard deviation", "📊 Spread measures variability, 📈 Normal distribution curve, 🎯 Most data center, 📋 Outliers far away", "mathematics"),
-        ("Regression analysis", "📈 Line best fit, 🎯 Predict future values, 📊 Relationship strength measured, 💻 Computer calculates automatically", "mathematics"),
-        ("Hypothesis testing", "❓ Question scientific method, 📊 Data supports rejects, 🎯 Significance level chosen, ✅ Conclusions drawn carefully", "mathematics"),
-        ("Confidence intervals", "📊 Range likely values, 🎯 Precision estimate uncertainty, 📋 Sample size affects, 💯 Confidence level chosen", "mathematics"),
-        ("Chi-square test", "📊 Categories compared expected, 🎯 Independence variables tested, 📋 Degrees freedom calculated, ✅ Statistical significance determined", "mathematics"),
-        ("Time series", "📈 Data over time, 📊 Trends seasonal patterns, 🔮 Forecasting future values, 📋 Business planning uses", "mathematics")
-    ]
-    
-    for input_text, output_text, category in scenarios:
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"In math, I calculate {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": "AAC Mathematics Statistics",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category,
-                    "emotion_level": "medium",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-# Continue with remaining specialized topics...
-
-def create_architecture_design():
-    """Architecture and design examples"""
-    examples = []
-    
-    scenarios = [
-        ("Building design", "🏗️ Structure needs foundation, 🎨 Form follows function, 📐 Blueprints guide construction, 👷 Engineers ensure safety", "architecture"),
-        ("Interior design", "🏠 Spaces feel welcoming, 🎨 Colors affect mood, 💡 Lighting creates atmosphere, 🪑 Furniture functional beautiful", "architecture"),
-        ("Sustainable architecture", "🌱 Green building practices, ☀️ Solar panels energy, 💧 Water conservation systems, ♻️ Recycled materials used", "architecture"),
-        ("Historic preservation", "🏛️ Old buildings valuable, 🛠️ Restoration requires skill, 📚 History preserved future, 💰 Heritage tourism benefits", "architecture"),
-        ("Urban planning", "🏙️ Cities need organization, 🚗 Traffic flow important, 🌳 Green spaces essential, 👥 Community needs considered", "architecture"),
-        ("Skyscraper construction", "🏢 Height requires engineering, 💨 Wind loads calculated, 🏗️ Steel frame structure, 🛗 Elevators transport people", "architecture"),
-        ("Landscape architecture", "🌳 Outdoor spaces designed, 🌺 Plants chosen climate, 💧 Irrigation systems needed, 🚶 Pathways connect areas", "architecture"),
-        ("Architectural styles", "🏛️ Classical columns proportions, 🏰 Gothic pointed arches, 🏠 Modern clean lines, 🎨 Postmodern eclectic mix", "architecture"),
-        ("CAD software", "💻 Computer aided design, 📐 Precise measurements digital, 🖼️ 3D visualization helpful, 📊 Changes made easily", "architecture"),
-        ("Building codes", "📋 Safety regulations required, 🚪 Exit routes planned, 🔥 Fire resistance materials, ♿ Accessibility compliance mandatory", "architecture"),
-        ("Construction materials", "🧱 Brick traditional choice, 🪨 Concrete strong durable, 🌲 Wood renewable resource, 🔩 Steel modern construction", "architecture"),
-        ("Zoning laws", "🏠 Residential areas quiet, 🏭 Industrial zones separated, 🛒 Commercial districts busy, 📋 Permits required building", "architecture"),
-        ("Architectural education", "🎓 Five year program, 📚 Design studio intensive, 🏗️ Internship experience required, 📜 License practice needed", "architecture"),
-        ("Client meetings", "👥 Understand needs wants, 💰 Budget discussions important, ⏰ Timeline realistic expectations, 📋 Contracts protect both", "architecture"),
-        ("Site analysis", "🗺️ Topography affects design, 🌞 Sun path important, 💨 Wind patterns considered, 🌊 Drainage water management", "architecture"),
-        ("Model making", "🏠 Scale models helpful, 📏 Proportions accurately represented, 🎨 Materials simulate real, 👁️ Clients visualize better", "architecture"),
-        ("Renovation projects", "🔨 Existing structure challenges, 🏠 Modern needs old, 💰 Budget often exceeds, 😮 Surprises walls hidden", "architecture"),
-        ("Green roof", "🌱 Plants building top, 💧 Stormwater management improved, 🌡️ Insulation benefits significant, 🐝 Wildlife habitat created", "architecture"),
-        ("Accessibility design", "♿ Ramps replace steps, 🚪 Doors wide enough, 💡 Visual contrast important, 🤲 Universal design benefits", "architecture"),
-        ("Lighting design", "💡 Natural light preferred, 🌅 Daylight changes hourly, 💡 Artificial lighting supplements, 🎭 Mood lighting effects", "architecture"),
-        ("Acoustic design", "🔊 Sound control important, 🎵 Concert halls specialized, 🤫 Libraries need quiet, 📢 Open offices challenging", "architecture"),
-        ("Structural engineering", "🏗️ Loads calculated precisely, 📐 Beams sized properly, 🌪️ Wind earthquake forces, 👷 Safety factor required", "architecture"),
-        ("Construction management", "📅 Schedule coordinated carefully, 👷 Workers supervised daily, 💰 Costs monitored closely, 📋 Quality control inspections", "architecture"),
-        ("Architectural photography", "📸 Buildings documented professionally, 🌅 Golden hour lighting, 📐 Angles show design, 🎨 Composition artistic important", "architecture"),
-        ("Design competition", "🏆 Architects submit proposals, 👥 Jury evaluates entries, 💡 Innovation creativity valued, 🏗️ Winner builds project", "architecture")
-    ]
-    
-    for input_text, output_text, category in scenarios:
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"In design, I create {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": "AAC Architecture Design",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category,
-                    "emotion_level": "medium",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-# I'll continue efficiently with the remaining categories...
-
-def create_anthropology_archaeology():
-    """Anthropology and archaeology examples"""
-    examples = []
-    scenarios = [
-        ("Ancient civilizations", "🏺 Pottery reveals culture, 🏛️ Temples show beliefs, 📜 Writing systems evolve, ⏰ Time layers history", "anthropology"),
-        ("Cultural differences", "🌍 Societies vary greatly, 🍽️ Food traditions unique, 👥 Family structures different, 🎭 Rituals mark passages", "anthropology"),
-        ("Archaeological dig", "🔍 Careful excavation required, 📏 Measurements precise important, 📸 Documentation every layer, 🧹 Brushes delicate tools", "anthropology"),
-        ("Human evolution", "🦴 Fossils tell story, 🧬 DNA reveals connections, 🚶 Bipedalism major change, 🧠 Brain size increased", "anthropology"),
-        ("Language development", "🗣️ Communication evolved gradually, 📚 Writing recent invention, 🌍 Languages spread migrate, 👶 Children learn naturally", "anthropology"),
-    ]
-    
-    # Generate additional examples efficiently for remaining categories
-    for i in range(20):
-        topics = ['burial customs', 'tool making', 'art history', 'migration patterns', 'social organization']
-        topic = random.choice(topics)
-        input_text = f"Studying {topic}"
-        output_text = f"🔍 Research {topic} carefully, 📚 Evidence reveals patterns, 🧠 Understanding human behavior, ⏰ Time perspective important"
-        scenarios.append((input_text, output_text, "anthropology"))
-    
-    for input_text, output_text, category in scenarios:
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"In anthropology, I study {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": "AAC Anthropology Archaeology",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category,
-                    "emotion_level": "medium",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-# Continue efficiently with remaining specialized categories...
-
-def create_psychology_cognitive():
-    examples = []
-    scenarios = [
-        ("Understanding behavior", "🧠 Mind complex system, 💭 Thoughts influence actions, 😊 Emotions drive decisions, 🔄 Learning changes brain", "psychology"),
-        ("Therapy session", "💬 Talking helps healing, 🤝 Trust therapist important, 💡 Insights develop gradually, 🌱 Growth takes time", "psychology"),
-        ("Memory research", "🧠 How brain stores, 📚 Different memory types, 😴 Sleep consolidates information, 🔄 Practice strengthens recall", "psychology"),
-        ("Child development", "👶 Stages predictable patterns, 🎮 Play important learning, 👥 Social skills develop, 📚 Language emerges naturally", "psychology"),
-        ("Cognitive biases", "🧠 Mind takes shortcuts, 🔍 Confirmation bias common, 📊 Statistics often misunderstood, 💡 Awareness helps thinking", "psychology"),
-    ]
-    
-    for i in range(25):
-        topics = ['personality', 'learning', 'perception', 'motivation', 'consciousness', 'stress', 'decision making']
-        topic = random.choice(topics)
-        input_text = f"Psychology of {topic}"
-        output_text = f"🧠 {topic.title()} research reveals, 📊 Studies show patterns, 💡 Understanding improves life, 🔬 Science guides practice"
-        scenarios.append((input_text, output_text, "psychology"))
-    
-    for input_text, output_text, category in scenarios:
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"Psychologically, I understand {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": "AAC Psychology Cognitive",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category,
-                    "emotion_level": "medium",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-# I'll create efficient templates for the remaining 30+ categories...
-
-def create_generic_category(category_name, topic_list, example_count=20):
-    """Generic function to create specialized category examples efficiently"""
-    examples = []
-    
-    # Create a few specific examples
-    specific_scenarios = {
-        "linguistics": [
-            ("Language structure", "📚 Grammar rules organize, 🗣️ Phonetics sound systems, 💭 Semantics meaning study, 🌍 Languages evolve constantly", "linguistics"),
-            ("Translation work", "🌍 Bridge language barriers, 📖 Context matters greatly, 🎯 Accuracy essential always, 🤝 Cultural understanding needed", "linguistics"),
-        ],
-        "agriculture": [
-            ("Crop rotation", "🌾 Different plants yearly, 🌱 Soil nutrients restored, 🐛 Pest cycles broken, 📈 Yields improve naturally", "agriculture"),
-            ("Sustainable farming", "🌱 Organic methods preferred, 💧 Water conservation important, 🐝 Pollinators need protection, 🌍 Environment benefits everyone", "agriculture"),
-        ],
-        "manufacturing": [
-            ("Production line", "🏭 Assembly steps organized, ⚡ Efficiency maximized daily, 👷 Workers trained properly, 📊 Quality control essential", "manufacturing"),
-            ("Supply chain", "📦 Materials delivered timely, 🚚 Transportation costs managed, 📋 Inventory levels optimized, 🤝 Suppliers reliable partners", "manufacturing"),
-        ]
-    }
-    
-    # Add specific scenarios if available
-    if category_name in specific_scenarios:
-        for input_text, output_text, category in specific_scenarios[category_name]:
-            tiles = parse_output_to_tiles(output_text)
-            spoken = f"In {category_name}, I work with {tiles[0]['words'].lower()}."
-            
-            example = {
-                "instruction": f"AAC {category_name.title()}",
-                "input": input_text,
-                "aac_response": {
-                    "tiles": tiles,
-                    "spoken_sentence": spoken,
-                    "usage_data": {
-                        "category": category_name,
-                        "emotion_level": "medium",
-                        "complexity": len(tiles),
-                        "frequency_weight": 1.0
-                    }
-                },
-                "raw_output": output_text
-            }
-            examples.append(example)
-    
-    # Generate remaining examples
-    remaining = example_count - len(examples)
-    for i in range(remaining):
-        if topic_list:
-            topic = random.choice(topic_list)
-            input_text = f"{category_name.title()} topic: {topic}"
-            output_text = f"🔧 {topic.title()} work involves, 📊 Professional skills needed, 💡 Knowledge constantly growing, 🎯 Excellence pursuit always"
-        else:
-            input_text = f"{category_name.title()} professional work {i+1}"
-            output_text = f"💼 Professional {category_name} work, 🎯 Expertise developed over, 📚 Continuous learning required, 🤝 Collaboration essential success"
-        
-        tiles = parse_output_to_tiles(output_text)
-        spoken = f"In {category_name}, I {tiles[0]['words'].lower()}."
-        
-        example = {
-            "instruction": f"AAC {category_name.title()}",
-            "input": input_text,
-            "aac_response": {
-                "tiles": tiles,
-                "spoken_sentence": spoken,
-                "usage_data": {
-                    "category": category_name,
-                    "emotion_level": "medium",
-                    "complexity": len(tiles),
-                    "frequency_weight": 1.0
-                }
-            },
-            "raw_output": output_text
-        }
-        examples.append(example)
-    
-    return examples
-
-# Create all remaining categories efficiently
-def create_linguistics_language():
-    return create_generic_category("linguistics", ["grammar", "phonetics", "semantics", "syntax", "translation"], 25)
-
-def create_agriculture_farming():
-    return create_generic_category("agriculture", ["crops", "livestock", "irrigation", "fertilizer", "harvesting"], 25)
-
-def create_manufacturing_industry():
-    return create_generic_category("manufacturing", ["production", "assembly", "quality control", "automation", "logistics"], 25)
-
-def create_logistics_supply():
-    return create_generic_category("logistics", ["shipping", "warehousing", "inventory", "distribution", "tracking"], 20)
-
-def create_insurance_risk():
-    return create_generic_category("insurance", ["policies", "claims", "underwriting", "risk assessment", "actuarial"], 20)
-
-def create_realestate_property():
-    return create_generic_category("realestate", ["buying", "selling", "appraisal", "mortgages", "development"], 25)
-
-def create_energy_utilities():
-    return create_generic_category("energy", ["electricity", "natural gas", "renewable", "grid", "conservation"], 25)
-
-def create_mining_extraction():
-    return create_generic_category("mining", ["excavation", "minerals", "safety", "environmental", "processing"], 20)
-
-def create_textiles_fashion():
-    return create_generic_category("textiles", ["fabric", "design", "manufacturing", "trends", "retail"], 20)
-
-def create_foodservice_hospitality():
-    return create_generic_category("foodservice", ["cooking", "service", "management", "hygiene", "customer"], 25)
-
-def create_automotive_mechanics():
-    return create_generic_category("automotive", ["repair", "maintenance", "diagnostics", "parts", "safety"], 25)
-
-def create_aviation_aerospace():
-    return create_generic_category("aviation", ["aircraft", "navigation", "safety", "maintenance", "flight"], 25)
-
-def create_maritime_shipping():
-    return create_generic_category("maritime", ["ships", "navigation", "cargo", "ports", "safety"], 20)
-
-def create_railway_trains():
-    return create_generic_category("railway", ["trains", "tracks", "signals", "maintenance", "operations"], 20)
-
-def create_telecommunications():
-    return create_generic_category("telecommunications", ["networks", "signals", "infrastructure", "wireless", "fiber"], 20)
-
-def create_broadcasting_media():
-    return create_generic_category("broadcasting", ["television", "radio", "production", "transmission", "content"], 20)
-
-def create_publishing_literature():
-    return create_generic_category("publishing", ["books", "editing", "printing", "distribution", "authors"], 20)
-
-def create_museums_cultural():
-    return create_generic_category("museums", ["exhibits", "collections", "education", "preservation", "visitors"], 20)
-
-def create_libraries_information():
-    return create_generic_category("libraries", ["books", "research", "cataloging", "digital", "services"], 20)
-
-def create_zoos_wildlife():
-    return create_generic_category("zoos", ["animals", "conservation", "education", "breeding", "habitats"], 20)
-
-def create_parks_recreation():
-    return create_generic_category("parks", ["maintenance", "programs", "facilities", "nature", "visitors"], 20)
-
-def create_waste_recycling():
-    return create_generic_category("waste", ["collection", "sorting", "recycling", "disposal", "environmental"], 18)
-
-def create_security_surveillance():
-    return create_generic_category("security", ["monitoring", "protection", "access", "systems", "response"], 20)
-
-def create_forensics_investigation():
-    return create_generic_category("forensics", ["evidence", "analysis", "crime scene", "laboratory", "testimony"], 20)
-
-def create_meteorology_weather():
-    return create_generic_category("meteorology", ["forecasting", "measurements", "patterns", "climate", "satellites"], 18)
-
-def create_seismology_earthquake():
-    return create_generic_category("seismology", ["earthquakes", "monitoring", "prediction", "waves", "instruments"], 15)
-
-def create_volcanology_hazards():
-    return create_generic_category("volcanology", ["eruptions", "lava", "monitoring", "hazards", "research"], 15)
-
-def create_robotics_automation():
-    return create_generic_category("robotics", ["programming", "sensors", "automation", "AI", "manufacturing"], 25)
-
-def create_ai_machine_learning():
-    return create_generic_category("ai", ["algorithms", "data", "neural networks", "training", "applications"], 25)
-
-def create_cybersecurity_digital():
-    return create_generic_category("cybersecurity", ["threats", "protection", "encryption", "networks", "forensics"], 25)
-
-def create_quantum_computing():
-    return create_generic_category("quantum", ["qubits", "superposition", "algorithms", "research", "applications"], 20)
-
-def create_biotechnology_genetic():
-    return create_generic_category("biotechnology", ["genes", "DNA", "research", "medicine", "engineering"], 25)
-
-def create_nanotechnology_materials():
-    return create_generic_category("nanotechnology", ["particles", "materials", "applications", "research", "manufacturing"], 20)
-
-def parse_output_to_tiles(output_text):
-    """Parse output into tile format"""
-    tiles = []
-    parts = output_text.split(', ')
-    
-    for i, part in enumerate(parts[:4]):
-        part = part.strip()
-        if not part:
-            continue
-            
-        emoji = ""
-        words = part
-        
-        for char in part:
-            if ord(char) > 127:
-                emoji = char
-                words = part.replace(char, '').strip()
-                break
-        
-        if not emoji:
-            emoji = "💬"
-        
-        tiles.append({
-            "emoji": emoji,
-            "words": words,
-            "tile_id": f"tile_{i+1}"
-        })
-    
-    return tiles
-
 if __name__ == "__main__":
     total = add_all_remaining_topics()
     print(f"\n🎯 ALL REMAINING TOPICS: {total:,} examples added!")
-    print(f"🏆 ABSOLUTE COMPLETE COVERAGE ACHIEVED!")
\ No newline at end of file
+    print(f"🏆 ABSOLUTE COMPLETE COVERAGE ACHIEVED!")
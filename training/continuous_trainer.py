@@ -4,18 +4,27 @@ Continuous TinkyBink AAC Model Training System
 Keeps improving the model with new techniques and data
 """
 import json
+import argparse
 import os
-import subprocess
 import time
 from typing import Dict, List
 from collections import defaultdict
 import random
+import text_features
+from eval_runner import EvalRunner, HTTPBackend
+from model_backend import HTTPModelBackend, make_model_backend
+from model_registry import OFFLINE_REGISTRY_FILE, REGISTRY_FILE, ModelRegistry
+from param_sweep import load_best_params
+from response_scoring import basic_score, response_metrics
 
 class ContinuousTrainer:
-    def __init__(self):
+    def __init__(self, models=None, eval_runner=None, registry_path: str = REGISTRY_FILE):
         self.training_iterations = 0
         self.model_versions = []
         self.performance_metrics = {}
+        self.models = models or make_model_backend()
+        self.registry = ModelRegistry(self.models, registry_path)
+        self.eval_runner = eval_runner or EvalRunner()
         
     def generate_advanced_conversational_data(self) -> List[Dict]:
         """Generate advanced conversational training data"""
@@ -281,39 +290,11 @@ class ContinuousTrainer:
     
     def detect_emotional_context(self, text: str) -> str:
         """Detect emotional context in text"""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ['pain', 'hurt', 'sick', 'problem']):
-            return 'distress'
-        elif any(word in text_lower for word in ['happy', 'good', 'great', 'wonderful']):
-            return 'positive'
-        elif any(word in text_lower for word in ['sad', 'upset', 'frustrated', 'angry']):
-            return 'negative'
-        elif any(word in text_lower for word in ['tired', 'sleepy', 'rest', 'exhausted']):
-            return 'fatigue'
-        elif any(word in text_lower for word in ['nervous', 'worried', 'scared', 'anxious']):
-            return 'anxiety'
-        else:
-            return 'neutral'
+        return text_features.detect_emotional_context(text)
     
     def extract_context_clues(self, text: str) -> List[str]:
         """Extract context clues from text"""
-        clues = []
-        text_lower = text.lower()
-        
-        # Time clues
-        time_words = ['morning', 'evening', 'night', 'bedtime', 'lunch', 'dinner', 'late', 'early']
-        clues.extend([word for word in time_words if word in text_lower])
-        
-        # Location clues
-        location_words = ['doctor', 'office', 'store', 'park', 'home', 'car', 'school', 'hospital']
-        clues.extend([word for word in location_words if word in text_lower])
-        
-        # Weather clues
-        weather_words = ['rain', 'sunny', 'hot', 'cold', 'snow', 'weather']
-        clues.extend([word for word in weather_words if word in text_lower])
-        
-        return clues
+        return text_features.extract_context_clues(text)
     
     def create_incremental_training_dataset(self, iteration: int) -> str:
         """Create an incremental training dataset"""
@@ -356,16 +337,25 @@ class ContinuousTrainer:
         print(f"\n🚀 Training Model Version {iteration}")
         print("=" * 40)
         
+        # Sampling parameters: the last sweep's winner, else drift per iteration
+        params = load_best_params('tinkybink') or {
+            'temperature': 0.6 + iteration * 0.01,
+            'top_p': 0.85 + iteration * 0.005,
+            'repeat_penalty': 1.1 + iteration * 0.01,
+            'top_k': 40 + iteration * 2,
+            'num_predict': 35 + iteration * 2,
+        }
+        
         # Create advanced Modelfile
         modelfile_content = f"""# TinkyBink Continuous Learning Model v{iteration}
 FROM tinyllama
 
 # Advanced parameters for iteration {iteration}
-PARAMETER temperature {0.6 + iteration * 0.01}
-PARAMETER top_p {0.85 + iteration * 0.005}
-PARAMETER repeat_penalty {1.1 + iteration * 0.01}
-PARAMETER top_k {40 + iteration * 2}
-PARAMETER num_predict {35 + iteration * 2}
+PARAMETER temperature {params['temperature']}
+PARAMETER top_p {params['top_p']}
+PARAMETER repeat_penalty {params['repeat_penalty']}
+PARAMETER top_k {params['top_k']}
+PARAMETER num_predict {params['num_predict']}
 
 # Evolved system prompt
 SYSTEM \"\"\"You are TinkyBink v{iteration}, an evolving AAC assistant with advanced capabilities:
@@ -401,19 +391,15 @@ Output: \"\"\"
         # Train the model
         model_name = f'tinkybink_v{iteration}'
         
-        # Remove previous version if exists
-        subprocess.run(['ollama', 'rm', model_name], capture_output=True)
+        # Build only if the Modelfile or dataset changed
+        ok, error = self.registry.ensure(model_name, modelfile_path, [dataset_file])
         
-        # Create new model
-        result = subprocess.run(['ollama', 'create', model_name, '-f', modelfile_path], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        if ok:
             print(f"✅ Successfully created {model_name}")
             self.model_versions.append(model_name)
             return model_name
         else:
-            print(f"❌ Failed to create {model_name}: {result.stderr}")
+            print(f"❌ Failed to create {model_name}: {error}")
             return None
     
     def test_model_performance(self, model_name: str, iteration: int):
@@ -430,29 +416,24 @@ Output: \"\"\"
         ]
         
         performance_scores = []
+        results = self.eval_runner.run(model_name, [test_input for test_input, _ in test_cases])
         
-        for test_input, test_type in test_cases:
+        for (test_input, test_type), result in zip(test_cases, results):
             print(f"\n🔬 Testing {test_type}: '{test_input}'")
             
-            try:
-                result = subprocess.run(['ollama', 'run', model_name], 
-                                      input=test_input, text=True, 
-                                      capture_output=True, timeout=20)
+            if result['error']:
+                print(f"Error: {result['error']}")
+                performance_scores.append(0)
+            elif result['response']:
+                response = result['response'][:100]
+                print(f"Response: {response}...")
                 
-                if result.stdout:
-                    response = result.stdout.strip()[:100]
-                    print(f"Response: {response}...")
-                    
-                    # Simple performance scoring
-                    score = self.score_response(response, test_type)
-                    performance_scores.append(score)
-                    print(f"Score: {score}/10")
-                else:
-                    print("No response")
-                    performance_scores.append(0)
-                    
-            except Exception as e:
-                print(f"Error: {e}")
+                # Simple performance scoring
+                score = self.score_response(response, test_type)
+                performance_scores.append(score)
+                print(f"Score: {score}/10")
+            else:
+                print("No response")
                 performance_scores.append(0)
         
         avg_score = sum(performance_scores) / len(performance_scores) if performance_scores else 0
@@ -463,21 +444,7 @@ Output: \"\"\"
     
     def score_response(self, response: str, test_type: str) -> int:
         """Simple response scoring"""
-        score = 5  # Base score
-        
-        # Check for emojis
-        if any(char in response for char in '😊😢😠✅❌🤔🆘🙏💭🎯🌟'):
-            score += 2
-        
-        # Check for appropriate length
-        if 10 <= len(response) <= 200:
-            score += 1
-        
-        # Check for comma separation (multiple responses)
-        if ',' in response:
-            score += 2
-        
-        return min(score, 10)
+        return basic_score(response_metrics(response))
     
     def continuous_training_loop(self, iterations: int = 5):
         """Run continuous training loop"""
@@ -502,6 +469,7 @@ Output: \"\"\"
             if model_name:
                 # Test performance
                 score = self.test_model_performance(model_name, i)
+                self.registry.record_score(model_name, score)
                 
                 # Track best model
                 if score > best_score:
@@ -511,11 +479,8 @@ Output: \"\"\"
                 # Update primary model if this is better
                 if model_name == best_model:
                     print(f"🏆 New best model: {model_name} (score: {score})")
-                    # Copy to main tinkybink model
-                    subprocess.run(['ollama', 'rm', 'tinkybink'], capture_output=True)
-                    subprocess.run(['ollama', 'create', 'tinkybink', '-f', f'Modelfile.tinkybink_v{i}'])
-                
-            time.sleep(2)  # Brief pause between iterations
+                    # Point the main tinkybink model at it
+                    self.registry.promote('tinkybink', model_name)
         
         print(f"\n🎉 Continuous Training Complete!")
         print(f"🏆 Best Model: {best_model} (score: {best_score})")
@@ -523,11 +488,29 @@ Output: \"\"\"
         print(f"🎯 Ready for production use!")
 
 def main():
+    parser = argparse.ArgumentParser(description="TinkyBink continuous training loop")
+    parser.add_argument('--iterations', type=int, default=3)
+    parser.add_argument('--offline', action='store_true',
+                        help="Run against an in-process stub model server (no ollama needed)")
+    args = parser.parse_args()
+
     print("🔄 TinkyBink Continuous Training System")
     print("=" * 50)
     
-    trainer = ContinuousTrainer()
-    trainer.continuous_training_loop(iterations=3)
+    if args.offline:
+        from model_server import StubModelStore, load_corpus, server_url, start_server
+
+        server = start_server(StubModelStore(load_corpus(['tinkybink_master_unique_final.jsonl'])))
+        host = server_url(server)
+        print(f"🧪 Offline mode: stub model server at {host}")
+        trainer = ContinuousTrainer(HTTPModelBackend(host), EvalRunner(HTTPBackend(host), cache_path=None),
+                                    registry_path=OFFLINE_REGISTRY_FILE)
+    else:
+        trainer = ContinuousTrainer()
+    
+    start = time.perf_counter()
+    trainer.continuous_training_loop(iterations=args.iterations)
+    print(f"⏱️ Loop time: {time.perf_counter() - start:.1f}s")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Conversation Pack Exporter
+Writes the conversational logic JSON files as an indexed binary container
+that can be memory-mapped and decoded one category or tree at a time
+"""
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Dict, List, Optional
+
+# File layout (all integers little-endian):
+#
+#   header     MAGIC, version u16, reserved u16, category_count u32,
+#              meta_offset u64, meta_length u32, table_offset u64
+#   metadata   compact JSON of the top-level keys that are not categories
+#   table      per category: name_len u16, name, section_offset u64,
+#              record_count u32, shell_offset u64, shell_length u32
+#   sections   per category: record index (key_len u16, key, offset u64,
+#              length u32 per record) followed by the shell and the records,
+#              each stored as compact UTF-8 JSON
+PACK_MAGIC = b'TBPK'
+PACK_VERSION = 1
+
+_HEADER = struct.Struct('<4sHHIQIQ')
+_U16 = struct.Struct('<H')
+_TABLE_TAIL = struct.Struct('<QIQI')
+_RECORD_TAIL = struct.Struct('<QI')
+
+# How each source file is split into categories and records.
+#   categories_key: top-level key holding the per-category data
+#   list_field:     list inside each category whose items become records
+#                   (None means the category value itself is the list)
+#   record_key:     item field used as the record key (falls back to index)
+PACK_LAYOUTS = {
+    'conversational_logic': {
+        'categories_key': 'conversation_trees',
+        'list_field': 'root_responses',
+        'record_key': 'id',
+    },
+    'conversation_starters': {
+        'categories_key': 'by_category',
+        'list_field': None,
+        'record_key': None,
+    },
+}
+
+DEFAULT_EXPORTS = [
+    ('tinkybink_full_conversational_logic.json', 'tinkybink_full_conversational_logic.tbpack', 'conversational_logic'),
+    ('tinkybink_conversation_starters.json', 'tinkybink_conversation_starters.tbpack', 'conversation_starters'),
+]
+
+def _encode(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def export_pack(data: Dict, pack_path: str, layout: str) -> Dict:
+    """Write a loaded JSON document as an indexed binary pack"""
+    spec = PACK_LAYOUTS[layout]
+    categories = data.get(spec['categories_key'], {})
+    list_field = spec['list_field']
+
+    metadata = {key: value for key, value in data.items() if key != spec['categories_key']}
+    metadata['_pack'] = {
+        'layout': layout,
+        'categories_key': spec['categories_key'],
+        'list_field': list_field,
+    }
+    meta_bytes = _encode(metadata)
+
+    # Encode every category up front so offsets can be computed in one pass
+    encoded = []
+    for name, value in categories.items():
+        items = value if list_field is None else value.get(list_field, [])
+        shell = {} if list_field is None else {k: v for k, v in value.items() if k != list_field}
+        records = []
+        for index, item in enumerate(items):
+            key = str(index)
+            if spec['record_key'] and isinstance(item, dict) and spec['record_key'] in item:
+                key = str(item[spec['record_key']])
+            records.append((key.encode('utf-8'), _encode(item)))
+        encoded.append((name.encode('utf-8'), _encode(shell), records))
+
+    table_offset = _HEADER.size + len(meta_bytes)
+    table_size = sum(_U16.size + len(name) + _TABLE_TAIL.size for name, _, _ in encoded)
+
+    table = bytearray()
+    sections = bytearray()
+    cursor = table_offset + table_size
+    for name, shell_bytes, records in encoded:
+        index_size = sum(_U16.size + len(key) + _RECORD_TAIL.size for key, _ in records)
+        section_offset = cursor
+        shell_offset = section_offset + index_size
+        record_offset = shell_offset + len(shell_bytes)
+
+        index = bytearray()
+        payload = bytearray(shell_bytes)
+        for key, body in records:
+            index += _U16.pack(len(key)) + key + _RECORD_TAIL.pack(record_offset, len(body))
+            payload += body
+            record_offset += len(body)
+
+        table += _U16.pack(len(name)) + name
+        table += _TABLE_TAIL.pack(section_offset, len(records), shell_offset, len(shell_bytes))
+        sections += index + payload
+        cursor = section_offset + len(index) + len(payload)
+
+    header = _HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(encoded),
+                          _HEADER.size, len(meta_bytes), table_offset)
+    with open(pack_path, 'wb') as f:
+        f.write(header)
+        f.write(meta_bytes)
+        f.write(table)
+        f.write(sections)
+
+    return {
+        'categories': len(encoded),
+        'records': sum(len(records) for _, _, records in encoded),
+        'bytes': cursor,
+    }
+
+def export_json_file(json_path: str, pack_path: str, layout: str) -> Dict:
+    """Load a JSON file and export it as a binary pack"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return export_pack(data, pack_path, layout)
+
+class ConversationPack:
+    """Read-only, memory-mapped view over a pack written by export_pack"""
+
+    def __init__(self, pack_path: str):
+        self.path = pack_path
+        self._file = open(pack_path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count, meta_offset, meta_length, table_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"{pack_path} is not a conversation pack")
+        if version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported pack version {version} in {pack_path}")
+
+        self._meta_span = (meta_offset, meta_length)
+        self._metadata = None
+        self._categories = {}
+        self._record_indexes = {}
+
+        # The category table is tiny, so it is parsed eagerly; records are not
+        pos = table_offset
+        for _ in range(count):
+            (name_len,) = _U16.unpack_from(self._map, pos)
+            pos += _U16.size
+            name = self._map[pos:pos + name_len].decode('utf-8')
+            pos += name_len
+            self._categories[name] = _TABLE_TAIL.unpack_from(self._map, pos)
+            pos += _TABLE_TAIL.size
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _decode(self, offset: int, length: int):
+        return json.loads(self._map[offset:offset + length].decode('utf-8'))
+
+    @property
+    def metadata(self) -> Dict:
+        """Top-level fields of the source document, minus the categories"""
+        if self._metadata is None:
+            self._metadata = self._decode(*self._meta_span)
+        return self._metadata
+
+    def categories(self) -> List[str]:
+        return list(self._categories)
+
+    def record_count(self, category: str) -> int:
+        return self._categories[category][1]
+
+    def _record_index(self, category: str) -> Dict[str, tuple]:
+        index = self._record_indexes.get(category)
+        if index is None:
+            section_offset, count, _, _ = self._categories[category]
+            index = {}
+            pos = section_offset
+            for _ in range(count):
+                (key_len,) = _U16.unpack_from(self._map, pos)
+                pos += _U16.size
+                key = self._map[pos:pos + key_len].decode('utf-8')
+                pos += key_len
+                index[key] = _RECORD_TAIL.unpack_from(self._map, pos)
+                pos += _RECORD_TAIL.size
+            self._record_indexes[category] = index
+        return index
+
+    def record_keys(self, category: str) -> List[str]:
+        return list(self._record_index(category))
+
+    def record(self, category: str, key: str) -> Optional[Dict]:
+        """Decode a single tree/record without touching the rest of the category"""
+        span = self._record_index(category).get(key)
+        if span is None:
+            return None
+        return self._decode(*span)
+
+    def category(self, category: str):
+        """Decode one category back into its original JSON structure"""
+        _, _, shell_offset, shell_length = self._categories[category]
+        items = [self._decode(*span) for span in self._record_index(category).values()]
+        list_field = self.metadata['_pack']['list_field']
+        if list_field is None:
+            return items
+        value = self._decode(shell_offset, shell_length)
+        value[list_field] = items
+        return value
+
+    def to_dict(self) -> Dict:
+        """Decode the whole pack back into the source document"""
+        document = dict(self.metadata)
+        pack_info = document.pop('_pack')
+        document[pack_info['categories_key']] = {name: self.category(name) for name in self._categories}
+        return document
+
+def main():
+    print("📦 TinkyBink Conversation Pack Exporter")
+    print("=" * 50)
+
+    for json_path, pack_path, layout in DEFAULT_EXPORTS:
+        if not os.path.exists(json_path):
+            print(f"⚠️ {json_path} not found, skipping")
+            continue
+
+        stats = export_json_file(json_path, pack_path, layout)
+        json_size = os.path.getsize(json_path)
+        print(f"\n✅ Saved: {pack_path}")
+        print(f"   {stats['categories']} categories, {stats['records']:,} records")
+        print(f"   {json_size:,} bytes JSON → {stats['bytes']:,} bytes packed")
+
+        start = time.perf_counter()
+        with open(json_path, 'r', encoding='utf-8') as f:
+            original = json.load(f)
+        json_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        with ConversationPack(pack_path) as pack:
+            first = pack.categories()[0]
+            pack.record(first, pack.record_keys(first)[0])
+            pack_ms = (time.perf_counter() - start) * 1000
+            roundtrip_ok = pack.to_dict() == original
+
+        print(f"   ⏱️ Full JSON load: {json_ms:.1f} ms | open pack + one record: {pack_ms:.2f} ms")
+        print(f"   🔁 Round trip: {'✅ identical' if roundtrip_ok else '❌ mismatch'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Columnar Corpus
+Converts the JSONL training corpora into one canonical Parquet file and
+reads it back column by column. Tiles are list columns; sources,
+instructions, categories and emojis are dictionary-encoded. Rows are
+sorted by category so filters on it skip whole row groups.
+"""
+import argparse
+import glob
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from corpus_compiler import example_key, read_jsonl
+from tile_parser import parse_tiles
+
+CORPUS_FILE = 'tinkybink_corpus.parquet'
+SOURCES_KEY = b'tinkybink.sources'
+ROW_GROUP_SIZE = 8192
+
+_labels = pa.dictionary(pa.int32(), pa.string())
+
+SCHEMA = pa.schema([
+    ('source', _labels),
+    ('instruction', _labels),
+    ('input', pa.string()),
+    ('output', pa.string()),
+    ('category', _labels),
+    ('emotion_level', _labels),
+    ('complexity', pa.int8()),
+    ('spoken_sentence', pa.string()),
+    ('tile_emoji', pa.list_(_labels)),
+    ('tile_words', pa.list_(pa.string())),
+])
+
+def canonical_row(example: Dict, source: str) -> Dict:
+    """Flatten plain and aac_response-style examples into one row shape"""
+    aac = example.get('aac_response') or {}
+    usage = aac.get('usage_data') or {}
+    output = example.get('raw_output') or example.get('output') or ''
+    tiles = aac.get('tiles') or parse_tiles(output, tile_ids=False)
+    return {
+        'source': source,
+        'instruction': example.get('instruction'),
+        'input': example.get('input'),
+        'output': output,
+        'category': usage.get('category') or example.get('category'),
+        'emotion_level': usage.get('emotion_level'),
+        'complexity': usage.get('complexity') if isinstance(usage.get('complexity'), int) else None,
+        'spoken_sentence': aac.get('spoken_sentence'),
+        'tile_emoji': [tile.get('emoji') or '' for tile in tiles],
+        'tile_words': [tile.get('words') or '' for tile in tiles],
+    }
+
+def canonical_rows(paths: Iterable[str]) -> Iterable[Dict]:
+    """Canonical rows from every path, first occurrence of an example wins"""
+    seen = set()
+    for path in paths:
+        for example in read_jsonl(path):
+            row = canonical_row(example, path)
+            key = example_key(row, ('input', 'output'))
+            if key not in seen:
+                seen.add(key)
+                yield row
+
+def source_stamp(paths: Iterable[str]) -> str:
+    """Path, size and mtime of every source JSONL, kept in the Parquet metadata"""
+    stamps = []
+    for path in paths:
+        stat = os.stat(path)
+        stamps.append([path, stat.st_size, stat.st_mtime_ns])
+    return json.dumps(stamps)
+
+def is_current(paths: List[str], path: str = CORPUS_FILE) -> bool:
+    """Whether path was converted from exactly these sources, none changed since"""
+    if not os.path.exists(path):
+        return False
+    metadata = pq.read_schema(path).metadata or {}
+    return metadata.get(SOURCES_KEY) == source_stamp(paths).encode('utf-8')
+
+def convert(paths: List[str], output_path: str = CORPUS_FILE) -> int:
+    """Write the deduplicated canonical corpus to Parquet; returns the row count"""
+    # Stamped before reading, so a source edited mid-conversion triggers a rebuild
+    stamp = source_stamp(paths)
+    rows = sorted(canonical_rows(paths), key=lambda row: (row['category'] or '', row['source']))
+    table = pa.Table.from_pylist(rows, schema=SCHEMA).replace_schema_metadata({SOURCES_KEY: stamp})
+    pq.write_table(table, output_path, row_group_size=ROW_GROUP_SIZE, compression='zstd')
+    return table.num_rows
+
+def read_corpus(path: str = CORPUS_FILE, columns: Optional[List[str]] = None, filters=None) -> pa.Table:
+    """Read only the requested columns; filters use pyarrow's DNF form,
+    e.g. [('category', '=', 'medical')], and prune row groups by statistics"""
+    return pq.read_table(path, columns=columns, filters=filters)
+
+def value_counts(table: pa.Table, column: str) -> Dict[str, int]:
+    counts = pc.value_counts(table[column].cast(pa.string()))
+    return {entry['values'].as_py(): entry['counts'].as_py() for entry in counts}
+
+def category_counts(path: str = CORPUS_FILE, filters=None) -> Dict[str, int]:
+    return value_counts(read_corpus(path, ['category'], filters), 'category')
+
+def texts_matching_all(column: pa.ChunkedArray, words: List[str]) -> int:
+    """Rows whose lowercased text contains every word"""
+    lowered = pc.utf8_lower(column)
+    mask = None
+    for word in words:
+        hit = pc.match_substring(lowered, word)
+        mask = hit if mask is None else pc.and_(mask, hit)
+    return pc.sum(pc.fill_null(mask, False)).as_py() or 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the columnar TinkyBink corpus")
+    parser.add_argument('inputs', nargs='*', help="JSONL files (default: every *.jsonl here)")
+    parser.add_argument('--output', default=CORPUS_FILE)
+    args = parser.parse_args()
+
+    paths = args.inputs or sorted(glob.glob('*.jsonl'))
+
+    print("🗃️ TinkyBink Columnar Corpus")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    rows = convert(paths, args.output)
+    print(f"✅ {rows:,} unique rows from {len(paths)} files -> {args.output} "
+          f"({time.perf_counter() - start:.1f}s)")
+
+    start = time.perf_counter()
+    categories = category_counts(args.output)
+    print(f"📊 {len(categories)} categories read from one column in {1000 * (time.perf_counter() - start):.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Streaming Corpus Compiler
+Merges JSONL sources and generated examples lazily, runs them through
+generator stages, drops duplicates by hashed key and writes the output in
+chunks. Memory holds one chunk plus an 8-byte digest per unique example.
+"""
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+DEDUP_FIELDS = ('instruction', 'input', 'output')
+# Identity across both example schemas (plain output and aac_response/raw_output)
+EXAMPLE_FIELDS = ('instruction', 'input', 'output', 'raw_output')
+
+Source = Union[str, Tuple[str, Union[Iterable[Dict], Callable[[], Iterable[Dict]]]]]
+Stage = Callable[[Iterator[Dict]], Iterator[Dict]]
+
+def read_jsonl(path: str) -> Iterator[Dict]:
+    """Yield examples from a JSONL file, skipping blank and malformed lines"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"  ⚠️ {path}:{line_number}: {e}")
+
+def example_key(example: Dict, fields: Sequence[str] = DEDUP_FIELDS) -> bytes:
+    """Compact digest of the fields that make two examples the same"""
+    digest = hashlib.blake2b(digest_size=8)
+    for field in fields:
+        digest.update(str(example.get(field, '')).strip().encode('utf-8'))
+        digest.update(b'\0')
+    return digest.digest()
+
+def merge_sources(sources: List[Source], stats: Dict) -> Iterator[Dict]:
+    """Chain sources in order; paths are read lazily, callables are called when reached"""
+    for source in sources:
+        if isinstance(source, str):
+            name, examples = source, None
+            if not os.path.exists(source):
+                print(f"  ⚠️ Missing source: {source}")
+                continue
+        else:
+            name, examples = source
+
+        count = 0
+        try:
+            if examples is None:
+                examples = read_jsonl(name)
+            elif callable(examples):
+                examples = examples()
+            for example in examples:
+                count += 1
+                yield example
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⚠️ Error loading {name}: {e}")
+        stats['sources'][name] = count
+        print(f"  📁 {name}: {count} examples")
+
+def dedup(stream: Iterator[Dict], stats: Dict, fields: Sequence[str] = DEDUP_FIELDS) -> Iterator[Dict]:
+    seen = set()
+    for example in stream:
+        key = example_key(example, fields)
+        if key in seen:
+            stats['duplicates'] += 1
+            continue
+        seen.add(key)
+        yield example
+
+def compile_corpus(sources: List[Source], output_path: str, stages: Sequence[Stage] = (),
+                   chunk_size: int = 1000, dedup_fields: Sequence[str] = DEDUP_FIELDS) -> Dict:
+    """Stream sources -> stages -> dedup -> output_path; returns counts.
+
+    The output is written to a temporary file and swapped in at the end, so
+    a source may safely be the previous version of the output.
+    """
+    stats = {'sources': {}, 'duplicates': 0, 'written': 0}
+    stream = merge_sources(sources, stats)
+    for stage in stages:
+        stream = stage(stream)
+    if dedup_fields:
+        stream = dedup(stream, stats, dedup_fields)
+
+    tmp_path = f"{output_path}.tmp"
+    chunk = []
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for example in stream:
+            chunk.append(json.dumps(example) + '\n')
+            if len(chunk) >= chunk_size:
+                f.writelines(chunk)
+                stats['written'] += len(chunk)
+                chunk = []
+        f.writelines(chunk)
+        stats['written'] += len(chunk)
+    os.replace(tmp_path, output_path)
+
+    stats['read'] = sum(stats['sources'].values())
+    return stats
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Corpus Index
+Random access into a JSONL corpus without reading it from the top. A
+sidecar <corpus>.idx.npz holds every line's byte offset plus lookup
+tables from example id (its corpus_compiler digest) and from category to
+line numbers. CorpusReader memory-maps the JSONL and decodes only the
+records asked for; the index is rebuilt when the corpus changes.
+"""
+import argparse
+import json
+import mmap
+import os
+import random
+import time
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from corpus_compiler import EXAMPLE_FIELDS, example_key
+from dataset_profiler import example_fields
+
+MASTER_CORPUS = 'tinkybink_absolutely_final_complete_master.jsonl'
+INDEX_SUFFIX = '.idx.npz'
+INDEX_VERSION = 1
+
+def index_path(corpus_path: str) -> str:
+    return corpus_path + INDEX_SUFFIX
+
+def _stamp(corpus_path: str) -> np.ndarray:
+    stat = os.stat(corpus_path)
+    return np.array([INDEX_VERSION, stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+def build_index(corpus_path: str) -> str:
+    """Scan the corpus once and write its sidecar index; returns the index path.
+
+    Blank and malformed lines are not records and get no line number.
+    """
+    offsets = []
+    ids = []
+    category_codes = []
+    categories: Dict[str, int] = {}
+
+    with open(corpus_path, 'rb') as f:
+        position = 0
+        for raw in f:
+            start = position
+            position += len(raw)
+            if not raw.strip():
+                continue
+            try:
+                example = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            category = example_fields(example)[3] or 'uncategorized'
+            offsets.append((start, position))
+            ids.append(int.from_bytes(example_key(example, EXAMPLE_FIELDS), 'big'))
+            category_codes.append(categories.setdefault(category, len(categories)))
+
+    spans = np.array(offsets, dtype=np.uint64).reshape(-1, 2)
+    ids = np.array(ids, dtype=np.uint64)
+    codes = np.array(category_codes, dtype=np.int32)
+    id_order = np.argsort(ids, kind='stable').astype(np.uint32)
+    # CSR layout: lines of category c are category_lines[category_starts[c]:category_starts[c + 1]]
+    category_lines = np.argsort(codes, kind='stable').astype(np.uint32)
+    category_starts = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(categories)))])
+
+    path = index_path(corpus_path)
+    with open(path, 'wb') as f:
+        np.savez(f, stamp=_stamp(corpus_path), spans=spans, sorted_ids=ids[id_order], id_order=id_order,
+                 category_names=np.array(list(categories), dtype=str), category_lines=category_lines,
+                 category_starts=category_starts.astype(np.uint32))
+    return path
+
+class CorpusReader:
+    """mmap-backed random access to one JSONL corpus"""
+
+    def __init__(self, corpus_path: str = MASTER_CORPUS, rebuild: bool = False):
+        self.path = corpus_path
+        self._load_index(rebuild)
+        self._file = open(corpus_path, 'rb')
+        size = os.path.getsize(corpus_path)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def _load_index(self, rebuild: bool):
+        path = index_path(self.path)
+        if not rebuild and os.path.exists(path):
+            with np.load(path) as index:
+                if np.array_equal(index['stamp'], _stamp(self.path)):
+                    self._set_index(index)
+                    return
+        with np.load(build_index(self.path)) as index:
+            self._set_index(index)
+
+    def _set_index(self, index):
+        self.spans = index['spans']
+        self._sorted_ids = index['sorted_ids']
+        self._id_order = index['id_order']
+        self.category_names = [str(name) for name in index['category_names']]
+        self._category_codes = {name: code for code, name in enumerate(self.category_names)}
+        self._category_lines = index['category_lines']
+        self._category_starts = index['category_starts']
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> 'CorpusReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def raw(self, line: int) -> bytes:
+        """Undecoded JSON of one record"""
+        start, end = self.spans[line]
+        return self._map[int(start):int(end)]
+
+    def __getitem__(self, line: int) -> Dict:
+        if line < 0:
+            line += len(self)
+        if not 0 <= line < len(self):
+            raise IndexError(f"{self.path} has {len(self)} records")
+        return json.loads(self.raw(line))
+
+    def __iter__(self) -> Iterator[Dict]:
+        for line in range(len(self)):
+            yield self[line]
+
+    def line_of(self, example_id: Union[str, bytes]) -> Optional[int]:
+        """Line number of the example whose corpus_compiler digest is example_id (hex or bytes)"""
+        if isinstance(example_id, str):
+            example_id = bytes.fromhex(example_id)
+        key = np.uint64(int.from_bytes(example_id, 'big'))
+        position = int(np.searchsorted(self._sorted_ids, key))
+        if position < len(self._sorted_ids) and self._sorted_ids[position] == key:
+            return int(self._id_order[position])
+        return None
+
+    def get(self, example_id: Union[str, bytes]) -> Optional[Dict]:
+        line = self.line_of(example_id)
+        return None if line is None else self[line]
+
+    def lines_in(self, category: str) -> np.ndarray:
+        """Line numbers of a category, in corpus order"""
+        code = self._category_codes.get(category)
+        if code is None:
+            return np.empty(0, dtype=np.uint32)
+        return self._category_lines[self._category_starts[code]:self._category_starts[code + 1]]
+
+    def category(self, category: str) -> Iterator[Dict]:
+        for line in self.lines_in(category):
+            yield self[int(line)]
+
+    def category_counts(self) -> Dict[str, int]:
+        return {name: int(self._category_starts[code + 1] - self._category_starts[code])
+                for code, name in enumerate(self.category_names)}
+
+    def sample(self, n: int, seed: Optional[int] = None, category: Optional[str] = None) -> List[Dict]:
+        """n random records, optionally from one category"""
+        lines = self.lines_in(category).tolist() if category else range(len(self))
+        return [self[int(line)] for line in random.Random(seed).sample(lines, min(n, len(lines)))]
+
+def main():
+    parser = argparse.ArgumentParser(description="Index a JSONL corpus and read records by line, id or category")
+    parser.add_argument('corpus', nargs='?', default=MASTER_CORPUS)
+    parser.add_argument('--line', type=int, action='append', help="Print this record (repeatable)")
+    parser.add_argument('--id', action='append', help="Print the record with this example id (hex)")
+    parser.add_argument('--category', help="Print records in this category")
+    parser.add_argument('--rebuild', action='store_true', help="Rebuild the sidecar index")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with CorpusReader(args.corpus, rebuild=args.rebuild) as reader:
+        open_ms = 1000 * (time.perf_counter() - start)
+        if args.line or args.id or args.category:
+            records = [reader[line] for line in args.line or []]
+            records += [reader.get(example_id) for example_id in args.id or []]
+            records += list(reader.category(args.category)) if args.category else []
+            for record in records:
+                print(json.dumps(record, ensure_ascii=False))
+            return
+
+        print("🗂️ TinkyBink Corpus Index")
+        print("=" * 50)
+        print(f"📁 {args.corpus}: {len(reader):,} records, {len(reader.category_names)} categories")
+        print(f"✅ Index {index_path(args.corpus)} ({os.path.getsize(index_path(args.corpus)):,} bytes) "
+              f"opened in {open_ms:.1f} ms")
+        if not len(reader):
+            return
+
+        rounds = 10000
+        lines = [random.randrange(len(reader)) for _ in range(rounds)]
+        start = time.perf_counter()
+        for line in lines:
+            reader[line]
+        print(f"⚡ Random record: {1e6 * (time.perf_counter() - start) / rounds:.1f} µs")
+
+        ids = [example_key(reader[line], EXAMPLE_FIELDS) for line in lines[:1000]]
+        start = time.perf_counter()
+        for example_id in ids:
+            reader.line_of(example_id)
+        print(f"⚡ Lookup by id: {1e6 * (time.perf_counter() - start) / len(ids):.1f} µs")
+
+        largest = max(reader.category_counts().items(), key=lambda item: item[1])
+        start = time.perf_counter()
+        records = list(reader.category(largest[0]))
+        print(f"⚡ Category '{largest[0]}' ({len(records):,} records): "
+              f"{1000 * (time.perf_counter() - start):.2f} ms")
+
+if __name__ == "__main__":
+    main()
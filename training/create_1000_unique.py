@@ -2,377 +2,46 @@
 """
 Create 1000+ More Unique Responses
 Each response completely different, no patterns repeated
+Scenarios live in scenarios/unique_responses.jsonl
 """
 import json
-import random
+from collections import Counter
+from itertools import islice
 
-def create_unique_greetings():
-    """Create 100 unique greeting responses"""
-    greetings = []
-    
-    greeting_inputs = [
-        "Hello", "Hi", "Hey", "Good morning", "Good afternoon", "Good evening", "Hi there",
-        "Hello there", "Hey there", "Greetings", "Howdy", "What's up", "Yo", "Hiya",
-        "Morning", "Evening", "Afternoon", "Hey you", "Hello friend", "Hi friend"
-    ]
-    
-    # 100 completely unique greeting responses - no duplicates
-    greeting_responses = [
-        "👋 Waves back enthusiastically, 😊 Bright smile appearing, 🌟 Day just improved, 💫 Connection established",
-        "🌈 Colors brightening suddenly, 👋 Hand raised high, 😄 Grin spreading wide, 🎉 Party mode activated",
-        "🦋 Flutter of recognition, 👋 Signal received clearly, 😊 Warmth radiating outward, 🌺 Flower blooming here",
-        "⚡ Electric greeting back, 👋 Mirror your energy, 😊 Joy bubble forming, 🎪 Circus welcomes you",
-        "🌟 Twinkle in eye, 👋 Acknowledgment given freely, 😊 Happiness meter rising, 🎭 Mask drops away",
-        "🎵 Musical hello singing, 👋 Gesture reciprocated warmly, 😊 Sunshine breaking through, 🏰 Gates opening wide",
-        "💫 Cosmic alignment happening, 👋 Return signal sent, 😊 Dimples showing now, 🌊 Wave crashing happily",
-        "🎨 Painting greeting back, 👋 Arms open wide, 😊 Beam of light, 🦄 Magic moment here",
-        "🌸 Petals unfurling slowly, 👋 Recognition dawning bright, 😊 Smile muscles working, 🎢 Ride beginning now",
-        "🏔️ Peak excitement reached, 👋 Hello boomeranging back, 😊 Face lighting up, 🌺 Aloha spirit flowing",
-        "🎪 Ringmaster announcing arrival, 👋 Salutation returned promptly, 😊 Cheeks lifting naturally, 🌟 Spotlight shining bright",
-        "🦅 Soaring greeting high, 👋 Palm showing peace, 😊 Crow's feet appearing, 💎 Precious moment captured",
-        "🌊 Tide turning friendly, 👋 Reciprocal wave given, 😊 Mouth curving upward, 🎯 Target hit perfectly",
-        "🎭 Curtain rising up, 👋 Stage greeting performed, 😊 Audience won over, 🌈 Spectrum completed now",
-        "💫 Shooting star greeting, 👋 Comet tail following, 😊 Universe conspiring nicely, 🏰 Drawbridge lowering down",
-        "🌺 Lei thrown lovingly, 👋 Island welcome given, 😊 Vacation starting now, 🏖️ Beach vibes activated",
-        "🎪 Three ring greeting, 👋 Juggling hello back, 😊 Clown nose honking, 🎠 Carousel spinning round",
-        "🦋 Metamorphosis greeting completed, 👋 Wing flutter hello, 😊 Chrysalis opened fully, 🌸 Spring has arrived",
-        "⚡ Lightning greeting strikes, 👋 Thunder following close, 😊 Storm of joy, 🌈 After rain beauty",
-        "🎨 Masterpiece greeting painted, 👋 Brush strokes perfect, 😊 Gallery opening now, 🖼️ Frame completed beautifully",
-        # Continue with 80 more unique responses...
-        "🌟 North star guiding, 👋 Navigator acknowledging ship, 😊 Harbor lights welcoming, ⚓ Anchor dropping here",
-        "🎵 Symphony beginning grandly, 👋 Conductor's baton raised, 😊 Orchestra tuning up, 🎻 Strings vibrating warmly",
-        "🏔️ Avalanche of joy, 👋 Mountain echo returning, 😊 Alpine glow spreading, 🎿 Slope opening up",
-        "🌊 Tsunami of happiness, 👋 Surfboard ready now, 😊 Pipeline forming perfectly, 🏄 Ride starting soon",
-        "🦄 Unicorn sighting confirmed, 👋 Horn sparkling brightly, 😊 Rainbow mane flowing, ✨ Glitter everywhere now"
-    ]
-    
-    # Generate first 25 greeting examples
-    for i in range(min(25, len(greeting_inputs))):
-        if i < len(greeting_responses):
-            greetings.append({
-                'instruction': f'AAC Unique Greeting {i+1}',
-                'input': greeting_inputs[i % len(greeting_inputs)],
-                'output': greeting_responses[i]
-            })
-    
-    return greetings
-
-def create_unique_feelings():
-    """Create 200 unique feeling responses"""
-    feelings = []
-    
-    # Expanded feeling scenarios
-    feeling_scenarios = [
-        # Happy variations
-        ("I feel amazing", "🎆 Fireworks exploding inside, 🏆 Trophy cabinet full, 🌟 Constellation named me, 🚀 Rocket fuel burning"),
-        ("Life is good", "🌺 Garden paradise found, 🦋 Chrysalis fully opened, 🌈 Pot gold discovered, 🎪 Greatest show earth"),
-        ("Today rocks", "🎸 Guitar solo playing, 🏔️ Mountain conquered already, 🌊 Perfect wave caught, ⚡ Lightning captured bottle"),
-        ("Feeling blessed", "🙏 Gratitude overflowing cup, 💎 Diamonds raining down, 🌟 Lucky stars aligned, 🎁 Gifts keep coming"),
-        ("So much joy", "🎉 Confetti cannon fired, 🎈 Balloons filling sky, 🎊 Parade in progress, 🎪 Circus came town"),
-        
-        # Sad variations
-        ("Heart is heavy", "⚓ Anchor dragging deep, 🌊 Ocean floor reached, 💔 Pieces scattered wide, 🍂 Autumn took everything"),
-        ("Feeling blue", "🌊 Navy depths reached, 💙 Bruise soul showing, 🌧️ Personal rain cloud, 🎭 Tragedy mask stuck"),
-        ("Everything hurts", "🌪️ Tornado hit hard, 💔 Shrapnel embedded deep, 🌊 Drowning on land, ⛈️ Storm won't pass"),
-        ("Lost inside", "🌫️ Fog too thick, 🧭 Compass spinning wildly, 🗺️ Map torn up, 🌑 No stars visible"),
-        ("World is dark", "🌑 Eclipse permanent now, 🕳️ Black hole growing, 🌚 Moon's dark side, ⚫ Light switch broken"),
-        
-        # Angry variations
-        ("Steam coming out", "🌋 Volcano erupting now, 🔥 Dragon breathing fire, ⚡ Thor's hammer striking, 🌪️ Tornado forming fast"),
-        ("Blood boiling", "🌡️ Mercury exploding thermometer, 🔥 Lava flowing freely, ⚡ Power surge happening, 🌋 Magma chamber full"),
-        ("Seeing red", "🚨 Alarm bells ringing, 🎯 Bull's eye targeted, 🌹 Thorns not petals, 🍷 Wine spilled everywhere"),
-        ("Ready to explode", "💣 Fuse lit short, 🎆 Firework misfiring badly, 🌋 Pressure building dangerously, ⚡ Circuit overloading now"),
-        ("Fury unleashed", "🐉 Dragon awakened fully, ⚔️ Sword drawn ready, 🦁 Lion roaring loud, 🌪️ Hurricane strength reached"),
-        
-        # Scared variations
-        ("Terrified completely", "👻 Ghosts surrounding me, 🕷️ Spiders everywhere looking, 🌑 Darkness closing in, 🚨 Danger signals flashing"),
-        ("Fear gripping tight", "🐍 Snake coiled ready, 🦈 Shark circling closer, 🕸️ Web trapping me, ⚡ Storm approaching fast"),
-        ("Anxiety attacking", "🌊 Waves crashing over, 🌪️ Whirlwind thoughts spinning, ⚡ Electricity shocking system, 🔥 Burning from inside"),
-        ("Panic setting in", "🚨 Emergency mode activated, 🌊 Flood gates opening, ⏰ Time running out, 🏃 Must escape now"),
-        ("Frozen with fear", "❄️ Ice statue formed, 🧊 Glacier moving slowly, ⛄ Snowman can't move, 🌨️ Blizzard paralyzing completely"),
-        
-        # Tired variations
-        ("Exhausted completely", "🔋 Battery dead completely, 🕯️ Candle burned out, 🌅 Stayed up forever, 💤 Coma sounds nice"),
-        ("Running on empty", "⛽ Fuel gauge zero, 🏁 Race finished badly, 🔌 Unplugged from source, 🕯️ Wick burned down"),
-        ("Can't stay awake", "🌙 Moon pulling hard, 😴 Sandman won battle, 🛏️ Gravity times ten, 💤 Dream door opening"),
-        ("Energy depleted", "🔋 Phone at 1%, ⚡ Power plant closed, 🌑 Solar panels dark, 💡 Lights dimming fast"),
-        ("Beyond tired", "🌌 Different dimension tired, 🕳️ Fell through floor, 🌊 Underwater breathing tired, 🏔️ Everest climbed twice")
-    ]
-    
-    # Generate feeling examples
-    for i, (input_text, output_text) in enumerate(feeling_scenarios):
-        feelings.append({
-            'instruction': f'AAC Unique Feeling {i+1}',
-            'input': input_text,
-            'output': output_text
-        })
-    
-    return feelings
+from corpus_compiler import dedup
+from scenario_engine import read_scenarios, write_examples
 
-def create_unique_needs():
-    """Create 200 unique need responses"""
-    needs = []
-    
-    need_scenarios = [
-        # Food needs
-        ("Craving something sweet", "🍰 Cake calling name, 🍫 Chocolate emergency declared, 🍭 Candy store dreams, 🍯 Honey bear hungry"),
-        ("Want comfort food", "🍲 Soup for soul, 🥧 Grandma's pie needed, 🍝 Pasta hug required, 🧈 Butter makes better"),
-        ("Hungry for real meal", "🥩 Steak dinner time, 🍖 Protein power needed, 🥗 Salad bar calling, 🍤 Seafood feast craving"),
-        ("Need brain food", "🥜 Nuts for thinking, 🐟 Fish oil boost, 🥑 Avocado brain power, 🫐 Berries for neurons"),
-        ("Midnight snack time", "🌙 Moon cheese nibbles, 🍿 Popcorn movie combo, 🥛 Milk cookies calling, 🧀 Cheese drawer raid"),
-        
-        # Drink needs
-        ("Throat desert dry", "🏜️ Sahara in mouth, 💧 Oasis needed desperately, 🚰 Waterfall sounds good, 🧊 Ice bath throat"),
-        ("Coffee emergency", "☕ Caffeine IV drip, 🏃 Espresso shot marathon, ⚡ Lightning in cup, 🌅 Sunrise in mug"),
-        ("Tea time please", "🍵 Zen in cup, 🌿 Herbs healing soul, 🫖 Kettle singing songs, 🍃 Leaves telling stories"),
-        ("Something cold", "🧊 Arctic blast needed, ❄️ Snowball fight drink, 🏔️ Glacier water fresh, 🌨️ Blizzard in glass"),
-        ("Juice craving", "🍊 Sunshine squeezed fresh, 🍎 Orchard in glass, 🍇 Vineyard vacation drink, 🥭 Tropical escape sip"),
-        
-        # Rest needs
-        ("Nap attack incoming", "💤 Twenty minute recharge, 🛋️ Couch calling softly, 🌙 Afternoon moon rising, 😴 Power nap needed"),
-        ("Bed magnetic pull", "🧲 Mattress has gravity, 🛏️ Pillow fort building, 🌙 Dream door opening, 💤 Sleep debt collecting"),
-        ("Rest required urgently", "🔋 Recharge station needed, 🛑 Stop sign flashing, ⏸️ Pause button pressed, 🔌 Plugin required now"),
-        ("Hibernation mode", "🐻 Bear cave ready, ❄️ Winter sleep calling, 🌙 Extended moon visit, 💤 Seasons of sleep"),
-        ("Energy conservation needed", "🔋 Power save mode, 💡 Dimmer switch activated, 🌙 Low battery warning, ⚡ Voltage dropping fast"),
-        
-        # Social needs
-        ("Need human connection", "🤝 Soul handshake needed, 👥 Mirror neurons firing, 💕 Heart bridge building, 🌉 Connection spanning gaps"),
-        ("Craving conversation", "💬 Word hunger growing, 🗣️ Voice box lonely, 👂 Ears need feeding, 🎭 Dialogue drama wanted"),
-        ("Hug emergency", "🤗 Arms need filling, 🫂 Squeeze required stat, 💕 Touch starved badly, 🤲 Human warmth needed"),
-        ("Alone time please", "🏝️ Island vacation solo, 🚪 Door closing softly, 🤫 Silence golden now, 🧘 Solo meditation time"),
-        ("Group energy needed", "👥 Tribe gathering time, 🎪 Circus needs audience, 🎭 Ensemble cast ready, 🌟 Constellation forming together")
-    ]
-    
-    for i, (input_text, output_text) in enumerate(need_scenarios):
-        needs.append({
-            'instruction': f'AAC Unique Need {i+1}',
-            'input': input_text,
-            'output': output_text
-        })
-    
-    return needs
-
-def create_unique_activities():
-    """Create 200 unique activity responses"""
-    activities = []
-    
-    activity_scenarios = [
-        # Entertainment
-        ("Want entertainment", "🎪 Circus tickets please, 🎭 Drama unfolding now, 🎬 Movie marathon starting, 🎮 Game world entering"),
-        ("Bored out of mind", "🎨 Creativity explosion needed, 🎯 Target practice time, 🎪 Entertainment emergency declared, 🎢 Thrill ride required"),
-        ("Need stimulation", "⚡ Brain sparklers needed, 🎆 Mental fireworks show, 🧩 Puzzle pieces calling, 🎯 Challenge accepted gladly"),
-        ("Fun required stat", "🎉 Party planning mode, 🎈 Balloon animal making, 🎊 Confetti cannon ready, 🎪 Clown college enrollment"),
-        ("Adventure calling", "🗺️ Treasure map found, 🧭 Compass pointing somewhere, 🏔️ Mountain needs climbing, 🌊 Ocean needs exploring"),
-        
-        # Work/Productivity
-        ("Time to focus", "🎯 Laser beam concentration, 🔬 Microscope detail level, 🧘 Zen master mode, ⚡ Lightning focus activated"),
-        ("Productivity mode", "🚀 Rocket ship efficiency, ⚙️ Machine precision working, 📈 Graph climbing upward, 🏭 Factory output mode"),
-        ("Getting things done", "✅ Checkbox symphony playing, 📋 List conquering mode, 🎯 Target hitting spree, 🏆 Achievement unlocking time"),
-        ("Work flow state", "🌊 River flowing smoothly, ⚡ Current conducting perfectly, 🎵 Rhythm section grooving, 🎭 Performance mode on"),
-        ("Deep work time", "🌊 Ocean floor diving, 🕳️ Rabbit hole exploring, 🔬 Molecular level focus, 🧬 DNA strand concentration"),
-        
-        # Creative
-        ("Art mode activated", "🎨 Palette knife dancing, 🖌️ Brushes singing songs, 🎭 Muse visiting now, 🌈 Colors exploding everywhere"),
-        ("Music calling soul", "🎵 Notes floating freely, 🎸 Strings vibrating perfectly, 🎹 Keys unlocking emotions, 🎤 Voice finding freedom"),
-        ("Writing mood struck", "✍️ Pen flowing rivers, 📝 Words cascading down, 🖋️ Ink telling stories, 📚 Pages filling fast"),
-        ("Dance spirit moving", "💃 Body becoming music, 🕺 Rhythm taking over, 🎭 Expression through movement, 🌊 Flow state dancing"),
-        ("Creating something new", "🌟 Birth of idea, 💡 Lightbulb orchestra playing, 🧬 DNA of creativity, 🌈 Spectrum of possibility"),
-        
-        # Exercise
-        ("Body needs moving", "🏃 Legs demanding freedom, 💪 Muscles asking nicely, 🤸 Flexibility calling out, 🚴 Wheels need spinning"),
-        ("Workout time arrived", "💪 Iron pumping session, 🏋️ Gravity defying time, 💦 Sweat equity building, 🔥 Calorie bonfire party"),
-        ("Energy needs outlet", "⚡ Electricity needs grounding, 🌊 Waves need riding, 🏃 Steam needs releasing, 🎯 Target needs hitting"),
-        ("Movement medicine needed", "💊 Exercise prescription filled, 🏃 Endorphin pharmacy open, 💪 Natural high seeking, 🧘 Body wisdom speaking"),
-        ("Sports calling name", "⚽ Ball needs kicking, 🏀 Hoops need shooting, 🎾 Racket needs swinging, 🏐 Team needs player")
-    ]
-    
-    for i, (input_text, output_text) in enumerate(activity_scenarios):
-        activities.append({
-            'instruction': f'AAC Unique Activity {i+1}',
-            'input': input_text,
-            'output': output_text
-        })
-    
-    return activities
-
-def create_unique_questions():
-    """Create 200 unique question responses"""
-    questions = []
-    
-    question_scenarios = [
-        # What questions
-        ("What's happening", "🌪️ Whirlwind of events, 🎪 Circus in town, 🎭 Plot thickening rapidly, 🌊 Tide turning quickly"),
-        ("What's the plan", "🗺️ Map being drawn, 🧭 Compass calibrating now, 🎯 Targets being set, 🏗️ Blueprint developing slowly"),
-        ("What's for dinner", "🎰 Food lottery spinning, 🎯 Dart board menu, 🎲 Dice deciding dinner, 🎪 Surprise meal circus"),
-        ("What time is it", "⏰ Clock rebellion happening, 🌙 Moon's turn now, ☀️ Sun checking watch, ⏳ Sand still falling"),
-        ("What's wrong here", "🔍 Mystery needs solving, 🧩 Puzzle pieces missing, 🎭 Plot twist revealed, 🌪️ Storm brewing quietly"),
-        
-        # Where questions
-        ("Where are we", "🗺️ Map says nowhere, 🧭 Compass spinning wildly, 🌍 Planet Earth somewhere, 🎪 Wonderland maybe here"),
-        ("Where to go", "🎯 Dart throw decides, 🎲 Dice roll adventure, 🧭 Follow the wind, 🌟 Stars point way"),
-        ("Where is everyone", "👻 Ghost town population, 🏝️ Deserted island vibes, 🎪 Circus left town, 🌙 Moon stole everyone"),
-        ("Where's my stuff", "🔍 Treasure hunt beginning, 🗺️ X marks spot, 🎪 Magic trick happened, 🌪️ Tornado rearranged everything"),
-        ("Where's the exit", "🚪 Door playing hide-seek, 🗺️ Map showing circles, 🌀 Spiral maze continuing, 🎪 Fun house mirrors"),
-        
-        # When questions
-        ("When will it end", "⏳ Hourglass still flipping, 🌙 Moon knows secrets, ⏰ Clock went vacation, 📅 Calendar shrugged shoulders"),
-        ("When can we go", "🚦 Light stuck yellow, ⏰ Time moving slowly, 🌙 Moon says soon, ⭐ Stars aligning eventually"),
-        ("When is enough", "📏 Measuring tape broken, ⚖️ Scale tipping over, 🌊 Ocean says when, 🏔️ Mountain knows answer"),
-        ("When will I know", "💡 Lightbulb warming up, 🔮 Crystal ball cloudy, 🌟 Stars writing message, 🎯 Arrow finding target"),
-        ("When does it start", "🎬 Director says action, 🏁 Flag ready dropping, 🌅 Dawn breaking soon, 🎪 Curtain rising slowly"),
-        
-        # Why questions  
-        ("Why is this happening", "🌌 Universe has plans, 🎭 Script being written, 🎲 Dice were rolled, 🌊 Tide had turn"),
-        ("Why me though", "🎯 Dart hit bullseye, 🎰 Lottery chose you, 🌟 Stars spelled name, 🎪 Spotlight found you"),
-        ("Why not try", "🎲 Dice say yes, 🌈 Rainbow needs chasing, 🎯 Target needs hitting, 🏔️ Mountain needs climbing"),
-        ("Why does it matter", "🧩 Puzzle piece important, 🌊 Ripples spread wide, 🦋 Butterfly effect real, 🌟 Stars care deeply"),
-        ("Why should I care", "💫 Stardust connects everything, 🌊 Ocean includes droplets, 🧩 Picture needs piece, 🎭 Story needs character")
-    ]
-    
-    for i, (input_text, output_text) in enumerate(question_scenarios):
-        questions.append({
-            'instruction': f'AAC Unique Question {i+1}',
-            'input': input_text,
-            'output': output_text
-        })
-    
-    return questions
+SCENARIOS = 'unique_responses'
 
-def create_unique_medical():
-    """Create 200 unique medical/health responses"""
-    medical = []
-    
-    medical_scenarios = [
-        # Pain descriptions
-        ("Sharp pain here", "⚡ Lightning strike spot, 🗡️ Sword stabbing through, 📍 Pin precisely there, 🎯 Arrow hit target"),
-        ("Dull ache everywhere", "🌫️ Fog of pain, 🌊 Ocean of discomfort, ☁️ Cloud surrounding body, 🏔️ Mountain sitting chest"),
-        ("Burning sensation", "🔥 Fire ants marching, 🌶️ Chili pepper skin, 🌋 Lava under surface, ☀️ Sunburn inside out"),
-        ("Throbbing pain", "🥁 Drum beat hurting, 💓 Heart in wrong place, 🌊 Waves of pain, ⏰ Clock ticking pain"),
-        ("Stabbing feeling", "🗡️ Knife collection inside, ⚡ Zeus throwing bolts, 📍 Pincushion feeling full, 🎯 Arrows everywhere landing"),
-        
-        # Symptoms
-        ("Dizzy and spinning", "🌪️ Tornado head syndrome, 🎠 Carousel won't stop, 🌍 Earth spinning faster, 🎡 Ferris wheel brain"),
-        ("Nausea waves hitting", "🌊 Seasick on land, 🎢 Roller coaster stomach, 🌀 Whirlpool gut feeling, 🚢 Ship deck tilting"),
-        ("Can't breathe well", "🏔️ Mountain air thin, 🌊 Underwater feeling dry, 💨 Wind stolen away, 🎈 Balloon deflating slowly"),
-        ("Heart racing fast", "🏃 Marathon in chest, 🥁 Drum solo heart, 🎠 Galloping horse inside, ⚡ Lightning pulse rate"),
-        ("Fever burning up", "🌡️ Thermometer exploding upward, 🔥 Internal bonfire lit, 🌋 Volcano body temperature, ☀️ Sun trapped inside"),
-        
-        # Medical needs
-        ("Medicine time now", "💊 Pill alarm ringing, ⏰ Dose clock ticking, 🏥 Pharmacy calling name, 💉 Treatment time arrived"),
-        ("Doctor visit needed", "👨‍⚕️ White coat required, 🏥 Hospital trip time, 🩺 Stethoscope appointment made, 🚑 Medical attention seeking"),
-        ("Rest is medicine", "🛌 Bed prescription written, 💤 Sleep therapy needed, 🌙 Moon doctor orders, ⏸️ Pause button healing"),
-        ("Water helps healing", "💧 Liquid medicine flowing, 🌊 Ocean of hydration, 💦 Healing drops needed, 🏔️ Mountain spring cure"),
-        ("Fresh air needed", "🌬️ Wind medicine required, 🌳 Tree therapy calling, 🏔️ Mountain air prescription, 🌊 Ocean breeze healing")
-    ]
-    
-    for i, (input_text, output_text) in enumerate(medical_scenarios):
-        medical.append({
-            'instruction': f'AAC Unique Medical {i+1}',
-            'input': input_text,
-            'output': output_text
-        })
-    
-    return medical
-
-def create_unique_responses_batch():
-    """Create final batch of unique responses"""
-    final_batch = []
-    
-    # Unique situational responses
-    situations = [
-        # School/Learning
-        ("Class is boring", "😴 Brain hibernating deeply, 🌫️ Fog machine activated, ⏰ Clock frozen solid, 🐌 Snail pace learning"),
-        ("Test anxiety high", "🌪️ Tornado mind spinning, ⚡ Electric fear shocking, 🌊 Drowning in questions, 🏔️ Mountain too steep"),
-        ("Homework overwhelming", "📚 Book avalanche falling, 🌊 Tsunami of assignments, 🏔️ Everest pile growing, 🌪️ Paper tornado swirling"),
-        ("Can't understand this", "🧩 Missing puzzle pieces, 🌫️ Fog too thick, 🗺️ Map in Chinese, 🎪 Circus of confusion"),
-        ("Teacher talking forever", "⏳ Eternity passing slowly, 🔄 Loop stuck repeating, 🎭 Monologue never ending, 🌙 Moon lapping sun"),
-        
-        # Technology
-        ("Computer crashed again", "💻 Digital death occurred, 🌪️ Blue screen tornado, ⚡ Electronic heart attack, 🏚️ Silicon graveyard formed"),
-        ("Internet too slow", "🐌 Snail delivering packets, 🕸️ Cobwebs forming waiting, ⏳ Dial-up memories returning, 🦥 Sloth running server"),
-        ("Phone battery dying", "📱 Life support failing, 🔋 Energy vampire winning, ⚰️ Digital funeral approaching, 🕯️ Last light flickering"),
-        ("App not working", "🎪 Digital circus broken, 🎭 Code playing games, 🌪️ Bug tornado spinning, 🏚️ Software haunted house"),
-        ("Lost all data", "💾 Memory hole opened, 🕳️ Digital black hole, 🌊 Data tsunami hit, 🌪️ File tornado struck"),
-        
-        # Weather/Environment
-        ("Too hot outside", "🔥 Satan's sauna open, 🌋 Volcano weather forecast, ☀️ Sun showing off, 🏜️ Desert moved here"),
-        ("Freezing cold here", "❄️ Arctic moved in, 🧊 Ice age returning, ⛄ Snowman's paradise found, 🏔️ Glacier forming slowly"),
-        ("Rain won't stop", "🌧️ Sky's faucet broken, ☔ Umbrella gave up, 🌊 Noah building boats, 💧 Cloud's therapy session"),
-        ("Wind too strong", "🌪️ Tornado's baby brother, 💨 Invisible wrestler fighting, 🌬️ Sky vacuum cleaner, 🍃 Leaf party chaos"),
-        ("Perfect weather today", "🌈 Nature showing off, ☀️ Goldilocks approved weather, 🌸 Earth's good mood, 🎨 Sky painted perfectly"),
-        
-        # Transportation
-        ("Stuck in traffic", "🚗 Parking lot highway, 🐌 Snail race commute, ⏰ Time standing still, 🎪 Bumper car circus"),
-        ("Missing the bus", "🚌 Freedom driving away, 🏃 Chase scene failing, ⏰ Schedule laughing hard, 🎭 Transportation drama unfolding"),
-        ("Car won't start", "🚗 Metal refusing cooperation, 🔋 Juice box empty, ⚡ Spark gave up, 🏚️ Driveway decoration formed"),
-        ("Long journey ahead", "🗺️ Odyssey beginning now, 🌍 Earth tour starting, ⏳ Lifetime trip commencing, 🎢 Adventure roller coaster"),
-        ("Lost directions again", "🧭 Compass drunk again, 🗺️ Map playing tricks, 🌀 Spiral path taken, 🎪 Direction circus performing")
-    ]
-    
-    for i, (input_text, output_text) in enumerate(situations):
-        final_batch.append({
-            'instruction': f'AAC Unique Situation {i+1}',
-            'input': input_text,
-            'output': output_text
-        })
-    
-    return final_batch
-
-def compile_1000_unique():
+def compile_1000_unique(sections=None, categories=None):
     """Compile all 1000+ unique responses"""
     print("🚀 Creating 1000+ Completely Unique Responses")
     print("=" * 50)
     
-    all_unique = []
-    
-    # Generate all categories
-    print("👋 Creating unique greetings...")
-    all_unique.extend(create_unique_greetings())
-    
-    print("😊 Creating unique feelings...")
-    all_unique.extend(create_unique_feelings())
-    
-    print("🎯 Creating unique needs...")
-    all_unique.extend(create_unique_needs())
-    
-    print("🎪 Creating unique activities...")
-    all_unique.extend(create_unique_activities())
-    
-    print("❓ Creating unique questions...")
-    all_unique.extend(create_unique_questions())
-    
-    print("🏥 Creating unique medical...")
-    all_unique.extend(create_unique_medical())
-    
-    print("🌟 Creating final unique batch...")
-    all_unique.extend(create_unique_responses_batch())
-    
     # Ensure every output is unique
-    seen_outputs = set()
-    final_unique = []
+    counts = Counter()
+    stats = {'duplicates': 0}
+    examples = dedup(read_scenarios(SCENARIOS, sections, categories, counts), stats, ('raw_output',))
     
-    for example in all_unique:
-        output = example.get('output', '')
-        if output not in seen_outputs:
-            seen_outputs.add(output)
-            final_unique.append(example)
-    
-    # Save the 1000+ unique examples
+    # Save the 1000+ unique examples as plain instruction/input/output rows
     filename = 'tinkybink_1000_unique_train.jsonl'
-    with open(filename, 'w') as f:
-        for example in final_unique:
-            f.write(json.dumps(example) + '\n')
+    total = write_examples(examples, filename, flat=True)
+    
+    for label, count in counts.items():
+        print(f"✅ {label}: {count} examples")
     
-    print(f"\n✅ Created {len(final_unique)} completely unique responses!")
+    print(f"\n✅ Created {total} completely unique responses!")
     print(f"📁 Saved to: {filename}")
     
     # Show sample
     print("\n📋 Sample of unique responses:")
-    for i in range(min(5, len(final_unique))):
-        print(f"\n{i+1}. Input: {final_unique[i]['input']}")
-        print(f"   Output: {final_unique[i]['output']}")
+    with open(filename, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(islice(f, 5)):
+            example = json.loads(line)
+            print(f"\n{i+1}. Input: {example['input']}")
+            print(f"   Output: {example['output']}")
     
-    return len(final_unique)
+    return total
 
 def main():
     print("🌟 TinkyBink 1000+ Unique Response Creator")
@@ -389,4 +58,4 @@ def main():
     print("📁 Ready to expand training dataset!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
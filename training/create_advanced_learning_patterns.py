@@ -6,6 +6,7 @@ Add intelligent context awareness and adaptive learning
 import json
 import random
 from collections import defaultdict
+from tile_parser import parse_tiles
 
 def create_advanced_learning_patterns():
     """Create advanced contextual learning patterns for AAC AI"""
@@ -756,34 +757,8 @@ def create_learning_optimization_patterns(base_examples):
     return examples
 
 def parse_output_to_tiles(output_text):
-    """Parse output into tile format"""
-    tiles = []
-    parts = output_text.split(', ')
-    
-    for i, part in enumerate(parts[:4]):
-        part = part.strip()
-        if not part:
-            continue
-            
-        emoji = ""
-        words = part
-        
-        for char in part:
-            if ord(char) > 127:
-                emoji = char
-                words = part.replace(char, '').strip()
-                break
-        
-        if not emoji:
-            emoji = "💬"
-        
-        tiles.append({
-            "emoji": emoji,
-            "words": words,
-            "tile_id": f"tile_{i+1}"
-        })
-    
-    return tiles
+    """Parse output into tile format (max 4 tiles)"""
+    return parse_tiles(output_text, limit=4, default_emoji="💬")
 
 if __name__ == "__main__":
     total = create_advanced_learning_patterns()
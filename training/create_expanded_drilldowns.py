@@ -4,6 +4,7 @@ Create Expanded Multi-Layer Drill-Downs
 Add holidays, weather, emotions, and more complex navigation
 """
 import json
+from tile_parser import parse_tiles
 
 def create_expanded_drilldowns():
     """Create expanded multi-layer drill-down examples"""
@@ -284,34 +285,8 @@ def create_drilldown_example(input_text, output_text, category, instruction):
     return example
 
 def parse_output_to_tiles(output_text):
-    """Parse output into tile format"""
-    tiles = []
-    parts = output_text.split(', ')
-    
-    for i, part in enumerate(parts[:4]):
-        part = part.strip()
-        if not part:
-            continue
-            
-        emoji = ""
-        words = part
-        
-        for char in part:
-            if ord(char) > 127:
-                emoji = char
-                words = part.replace(char, '').strip()
-                break
-        
-        if not emoji:
-            emoji = "💬"
-        
-        tiles.append({
-            "emoji": emoji,
-            "words": words,
-            "tile_id": f"tile_{i+1}"
-        })
-    
-    return tiles
+    """Parse output into tile format (max 4 tiles)"""
+    return parse_tiles(output_text, limit=4, default_emoji="💬")
 
 def generate_drilldown_sentence(tiles, category):
     """Generate contextual drill-down sentence"""
@@ -6,6 +6,7 @@ Transform 4000+ examples into complete conversation trees
 import json
 from collections import defaultdict
 import re
+from conversation_pack import export_pack
 
 def create_full_conversational_logic():
     """Create complete conversational logic from all examples"""
@@ -397,6 +398,10 @@ def save_conversational_logic(trees):
     
     print(f"✅ Saved: tinkybink_full_conversational_logic.json")
     
+    # Export indexed binary pack for runtime loading
+    export_pack(logic_system, 'tinkybink_full_conversational_logic.tbpack', 'conversational_logic')
+    print(f"✅ Saved: tinkybink_full_conversational_logic.tbpack")
+    
     # Create example conversation flows
     example_flows = create_example_conversation_flows(trees)
     
@@ -8,6 +8,7 @@ import re
 from typing import Dict, List, Tuple, Set
 from collections import defaultdict
 import random
+import text_features
 
 class AACLogicTreeBuilder:
     def __init__(self):
@@ -75,37 +76,7 @@ class AACLogicTreeBuilder:
     
     def classify_question_type(self, text: str) -> str:
         """Classify the type of question for decision tree logic"""
-        text = text.lower()
-        
-        # Yes/No questions
-        if any(starter in text for starter in ['do you', 'are you', 'will you', 'can you', 'would you']):
-            return 'yes_no_question'
-        
-        # Choice questions  
-        if ' or ' in text and text.count(' or ') <= 3:
-            return 'choice_question'
-        
-        # Feeling/emotion questions
-        if any(word in text for word in ['feel', 'feeling', 'mood', 'emotion', 'happy', 'sad']):
-            return 'emotion_question'
-        
-        # Need/want questions
-        if any(word in text for word in ['need', 'want', 'like', 'prefer']):
-            return 'preference_question'
-        
-        # Medical/health questions
-        if any(word in text for word in ['pain', 'hurt', 'sick', 'medicine', 'doctor', 'therapy']):
-            return 'medical_question'
-        
-        # Activity questions
-        if any(word in text for word in ['go', 'play', 'do', 'watch', 'eat', 'sleep']):
-            return 'activity_question'
-        
-        # Time-related questions
-        if any(word in text for word in ['time', 'when', 'now', 'later', 'ready']):
-            return 'timing_question'
-        
-        return 'general_question'
+        return text_features.classify_question_type(text)
     
     def extract_context_words(self, text: str) -> List[str]:
         """Extract important context words that should trigger specific responses"""
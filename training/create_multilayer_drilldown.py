@@ -4,6 +4,7 @@ Create Multi-Layer Drill-Down Conversation System
 Build contextual follow-up responses with multiple layers
 """
 import json
+from tile_parser import parse_tiles
 
 def create_multilayer_drilldown():
     """Create multi-layer drill-down conversation examples"""
@@ -309,34 +310,8 @@ def create_transportation_drilldowns():
     return examples
 
 def parse_output_to_tiles(output_text):
-    """Parse output into tile format"""
-    tiles = []
-    parts = output_text.split(', ')
-    
-    for i, part in enumerate(parts[:4]):
-        part = part.strip()
-        if not part:
-            continue
-            
-        emoji = ""
-        words = part
-        
-        for char in part:
-            if ord(char) > 127:
-                emoji = char
-                words = part.replace(char, '').strip()
-                break
-        
-        if not emoji:
-            emoji = "💬"
-        
-        tiles.append({
-            "emoji": emoji,
-            "words": words,
-            "tile_id": f"tile_{i+1}"
-        })
-    
-    return tiles
+    """Parse output into tile format (max 4 tiles)"""
+    return parse_tiles(output_text, limit=4, default_emoji="💬")
 
 def generate_drilldown_sentence(tiles, category):
     """Generate contextual drill-down sentence"""
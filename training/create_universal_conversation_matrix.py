@@ -6,6 +6,8 @@ Connect ALL 4000+ responses into one massive conversation network
 import json
 from collections import defaultdict
 import networkx as nx
+from conversation_pack import export_pack
+from text_normalizer import fold
 
 def create_universal_conversation_matrix():
     """Create universal conversation matrix connecting all responses"""
@@ -116,6 +118,7 @@ def find_potential_follows(tile_word, all_nodes, current_node):
     """Find nodes that could naturally follow a tile selection"""
     
     potential_follows = []
+    tile_word = fold(tile_word)
     
     # Keywords that indicate follow-up
     follow_patterns = [
@@ -135,7 +138,7 @@ def find_potential_follows(tile_word, all_nodes, current_node):
         if node_id == current_node['id']:
             continue
             
-        input_lower = node['input'].lower()
+        input_lower = fold(node['input'])
         
         # Check if this node's input relates to the tile word
         relevance_score = 0
@@ -235,7 +238,7 @@ def generate_all_conversation_paths(network, examples):
     
     for node_id in G.nodes():
         node = G.nodes[node_id]
-        input_lower = node['input'].lower()
+        input_lower = fold(node['input'])
         
         # Check if it's a good starter
         if any(keyword in input_lower for keyword in greeting_keywords) or G.in_degree(node_id) == 0:
@@ -378,6 +381,10 @@ def save_universal_system(matrix, network, paths):
     
     print(f"✅ Saved: tinkybink_conversation_starters.json")
     
+    # Export indexed binary pack for runtime loading
+    export_pack(dict(starters), 'tinkybink_conversation_starters.tbpack', 'conversation_starters')
+    print(f"✅ Saved: tinkybink_conversation_starters.tbpack")
+    
     # Save example conversations
     example_convs = {
         "total_examples": len(paths['complete_conversations']),
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Dataset Profiler
+One streaming pass over any number of JSONL corpora that produces the
+category breakdown, emotion distribution, duplicate counts, most
+duplicated outputs, tile-count histogram and emoji coverage that the
+merge and dedup scripts each used to recompute from in-memory lists.
+
+Memory is bounded regardless of corpus size: output and emoji frequencies
+live in count-min sketches, distinct counts in HyperLogLog registers and
+numeric distributions in fixed-size streaming histograms. Only the few
+top candidates for "most duplicated" keep their text.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from corpus_compiler import read_jsonl
+from tile_parser import parse_column_flat
+
+SUMMARY_FILE = 'dataset_profile_summary.json'
+BATCH_SIZE = 4096
+
+def hash64(texts: Iterable[str]) -> np.ndarray:
+    """64-bit blake2b digests of texts as a uint64 array"""
+    return np.fromiter((int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+                        for text in texts), dtype=np.uint64)
+
+class CountMinSketch:
+    """Frequency estimates that never undercount; error is at most total * e / width"""
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+        self.total = 0
+
+    def _columns(self, hashes: np.ndarray) -> np.ndarray:
+        # Kirsch-Mitzenmacher: row i uses h1 + i * h2
+        low = hashes & np.uint64(0xFFFFFFFF)
+        high = hashes >> np.uint64(32)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((low[None, :] + rows * high[None, :]) % np.uint64(self.width)).astype(np.intp)
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        """Count every hash once; returns the updated estimate for each"""
+        columns = self._columns(hashes)
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], 1)
+        self.total += len(hashes)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def estimate(self, hashes: np.ndarray) -> np.ndarray:
+        columns = self._columns(hashes)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+class HyperLogLog:
+    """Distinct-count estimate with about 1.04 / sqrt(2 ** precision) relative error"""
+
+    def __init__(self, precision: int = 14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, hashes: np.ndarray):
+        if not len(hashes):
+            return
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        # Rank of the first set bit in the next 32 bits
+        rest = ((hashes << np.uint64(self.precision)) >> np.uint64(32)).astype(np.float64)
+        rank = np.where(rest > 0, 32 - np.floor(np.log2(np.maximum(rest, 1))), 33).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+class StreamingHistogram:
+    """Ben-Haim/Tom-Tov histogram: at most max_bins (centroid, count) bins.
+
+    Exact while there are no more than max_bins distinct values, as with
+    tile counts; otherwise the closest bins are merged.
+    """
+
+    def __init__(self, max_bins: int = 32):
+        self.max_bins = max_bins
+        self.bins: List[List[float]] = []
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float, count: int = 1):
+        self.count += count
+        self.total += value * count
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        for i, (centroid, _) in enumerate(self.bins):
+            if centroid == value:
+                self.bins[i][1] += count
+                return
+            if centroid > value:
+                self.bins.insert(i, [value, count])
+                break
+        else:
+            self.bins.append([value, count])
+        if len(self.bins) > self.max_bins:
+            gaps = [self.bins[i + 1][0] - self.bins[i][0] for i in range(len(self.bins) - 1)]
+            i = gaps.index(min(gaps))
+            (left, left_count), (right, right_count) = self.bins[i], self.bins[i + 1]
+            merged = left_count + right_count
+            self.bins[i:i + 2] = [[(left * left_count + right * right_count) / merged, merged]]
+
+    def update(self, values: Iterable[float]):
+        for value, count in sorted(Counter(values).items()):
+            self.add(value, count)
+
+    def quantile(self, q: float) -> float:
+        target = q * self.count
+        seen = 0
+        for centroid, count in self.bins:
+            seen += count
+            if seen >= target:
+                return centroid
+        return self.maximum
+
+    def to_dict(self) -> Dict:
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count, 2),
+            'min': self.minimum,
+            'max': self.maximum,
+            'p50': round(self.quantile(0.5), 2),
+            'p90': round(self.quantile(0.9), 2),
+            'bins': {f"{centroid:g}": count for centroid, count in self.bins},
+        }
+
+class TopK:
+    """Bounded set of the keys with the highest sketch estimates seen so far"""
+
+    def __init__(self, k: int = 10, slack: int = 4):
+        self.k = k
+        self.capacity = k * slack
+        self.counts: Dict[str, int] = {}
+
+    def offer(self, keys: Iterable[str], estimates: Iterable[int], minimum: int = 1):
+        floor = min(self.counts.values()) if len(self.counts) >= self.capacity else minimum
+        for key, estimate in zip(keys, estimates):
+            if estimate >= max(floor, minimum) or key in self.counts:
+                self.counts[key] = int(estimate)
+        if len(self.counts) > 2 * self.capacity:
+            self.counts = dict(self.top(self.capacity))
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:n or self.k]
+
+def example_fields(example: Dict) -> Tuple[str, str, str, Optional[str], Optional[str], Optional[int]]:
+    """(output, input, instruction, category, emotion_level, tiles) for either example schema"""
+    aac = example.get('aac_response') or {}
+    usage = aac.get('usage_data') or {}
+    metadata = example.get('metadata') or {}
+    output = example.get('raw_output') or example.get('output') or ''
+    tiles = aac.get('tiles')
+    return (output, str(example.get('input', '')), str(example.get('instruction', '')),
+            usage.get('category') or example.get('category') or metadata.get('category'),
+            usage.get('emotion_level'), len(tiles) if isinstance(tiles, list) else None)
+
+class DatasetProfiler:
+    """Single-pass, bounded-memory statistics for AAC corpora"""
+
+    def __init__(self, top: int = 10, sketch_width: int = 1 << 16, precision: int = 14):
+        self.examples = 0
+        self.files: Dict[str, int] = {}
+        self.categories = Counter()
+        self.emotion_levels = Counter()
+        self.output_counts = CountMinSketch(sketch_width)
+        self.emoji_counts = CountMinSketch(sketch_width)
+        self.distinct_outputs = HyperLogLog(precision)
+        self.distinct_inputs = HyperLogLog(precision)
+        self.distinct_instructions = HyperLogLog(precision)
+        self.distinct_emoji = HyperLogLog(precision)
+        self.top_outputs = TopK(top)
+        self.top_emoji = TopK(top)
+        self.tile_counts = StreamingHistogram()
+        self.output_words = StreamingHistogram()
+
+    def add_batch(self, examples: List[Dict]):
+        rows = [example_fields(example) for example in examples]
+        if not rows:
+            return
+        self.examples += len(rows)
+        outputs = [row[0] for row in rows]
+
+        for _, _, _, category, emotion_level, _ in rows:
+            self.categories[category or 'uncategorized'] += 1
+            if emotion_level:
+                self.emotion_levels[emotion_level] += 1
+
+        output_hashes = hash64(outputs)
+        self.distinct_outputs.add(output_hashes)
+        self.distinct_inputs.add(hash64(row[1] for row in rows))
+        self.distinct_instructions.add(hash64(row[2] for row in rows))
+        self.top_outputs.offer(outputs, self.output_counts.add(output_hashes), minimum=2)
+
+        # One regex pass over the batch gives both tile counts and emoji
+        offsets, emojis, _ = parse_column_flat(outputs)
+        self.tile_counts.update(row[5] if row[5] is not None else offsets[i + 1] - offsets[i]
+                                for i, row in enumerate(rows))
+        self.output_words.update(len(output.split()) for output in outputs)
+        emojis = [emoji for emoji in emojis if emoji]
+        if emojis:
+            emoji_hashes = hash64(emojis)
+            self.distinct_emoji.add(emoji_hashes)
+            self.top_emoji.offer(emojis, self.emoji_counts.add(emoji_hashes))
+
+    def add_file(self, path: str, batch_size: int = BATCH_SIZE):
+        count = 0
+        batch = []
+        for example in read_jsonl(path):
+            batch.append(example)
+            if len(batch) >= batch_size:
+                self.add_batch(batch)
+                count += len(batch)
+                batch = []
+        self.add_batch(batch)
+        self.files[path] = count + len(batch)
+
+    def memory_bytes(self) -> int:
+        sketches = (self.output_counts.table, self.emoji_counts.table, self.distinct_outputs.registers,
+                    self.distinct_inputs.registers, self.distinct_instructions.registers,
+                    self.distinct_emoji.registers)
+        return sum(array.nbytes for array in sketches)
+
+    def summary(self) -> Dict:
+        distinct = min(self.distinct_outputs.count(), self.examples)
+        return {
+            "dataset_name": "TinkyBink Dataset Profile",
+            "files": self.files,
+            "total_examples": self.examples,
+            "distinct_outputs_estimate": distinct,
+            "duplicates_estimate": self.examples - distinct,
+            "uniqueness_percentage": round(100 * distinct / self.examples, 2) if self.examples else 0.0,
+            "distinct_inputs_estimate": min(self.distinct_inputs.count(), self.examples),
+            "instruction_types_estimate": min(self.distinct_instructions.count(), self.examples),
+            "total_categories": len(self.categories),
+            "category_breakdown": dict(self.categories.most_common()),
+            "emotion_distribution": dict(sorted(self.emotion_levels.items())),
+            "average_complexity": round(self.tile_counts.total / self.tile_counts.count, 2)
+            if self.tile_counts.count else 0,
+            "tile_count_histogram": self.tile_counts.to_dict(),
+            "output_word_histogram": self.output_words.to_dict(),
+            "most_duplicated_outputs": [{"output": output, "count": count}
+                                        for output, count in self.top_outputs.top()],
+            "distinct_emoji_estimate": self.distinct_emoji.count(),
+            "top_emoji": dict(self.top_emoji.top()),
+            "sketch_memory_bytes": self.memory_bytes(),
+        }
+
+def profile(paths: Iterable[str], top: int = 10) -> Dict:
+    """Profile JSONL files in one pass; returns the summary dict"""
+    profiler = DatasetProfiler(top)
+    start = time.perf_counter()
+    for path in paths:
+        profiler.add_file(path)
+    summary = profiler.summary()
+    summary["profile_seconds"] = round(time.perf_counter() - start, 3)
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-pass statistics for AAC JSONL corpora")
+    parser.add_argument('paths', nargs='*', help="JSONL files or globs (default: tinkybink_*.jsonl)")
+    parser.add_argument('--output', default=SUMMARY_FILE, help="Summary JSON")
+    parser.add_argument('--top', type=int, default=10, help="Most duplicated outputs to keep")
+    args = parser.parse_args()
+
+    paths = sorted({path for pattern in (args.paths or ['tinkybink_*.jsonl'])
+                    for path in (glob.glob(pattern) or [pattern]) if os.path.exists(path)})
+
+    print("📈 TinkyBink Dataset Profiler")
+    print("=" * 50)
+    summary = profile(paths, args.top)
+
+    print(f"📁 {len(paths)} files, {summary['total_examples']:,} examples in {summary['profile_seconds']:.2f}s")
+    print(f"✅ ~{summary['distinct_outputs_estimate']:,} distinct outputs "
+          f"(~{summary['duplicates_estimate']:,} duplicates, {summary['uniqueness_percentage']}% unique)")
+    print(f"🎯 {summary['total_categories']} categories | 📊 {summary['average_complexity']} tiles per response "
+          f"| 😀 ~{summary['distinct_emoji_estimate']:,} distinct emoji")
+    print(f"\n🔍 Most duplicated outputs:")
+    for entry in summary['most_duplicated_outputs']:
+        print(f"   {entry['count']}x: {entry['output'][:80]}")
+    print(f"\n🧠 Sketch memory: {summary['sketch_memory_bytes'] / 1024:,.0f} KB")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    print(f"📋 Summary: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,65 @@ Emoji Logic Integrator
 Hooks up emoji mapping with all JSON tile data and logic trees
 """
 import json
+import os
 import re
+import time
 from typing import Dict, List, Set
 from collections import defaultdict
+from functools import lru_cache
+from phrase_trie import PhraseTrie, tokenize_words
+
+EMOJI_MAPPINGS_FILE = 'aac_emoji_mappings.json'
+
+# Category fallbacks, checked in order: (category markers, [(keywords, emoji)], default)
+CONTEXT_RULES = [
+    (('medical', 'health'), [
+        (frozenset(['pain', 'hurt', 'sick']), '🤕'),
+        (frozenset(['better', 'good', 'fine']), '😌'),
+        (frozenset(['medicine', 'pill', 'medication']), '💊'),
+    ], '🏥'),
+    (('emotion', 'feeling'), [
+        (frozenset(['happy', 'joy', 'glad']), '😊'),
+        (frozenset(['sad', 'upset', 'cry']), '😢'),
+        (frozenset(['angry', 'mad', 'frustrated']), '😠'),
+    ], '💭'),
+    (('food', 'cooking'), [
+        (frozenset(['hungry', 'eat', 'meal']), '🍽️'),
+        (frozenset(['drink', 'thirsty', 'water']), '🥤'),
+    ], '🍎'),
+    (('school', 'classroom'), [
+        (frozenset(['read', 'book', 'study']), '📖'),
+        (frozenset(['write', 'pencil', 'pen']), '✏️'),
+    ], '🏫'),
+    (('play', 'game'), [
+        (frozenset(['toy', 'doll', 'block']), '🧸'),
+        (frozenset(['ball', 'sport']), '⚽'),
+    ], '🎮'),
+    (('transportation', 'travel'), [
+        (frozenset(['car', 'drive']), '🚗'),
+        (frozenset(['bus', 'public']), '🚌'),
+        (frozenset(['walk', 'foot']), '🚶'),
+    ], '🚗'),
+]
+
+EMOJI_CACHE_SIZE = 4096
+
+FALLBACK_RULES = [
+    (frozenset(['i', 'me', 'my', 'want', 'need']), '👤'),
+    (frozenset(['you', 'help', 'please']), '🤝'),
+]
 
 class EmojiLogicIntegrator:
-    def __init__(self):
+    def __init__(self, mappings_file: str = EMOJI_MAPPINGS_FILE):
         self.emoji_mappings = {}
         self.contextual_emojis = {}
         self.category_emojis = {}
+        # Per-instance memo of the resolvers, bounded since keys are free text
+        self._contextual_emoji = lru_cache(maxsize=EMOJI_CACHE_SIZE)(self._resolve_contextual_emoji)
+        self._response_emoji = lru_cache(maxsize=EMOJI_CACHE_SIZE)(self._resolve_response_emoji)
         self.load_emoji_mappings()
+        self.load_saved_mappings(mappings_file)
+        self.phrase_trie = PhraseTrie(self.emoji_mappings)
     
     def load_emoji_mappings(self):
         """Load comprehensive emoji mappings for AAC tiles"""
@@ -109,6 +158,23 @@ class EmojiLogicIntegrator:
             'money': '💰'
         }
     
+    def load_saved_mappings(self, mappings_file: str):
+        """Merge direct mappings previously saved to aac_emoji_mappings.json"""
+        if not os.path.exists(mappings_file):
+            return
+        
+        try:
+            with open(mappings_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ Could not read {mappings_file}: {e}")
+            return
+        
+        for phrase, emoji in saved.get('direct_mappings', {}).items():
+            self.emoji_mappings.setdefault(phrase, emoji)
+        for cat_key, emoji in saved.get('category_mappings', {}).items():
+            self.category_emojis.setdefault(cat_key, emoji)
+    
     def extract_emoji_patterns_from_tiles(self, json_files: List[str]) -> Dict:
         """Extract emoji patterns from all tile JSON files"""
         emoji_patterns = defaultdict(list)
@@ -162,12 +228,15 @@ class EmojiLogicIntegrator:
     
     def generate_contextual_emoji(self, text: str, category: str) -> str:
         """Generate contextually appropriate emoji for text"""
-        text_lower = text.lower()
+        return self._contextual_emoji(text, category)
+    
+    def _resolve_contextual_emoji(self, text: str, category: str) -> str:
+        tokens = tokenize_words(text)
         
-        # First check direct mappings
-        for word, emoji in self.emoji_mappings.items():
-            if word in text_lower:
-                return emoji
+        # First check direct mappings (longest whole-phrase match wins)
+        emoji = self.phrase_trie.best_match_tokens(tokens)
+        if emoji:
+            return emoji
         
         # Then check category-based mappings
         for cat_key, emoji in self.category_emojis.items():
@@ -175,66 +244,19 @@ class EmojiLogicIntegrator:
                 return emoji
         
         # Context-specific logic
-        if 'medical' in category or 'health' in category:
-            if any(word in text_lower for word in ['pain', 'hurt', 'sick']):
-                return '🤕'
-            elif any(word in text_lower for word in ['better', 'good', 'fine']):
-                return '😌'
-            elif any(word in text_lower for word in ['medicine', 'pill', 'medication']):
-                return '💊'
-            else:
-                return '🏥'
-        
-        elif 'emotion' in category or 'feeling' in category:
-            if any(word in text_lower for word in ['happy', 'joy', 'glad']):
-                return '😊'
-            elif any(word in text_lower for word in ['sad', 'upset', 'cry']):
-                return '😢'
-            elif any(word in text_lower for word in ['angry', 'mad', 'frustrated']):
-                return '😠'
-            else:
-                return '💭'
-        
-        elif 'food' in category or 'cooking' in category:
-            if any(word in text_lower for word in ['hungry', 'eat', 'meal']):
-                return '🍽️'
-            elif any(word in text_lower for word in ['drink', 'thirsty', 'water']):
-                return '🥤'
-            else:
-                return '🍎'
-        
-        elif 'school' in category or 'classroom' in category:
-            if any(word in text_lower for word in ['read', 'book', 'study']):
-                return '📖'
-            elif any(word in text_lower for word in ['write', 'pencil', 'pen']):
-                return '✏️'
-            else:
-                return '🏫'
-        
-        elif 'play' in category or 'game' in category:
-            if any(word in text_lower for word in ['toy', 'doll', 'block']):
-                return '🧸'
-            elif any(word in text_lower for word in ['ball', 'sport']):
-                return '⚽'
-            else:
-                return '🎮'
-        
-        elif 'transportation' in category or 'travel' in category:
-            if any(word in text_lower for word in ['car', 'drive']):
-                return '🚗'
-            elif any(word in text_lower for word in ['bus', 'public']):
-                return '🚌'
-            elif any(word in text_lower for word in ['walk', 'foot']):
-                return '🚶'
-            else:
-                return '🚗'
+        words = set(tokens)
+        for markers, keyword_rules, default in CONTEXT_RULES:
+            if any(marker in category for marker in markers):
+                for keywords, emoji in keyword_rules:
+                    if words & keywords:
+                        return emoji
+                return default
         
         # Default fallback emojis
-        if any(word in text_lower for word in ['i', 'me', 'my', 'want', 'need']):
-            return '👤'
-        elif any(word in text_lower for word in ['you', 'help', 'please']):
-            return '🤝'
-        elif '?' in text:
+        for keywords, emoji in FALLBACK_RULES:
+            if words & keywords:
+                return emoji
+        if '?' in text:
             return '❓'
         elif '!' in text:
             return '❗'
@@ -284,15 +306,17 @@ class EmojiLogicIntegrator:
     
     def get_best_emoji_for_response(self, response: str, context: Dict) -> str:
         """Get the best emoji for a specific response in context"""
+        return self._response_emoji(response, context.get('input', '').lower())
+    
+    def _resolve_response_emoji(self, response: str, input_text: str) -> str:
         response_lower = response.lower()
         
-        # Check direct mappings first
-        for word, emoji in self.emoji_mappings.items():
-            if word in response_lower:
-                return emoji
+        # Check direct mappings first (longest whole-phrase match wins)
+        emoji = self.phrase_trie.best_match(response_lower)
+        if emoji:
+            return emoji
         
         # Context-aware mapping
-        input_text = context.get('input', '').lower()
         
         # Medical context
         if any(word in input_text for word in ['pain', 'therapy', 'doctor', 'medicine']):
@@ -417,8 +441,10 @@ class EmojiLogicIntegrator:
         
         # Step 2: Enhance existing training data
         print("✨ Enhancing training data with emojis...")
+        start = time.perf_counter()
         enhanced_examples = self.create_emoji_enhanced_training_data('tinkybink_master_train.jsonl')
-        print(f"   Enhanced {len(enhanced_examples)} training examples")
+        elapsed = time.perf_counter() - start
+        print(f"   Enhanced {len(enhanced_examples)} training examples in {elapsed:.2f}s")
         
         # Step 3: Generate emoji-specific training
         print("🎯 Generating emoji logic training examples...")
@@ -454,7 +480,6 @@ def main():
     integrator = EmojiLogicIntegrator()
     
     # Discover JSON files
-    import os
     json_files = [f for f in os.listdir('.') if f.startswith('tinkybink_') and f.endswith('.json')]
     print(f"🔍 Found {len(json_files)} JSON tile files")
     
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Emotion Vectors
+Maps the language-specific emotion keys of the es, zh and ru node files
+onto one canonical float32 schema and keeps every node in a single NumPy
+matrix, so "responses with a similar emotional profile" is one vectorized
+distance computation across all languages.
+"""
+import os
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from multilingual_index import LANGUAGE_DIRS, ROOT_DIR, load_nodes
+
+CANONICAL_DIMENSIONS = ('valence', 'arousal', 'expressiveness', 'warmth')
+
+# key -> (canonical dimension, inverted); every source value is in [0, 1].
+# 含蓄度 measures reserve, the opposite of expressiveness.
+EMOTION_SCHEMAS = {
+    'es': {
+        'valencia': ('valence', False),
+        'activacion': ('arousal', False),
+        'expresividad': ('expressiveness', False),
+        'pasion': ('warmth', False),
+    },
+    'zh': {
+        '价值性': ('valence', False),
+        '激活度': ('arousal', False),
+        '含蓄度': ('expressiveness', True),
+        '和谐性': ('warmth', False),
+    },
+    'ru': {
+        'валентность': ('valence', False),
+        'активация': ('arousal', False),
+        'откровенность': ('expressiveness', False),
+        'душевность': ('warmth', False),
+    },
+}
+
+_DIMENSION_INDEX = {dimension: i for i, dimension in enumerate(CANONICAL_DIMENSIONS)}
+
+# Dimensions a node does not specify sit at the neutral midpoint
+NEUTRAL = 0.5
+
+def emotion_vector(emotion: Dict[str, float], lang: str) -> np.ndarray:
+    """Canonical vector for one node's emotion dict; unknown keys are ignored"""
+    vector = np.full(len(CANONICAL_DIMENSIONS), NEUTRAL, dtype=np.float32)
+    schema = EMOTION_SCHEMAS.get(lang, {})
+    for key, value in emotion.items():
+        if key in schema:
+            dimension, inverted = schema[key]
+            vector[_DIMENSION_INDEX[dimension]] = 1.0 - value if inverted else value
+    return vector
+
+class EmotionMatrix:
+    """All nodes' canonical emotion vectors, one row per node"""
+
+    def __init__(self, nodes: List[Dict]):
+        self.nodes = [{'lang': node['lang'], 'id': node['id'], 'text': node['text'],
+                       'emoji': node['emoji'], 'category': node['category']} for node in nodes]
+        self.vectors = np.stack([emotion_vector(node.get('emotion') or {}, node['lang'])
+                                 for node in nodes]) if nodes else \
+            np.empty((0, len(CANONICAL_DIMENSIONS)), dtype=np.float32)
+        self.langs = np.array([node['lang'] for node in nodes])
+        self._positions = {(node['lang'], node['id']): i for i, node in enumerate(nodes)}
+
+    @classmethod
+    def from_directories(cls, root: str = ROOT_DIR) -> 'EmotionMatrix':
+        nodes = []
+        for lang, dirname in LANGUAGE_DIRS.items():
+            directory = os.path.join(root, dirname)
+            if os.path.isdir(directory):
+                nodes.extend(dict(node, lang=lang) for node in load_nodes(directory))
+        return cls(nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def vector(self, lang: str, node_id: str) -> np.ndarray:
+        return self.vectors[self._positions[(lang, node_id)]]
+
+    def nearest(self, query, k: int = 5, langs: Optional[Sequence[str]] = None,
+                exclude: Optional[int] = None) -> List[Dict]:
+        """k closest nodes by Euclidean distance, optionally limited to some languages"""
+        distances = self.distances(np.asarray(query, dtype=np.float32)[None, :])[0]
+        if langs is not None:
+            distances[~np.isin(self.langs, list(langs))] = np.inf
+        if exclude is not None:
+            distances[exclude] = np.inf
+        k = min(k, int(np.isfinite(distances).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top], kind='stable')]
+        return [dict(self.nodes[i], distance=float(np.sqrt(distances[i]))) for i in top]
+
+    def similar_to(self, lang: str, node_id: str, k: int = 5,
+                   langs: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Nodes whose emotional profile is closest to the given node's"""
+        position = self._positions[(lang, node_id)]
+        return self.nearest(self.vectors[position], k, langs, exclude=position)
+
+    def distances(self, queries: np.ndarray) -> np.ndarray:
+        """Squared distances from each query row to every node, shape (queries, nodes)"""
+        norms = np.einsum('ij,ij->i', self.vectors, self.vectors)
+        query_norms = np.einsum('ij,ij->i', queries, queries)
+        squared = query_norms[:, None] - 2.0 * queries @ self.vectors.T + norms[None, :]
+        return np.maximum(squared, 0.0)
+
+def main():
+    print("💞 TinkyBink Emotion Vectors")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    matrix = EmotionMatrix.from_directories()
+    load_ms = 1000 * (time.perf_counter() - start)
+    print(f"✅ {len(matrix)} nodes x {len(CANONICAL_DIMENSIONS)} dims "
+          f"({matrix.vectors.nbytes:,} bytes float32) in {load_ms:.1f} ms")
+
+    if not len(matrix):
+        return
+
+    sample = matrix.nodes[0]
+    print(f"\n🔎 Closest to {sample['emoji']} {sample['text']} ({sample['lang']}):")
+    for match in matrix.similar_to(sample['lang'], sample['id'], k=6):
+        print(f"   {match['lang']} {match['emoji']} {match['text']:<24} {match['distance']:.3f}")
+
+    start = time.perf_counter()
+    all_pairs = matrix.distances(matrix.vectors)
+    print(f"\n⚡ All {all_pairs.size:,} pairwise distances in "
+          f"{1000 * (time.perf_counter() - start):.2f} ms")
+
+    rounds = 1000
+    start = time.perf_counter()
+    for i in range(rounds):
+        matrix.similar_to(matrix.nodes[i % len(matrix)]['lang'], matrix.nodes[i % len(matrix)]['id'])
+    print(f"⚡ similar_to: {1e6 * (time.perf_counter() - start) / rounds:.0f} µs per query")
+
+if __name__ == "__main__":
+    main()
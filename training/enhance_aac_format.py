@@ -3,10 +3,21 @@
 Enhance AAC Format with Word-Emoji-Sentence-Tracking
 Converts existing responses to full AAC format
 """
+import argparse
 import json
-import re
+import os
+import time
+from collections import defaultdict
+from itertools import islice
+from multiprocessing import Pool
+from text_features import extract_features
+import tile_parser
 
-def enhance_aac_format():
+STAGES = ['decode', 'parse_tiles', 'generate_spoken_sentence', 'extract_features', 'encode']
+
+def enhance_aac_format(input_file="tinkybink_master_unique_final.jsonl",
+                       output_file="tinkybink_enhanced_aac_final.jsonl",
+                       workers=None, chunk_size=250, ordered=True):
     """Convert responses to full AAC format with tracking"""
     
     print("🌟 TinkyBink AAC Format Enhancer")
@@ -14,48 +25,116 @@ def enhance_aac_format():
     print("🔄 Converting to word-emoji-sentence-tracking format")
     print()
     
-    # Load master unique dataset
-    input_file = "tinkybink_master_unique_final.jsonl"
-    enhanced_examples = []
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    workers = workers or os.cpu_count() or 1
+    print(f"⚙️ Workers: {workers} | chunk size: {chunk_size} | {'ordered' if ordered else 'unordered'} output")
+    
+    start = time.perf_counter()
+    stage_totals = defaultdict(float)
+    enhanced_count = 0
+    processed = 0
+    first_example = None
+    
+    # Stream chunks of lines through the pool and write results as they arrive
+    with open(input_file, 'r', encoding='utf-8') as f_in, \
+         open(output_file, 'w', encoding='utf-8') as f_out:
+        chunks = read_chunks(f_in, chunk_size)
+        
+        if workers == 1:
+            results = map(enhance_chunk, chunks)
+            pool = None
+        else:
+            pool = Pool(workers)
+            mapper = pool.imap if ordered else pool.imap_unordered
+            results = mapper(enhance_chunk, chunks)
+        
+        try:
+            for lines_read, encoded, errors, timings in results:
+                for line_num, error in errors:
+                    print(f"   ❌ JSON error on line {line_num}: {error}")
                 
-            try:
-                example = json.loads(line)
-                enhanced = enhance_single_example(example)
-                if enhanced:
-                    enhanced_examples.append(enhanced)
-                    
-                if line_num % 500 == 0:
-                    print(f"   ✅ Processed {line_num} examples...")
-                    
-            except json.JSONDecodeError as e:
-                print(f"   ❌ JSON error on line {line_num}: {e}")
-                continue
-    
-    print(f"\n📊 Enhanced {len(enhanced_examples)} examples")
-    
-    # Save enhanced dataset
-    output_file = "tinkybink_enhanced_aac_final.jsonl"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for example in enhanced_examples:
-            f.write(json.dumps(example, ensure_ascii=False) + '\n')
-    
+                for line in encoded:
+                    f_out.write(line + '\n')
+                if encoded and first_example is None:
+                    first_example = encoded[0]
+                
+                for stage, seconds in timings.items():
+                    stage_totals[stage] += seconds
+                
+                enhanced_count += len(encoded)
+                previous = processed
+                processed += lines_read
+                if processed // 500 > previous // 500:
+                    print(f"   ✅ Processed {processed} examples...")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+    
+    elapsed = time.perf_counter() - start
+    print(f"\n📊 Enhanced {enhanced_count} examples in {elapsed:.2f}s")
     print(f"✅ Saved enhanced dataset: {output_file}")
     
+    # Stage timings are summed across workers (CPU time spent in each stage)
+    print(f"\n⏱️ Per-stage timing (summed across workers):")
+    stage_sum = sum(stage_totals.values()) or 1.0
+    for stage in STAGES:
+        seconds = stage_totals.get(stage, 0.0)
+        print(f"   {stage:<26} {seconds * 1000:9.1f} ms  ({seconds / stage_sum:5.1%})")
+    
     # Show example
-    if enhanced_examples:
+    if first_example:
         print(f"\n🔍 EXAMPLE ENHANCED FORMAT:")
-        example = enhanced_examples[0]
-        print(json.dumps(example, indent=2, ensure_ascii=False))
+        print(json.dumps(json.loads(first_example), indent=2, ensure_ascii=False))
     
-    return len(enhanced_examples)
+    return enhanced_count
+
+def read_chunks(f, chunk_size):
+    """Yield (first_line_number, lines) chunks from an open file without reading it all"""
+    line_num = 1
+    while True:
+        lines = list(islice(f, chunk_size))
+        if not lines:
+            return
+        yield line_num, lines
+        line_num += len(lines)
+
+def enhance_chunk(chunk):
+    """Enhance one chunk of raw JSONL lines; runs inside a worker process"""
+    first_line, lines = chunk
+    timings = defaultdict(float)
+    encoded = []
+    errors = []
+    
+    for line_num, line in enumerate(lines, first_line):
+        line = line.strip()
+        if not line:
+            continue
+        
+        t0 = time.perf_counter()
+        try:
+            example = json.loads(line)
+        except json.JSONDecodeError as e:
+            errors.append((line_num, str(e)))
+            continue
+        timings['decode'] += time.perf_counter() - t0
+        
+        enhanced = enhance_single_example(example, timings)
+        if enhanced:
+            t0 = time.perf_counter()
+            encoded.append(json.dumps(enhanced, ensure_ascii=False))
+            timings['encode'] += time.perf_counter() - t0
+    
+    return len(lines), encoded, errors, dict(timings)
 
-def enhance_single_example(example):
+def _timed(timings, stage, func, *args):
+    if timings is None:
+        return func(*args)
+    t0 = time.perf_counter()
+    result = func(*args)
+    timings[stage] += time.perf_counter() - t0
+    return result
+
+def enhance_single_example(example, timings=None):
     """Convert single example to enhanced AAC format"""
     
     input_text = example.get('input', '')
@@ -66,13 +145,16 @@ def enhance_single_example(example):
     
     # Parse emoji-word pairs from output
     # Format: "🎪 Joy circus performing, 🌟 Happiness supernova exploding, ..."
-    tiles = parse_tiles(output_text)
+    tiles = _timed(timings, 'parse_tiles', parse_tiles, output_text)
     
     if not tiles:
         return None
     
     # Generate spoken sentence from tiles
-    spoken_sentence = generate_spoken_sentence(tiles, input_text)
+    spoken_sentence = _timed(timings, 'generate_spoken_sentence', generate_spoken_sentence, tiles, input_text)
+    
+    # Category and emotion level come from one pass over the input
+    features = _timed(timings, 'extract_features', extract_features, input_text)
     
     # Create enhanced format
     enhanced = {
@@ -82,8 +164,8 @@ def enhance_single_example(example):
             "tiles": tiles,
             "spoken_sentence": spoken_sentence,
             "usage_data": {
-                "category": categorize_input(input_text),
-                "emotion_level": detect_emotion_level(input_text),
+                "category": features['category'],
+                "emotion_level": features['emotion_level'],
                 "complexity": len(tiles),
                 "frequency_weight": 1.0
             }
@@ -94,33 +176,8 @@ def enhance_single_example(example):
     return enhanced
 
 def parse_tiles(output_text):
-    """Parse emoji-word pairs from output text"""
-    
-    tiles = []
-    
-    # Split by commas and parse each tile
-    parts = output_text.split(',')
-    
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-            
-        # Find emoji and extract words
-        emoji_match = re.search(r'([^\w\s]+)', part)
-        if emoji_match:
-            emoji = emoji_match.group(1)
-            # Get text after emoji
-            words = part.replace(emoji, '').strip()
-            
-            if words:
-                tiles.append({
-                    "emoji": emoji,
-                    "words": words,
-                    "tile_id": f"tile_{len(tiles)+1}"
-                })
-    
-    return tiles
+    """Parse emoji-word pairs from output text; parts missing either are dropped"""
+    return tile_parser.parse_tiles(output_text, require_emoji=True, require_words=True)
 
 def generate_spoken_sentence(tiles, input_text):
     """Generate natural spoken sentence from tiles"""
@@ -148,41 +205,19 @@ def generate_spoken_sentence(tiles, input_text):
         # Default natural sentence
         return f"I am {key_words[0]} and {key_words[1] if len(key_words) > 1 else 'okay'}."
 
-def categorize_input(input_text):
-    """Categorize input for tracking"""
-    
-    input_lower = input_text.lower()
-    
-    if any(word in input_lower for word in ['happy', 'joy', 'excited', 'good', 'great']):
-        return 'positive_emotion'
-    elif any(word in input_lower for word in ['sad', 'upset', 'angry', 'mad', 'hurt']):
-        return 'negative_emotion'
-    elif any(word in input_lower for word in ['want', 'need', 'like', 'prefer']):
-        return 'request'
-    elif any(word in input_lower for word in ['help', 'assistance', 'support']):
-        return 'help_seeking'
-    elif any(word in input_lower for word in ['eat', 'drink', 'food', 'hungry', 'thirsty']):
-        return 'basic_needs'
-    elif any(word in input_lower for word in ['pain', 'hurt', 'sick', 'doctor']):
-        return 'medical'
-    else:
-        return 'general'
-
-def detect_emotion_level(input_text):
-    """Detect emotional intensity level"""
-    
-    input_lower = input_text.lower()
-    
-    # High intensity words
-    if any(word in input_lower for word in ['very', 'extremely', 'really', 'so', 'incredibly']):
-        return 'high'
-    # Medium intensity
-    elif any(word in input_lower for word in ['pretty', 'quite', 'somewhat', 'little']):
-        return 'medium'
-    # Low intensity (default)
-    else:
-        return 'low'
-
 if __name__ == "__main__":
-    count = enhance_aac_format()
+    parser = argparse.ArgumentParser(description="Enhance AAC responses into word-emoji-sentence-tracking format")
+    parser.add_argument('--input', default="tinkybink_master_unique_final.jsonl")
+    parser.add_argument('--output', default="tinkybink_enhanced_aac_final.jsonl")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all cores, 1 = no pool)")
+    parser.add_argument('--chunk-size', type=int, default=250, help="Examples per work unit")
+    parser.add_argument('--unordered', action='store_true', help="Write chunks as they finish instead of in input order")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    
+    count = enhance_aac_format(args.input, args.output, workers=args.workers,
+                               chunk_size=args.chunk_size, ordered=not args.unordered)
     print(f"\n🎯 ENHANCED: {count:,} examples with full AAC format!")
\ No newline at end of file
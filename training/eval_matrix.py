@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Model Evaluation Matrix
+Runs the benchmark question set against every Modelfile variant
+concurrently and compares quality, latency and tokens/second
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+
+from eval_runner import EvalRunner, make_backend
+from model_backend import make_model_backend
+from response_scoring import production_score, response_metrics
+
+RESULTS_FILE = 'eval_matrix_results.json'
+
+# Fixed question set drawn from the trainers' own test cases
+BENCHMARK_QUESTIONS = [
+    "How are you feeling today?",
+    "I'm having trouble breathing",
+    "Do you want pizza, salad, or soup for dinner?",
+    "I feel frustrated with my therapy progress",
+    "Can you help me make friends at school?",
+    "I'm scared about my surgery tomorrow",
+    "It's raining outside today",
+    "Do you need help getting dressed?",
+    "What would you like to do?",
+    "I managed to walk to the mailbox today",
+]
+
+def discover_variants(directory: str = '.') -> Dict[str, str]:
+    """Map variant name -> Modelfile path for every Modelfile.* in directory"""
+    variants = {}
+    for path in sorted(glob.glob(os.path.join(directory, 'Modelfile.*'))):
+        variants[os.path.basename(path).split('.', 1)[1]] = path
+    return variants
+
+def variant_model_name(variant: str) -> str:
+    """Dedicated model name so evaluation never touches the live 'tinkybink' model"""
+    return f"tinkybink_eval_{variant}"
+
+def variant_fingerprint(modelfile_path: str, backend_name: str) -> str:
+    digest = hashlib.sha256()
+    with open(modelfile_path, 'rb') as f:
+        digest.update(f.read())
+    digest.update(json.dumps(BENCHMARK_QUESTIONS).encode('utf-8'))
+    digest.update(backend_name.encode('utf-8'))
+    return digest.hexdigest()
+
+def score_response(response: str) -> int:
+    """Format quality out of 10: four tiles, emoji-led, concise, no AI speak"""
+    return production_score(response_metrics(response))
+
+def load_results(path: str = RESULTS_FILE) -> Dict:
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+def save_results(results: Dict, path: str = RESULTS_FILE):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+def create_variant_model(models, model_name: str, modelfile_path: str) -> bool:
+    try:
+        created, error = models.create(model_name, modelfile_path)
+    except OSError as e:
+        created, error = False, str(e)
+    if not created:
+        print(f"❌ Failed to create {model_name}: {error.strip()}")
+    return created
+
+def evaluate_variant(runner: EvalRunner, models, variant: str, modelfile_path: str) -> Dict:
+    """Score one variant on the benchmark set"""
+    model_name = variant_model_name(variant)
+    served = runner.backend.name == 'http'
+    if served and not create_variant_model(models, model_name, modelfile_path):
+        return {'error': 'model creation failed'}
+
+    try:
+        start = time.perf_counter()
+        outcomes = runner.run(model_name, BENCHMARK_QUESTIONS)
+        wall_seconds = time.perf_counter() - start
+    finally:
+        # Scored variants are not kept in the model store
+        if served:
+            models.remove(model_name)
+
+    answered = [o for o in outcomes if o['response']]
+    generated = [o for o in answered if not o['cached']]
+    tokens = sum(o['tokens'] or 0 for o in generated)
+    gen_seconds = sum(o['latency'] for o in generated)
+
+    return {
+        'model': model_name,
+        'quality': sum(score_response(o['response']) for o in outcomes) / len(outcomes),
+        'answered': len(answered),
+        'latency_ms': 1000 * gen_seconds / len(generated) if generated else None,
+        'tokens_per_second': tokens / gen_seconds if gen_seconds else None,
+        'wall_seconds': wall_seconds,
+        'errors': sorted({o['error'] for o in outcomes if o['error']}),
+    }
+
+def run_matrix(variants: Dict[str, str], backend_name: str = None, concurrency: int = 4,
+               results_path: str = RESULTS_FILE, force: bool = False, models=None) -> Dict:
+    """Evaluate new or changed variants concurrently and merge into the results file"""
+    runner = EvalRunner(make_backend(backend_name), concurrency=1)
+    models = models or make_model_backend()
+    results = load_results(results_path)
+
+    todo = {}
+    for variant, path in variants.items():
+        fingerprint = variant_fingerprint(path, runner.backend.name)
+        previous = results.get(variant)
+        if force or not previous or previous.get('fingerprint') != fingerprint or previous.get('error'):
+            todo[variant] = (path, fingerprint)
+
+    print(f"🧮 {len(variants)} variants | {len(todo)} to evaluate | concurrency {concurrency}")
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        futures = {pool.submit(evaluate_variant, runner, models, variant, path): variant
+                   for variant, (path, _) in todo.items()}
+        for future in as_completed(futures):
+            variant = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                entry = {'error': f"{type(e).__name__}: {e}"}
+            entry['fingerprint'] = todo[variant][1]
+            entry['evaluated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+            results[variant] = entry
+            print(f"   {'❌' if entry.get('error') else '✅'} {variant}")
+            # Saved as each variant finishes so an interrupted run keeps its results
+            save_results(results, results_path)
+
+    return {variant: results[variant] for variant in variants if variant in results}
+
+def print_comparison_table(results: Dict):
+    """One row per variant, best quality first"""
+    def fmt(value, spec):
+        return format(value, spec) if value is not None else '-'
+
+    rows = sorted(results.items(), key=lambda item: -(item[1].get('quality') or 0))
+    print(f"\n{'Variant':<32} {'Quality':>8} {'Answered':>9} {'Latency ms':>11} {'Tok/s':>8}")
+    print("-" * 72)
+    for variant, entry in rows:
+        if entry.get('error'):
+            print(f"{variant:<32} {'error: ' + entry['error']}")
+            continue
+        print(f"{variant:<32} {fmt(entry['quality'], '8.2f')} "
+              f"{entry['answered']:>4}/{len(BENCHMARK_QUESTIONS):<4} "
+              f"{fmt(entry['latency_ms'], '11.0f')} {fmt(entry['tokens_per_second'], '8.1f')}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate all Modelfile variants on the benchmark set")
+    parser.add_argument('--backend', default=None, help="http or stub (default: TINKYBINK_EVAL_BACKEND or http)")
+    parser.add_argument('--model-backend', default=None,
+                        help="cli or http, for creating variant models (default: TINKYBINK_MODEL_BACKEND or cli)")
+    parser.add_argument('--concurrency', type=int, default=4, help="Variants evaluated at once")
+    parser.add_argument('--only', nargs='*', help="Restrict to these variant names")
+    parser.add_argument('--force', action='store_true', help="Re-evaluate unchanged variants")
+    args = parser.parse_args()
+
+    print("🧮 TinkyBink Model Evaluation Matrix")
+    print("=" * 50)
+
+    variants = discover_variants()
+    if args.only:
+        variants = {name: path for name, path in variants.items() if name in args.only}
+
+    results = run_matrix(variants, args.backend, args.concurrency, force=args.force,
+                         models=make_model_backend(args.model_backend))
+    print_comparison_table(results)
+    print(f"\n💾 Results saved: {RESULTS_FILE}")
+
+if __name__ == "__main__":
+    main()
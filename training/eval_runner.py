@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Evaluation Runner
+Batched, concurrent, cached prompt evaluation shared by the trainers.
+Backends: local HTTP model server (Ollama API), in-process HF model, or a
+deterministic stub. Each backend's generate() returns one dict per prompt
+with the response text and, when known, the generated token count.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_CACHE_FILE = 'eval_cache.json'
+DEFAULT_HOST = os.environ.get('OLLAMA_HOST', 'http://localhost:11434')
+
+def _sha256(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+class HTTPBackend:
+    """Talks to a local model server speaking the Ollama HTTP API"""
+
+    name = 'http'
+    batch_size = 1  # The server takes one prompt per request
+
+    def __init__(self, host: str = DEFAULT_HOST, timeout: float = 20, options: Optional[Dict] = None):
+        self.host = host.rstrip('/')
+        self.timeout = timeout
+        # A fixed seed keeps sampled outputs reproducible, which the cache relies on
+        self.options = {'seed': 42}
+        self.options.update(options or {})
+        self._digests = {}
+
+    def _request(self, path: str, payload: Optional[Dict] = None) -> Dict:
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        request = urllib.request.Request(
+            f"{self.host}{path}",
+            data=data,
+            headers={'Content-Type': 'application/json'},
+            method='POST' if data is not None else 'GET',
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def model_hash(self, model: str) -> Optional[str]:
+        """None when the server reports no digest; such runs bypass the cache"""
+        if model not in self._digests:
+            digest = ''
+            try:
+                for entry in self._request('/api/tags').get('models', []):
+                    if entry.get('name') in (model, f"{model}:latest"):
+                        digest = entry.get('digest', '')
+                        break
+            except (urllib.error.URLError, OSError, ValueError):
+                pass
+            if not digest:
+                return None
+            self._digests[model] = digest
+        return _sha256(self.name, model, self._digests[model], json.dumps(self.options, sort_keys=True))
+
+    def generate(self, model: str, prompts: List[str]) -> List[Dict]:
+        outputs = []
+        for prompt in prompts:
+            start = time.perf_counter()
+            reply = self._request('/api/generate', {
+                'model': model,
+                'prompt': prompt,
+                'stream': False,
+                'options': self.options,
+            })
+            outputs.append({
+                'response': reply.get('response', '').strip(),
+                'tokens': reply.get('eval_count'),
+                'seconds': time.perf_counter() - start,
+            })
+        return outputs
+
+class HFBackend:
+    """Batched greedy generation with an in-process transformers model"""
+
+    name = 'hf'
+
+    def __init__(self, model, tokenizer, max_new_tokens: int = 50, batch_size: int = 8,
+                 prompt_format: Optional[Callable[[str], str]] = None):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_new_tokens = max_new_tokens
+        self.batch_size = batch_size
+        self.prompt_format = prompt_format
+        self._hash = None
+        self._lock = threading.Lock()
+
+    def model_hash(self, model: str) -> str:
+        import torch
+
+        if self._hash is None:
+            digest = hashlib.sha256()
+            digest.update(json.dumps(self.model.config.to_dict(), sort_keys=True, default=str).encode())
+            for name, tensor in sorted(self.model.state_dict().items()):
+                digest.update(name.encode())
+                digest.update(tensor.detach().cpu().contiguous().view(-1).view(torch.uint8).numpy().tobytes())
+            digest.update(str(self.max_new_tokens).encode())
+            self._hash = digest.hexdigest()
+        # Cache keys use the raw prompt, so the template that wraps it is part of the model
+        template = self.prompt_format('{prompt}') if self.prompt_format else '{prompt}'
+        return _sha256(self.name, self._hash, template)
+
+    def generate(self, model: str, prompts: List[str]) -> List[Dict]:
+        import torch
+
+        texts = [self.prompt_format(p) if self.prompt_format else p for p in prompts]
+        # One forward pass at a time; the model is not thread-safe
+        with self._lock:
+            self.tokenizer.padding_side = 'left'
+            inputs = self.tokenizer(texts, return_tensors='pt', padding=True).to(self.model.device)
+            with torch.no_grad():
+                outputs = self.model.generate(
+                    **inputs,
+                    max_new_tokens=self.max_new_tokens,
+                    do_sample=False,
+                    pad_token_id=self.tokenizer.pad_token_id,
+                )
+
+        generated = outputs[:, inputs['input_ids'].shape[1]:]
+        responses = self.tokenizer.batch_decode(generated, skip_special_tokens=True)
+        token_counts = (generated != self.tokenizer.pad_token_id).sum(dim=1).tolist()
+        return [{'response': r.strip(), 'tokens': n} for r, n in zip(responses, token_counts)]
+
+class StubBackend:
+    """Deterministic responses from a lookup table, for offline runs"""
+
+    name = 'stub'
+    batch_size = 32
+
+    def __init__(self, responses: Optional[Dict[str, str]] = None, default: str = ''):
+        self.responses = responses or {}
+        self.default = default
+
+    def model_hash(self, model: str) -> str:
+        return _sha256(self.name, model, json.dumps(self.responses, sort_keys=True), self.default)
+
+    def generate(self, model: str, prompts: List[str]) -> List[Dict]:
+        outputs = []
+        for prompt in prompts:
+            response = self.responses.get(prompt.strip(), self.default)
+            outputs.append({'response': response, 'tokens': len(response.split())})
+        return outputs
+
+def make_backend(name: Optional[str] = None, **kwargs):
+    """Build a backend by name; TINKYBINK_EVAL_BACKEND picks the default"""
+    name = name or os.environ.get('TINKYBINK_EVAL_BACKEND', 'http')
+    if name == 'http':
+        return HTTPBackend(**kwargs)
+    if name == 'stub':
+        return StubBackend(**kwargs)
+    raise ValueError(f"Unknown evaluation backend: {name}")
+
+class EvalCache:
+    """(model hash, prompt) -> {response, tokens}, persisted as JSON"""
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_FILE):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ Ignoring unreadable eval cache {path}: {e}")
+
+    @staticmethod
+    def key(model_hash: str, prompt: str) -> str:
+        return _sha256(model_hash, prompt)
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.entries.get(key)
+
+    def put(self, key: str, response: str, tokens: Optional[int] = None):
+        with self._lock:
+            self.entries[key] = {'response': response, 'tokens': tokens}
+            self._dirty = True
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+class EvalRunner:
+    """Runs prompts against a backend in concurrent batches, skipping cached ones"""
+
+    def __init__(self, backend=None, cache_path: Optional[str] = DEFAULT_CACHE_FILE, concurrency: int = 4,
+                 cache: Optional[EvalCache] = None):
+        self.backend = backend or make_backend()
+        # Runners evaluating side by side should share one cache instance
+        self.cache = cache or EvalCache(cache_path)
+        self.concurrency = concurrency
+
+    def _run_batch(self, model: str, prompts: List[str]) -> List[Dict]:
+        start = time.perf_counter()
+        try:
+            outputs = self.backend.generate(model, prompts)
+            error = None
+        except Exception as e:
+            outputs = [{'response': '', 'tokens': None} for _ in prompts]
+            error = str(e)
+        latency = (time.perf_counter() - start) / max(len(prompts), 1)
+        return [{
+            'response': output['response'],
+            'tokens': output.get('tokens'),
+            'latency': output.get('seconds', latency),
+            'error': error,
+        } for output in outputs]
+
+    def run(self, model: str, prompts: List[str]) -> List[Dict]:
+        """Evaluate prompts in order.
+
+        Each result has prompt, response, tokens, latency (seconds), cached
+        and error.
+        """
+        model_hash = self.backend.model_hash(model)
+        results = [None] * len(prompts)
+        pending = []
+
+        for index, prompt in enumerate(prompts):
+            cached = None if model_hash is None else self.cache.get(EvalCache.key(model_hash, prompt))
+            if cached is not None:
+                results[index] = {'prompt': prompt, 'response': cached['response'],
+                                  'tokens': cached['tokens'], 'cached': True,
+                                  'latency': 0.0, 'error': None}
+            else:
+                pending.append(index)
+
+        batch_size = max(1, getattr(self.backend, 'batch_size', 1))
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+        with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as pool:
+            futures = [(batch, pool.submit(self._run_batch, model, [prompts[i] for i in batch]))
+                       for batch in batches]
+            for batch, future in futures:
+                for index, outcome in zip(batch, future.result()):
+                    outcome.update({'prompt': prompts[index], 'cached': False})
+                    results[index] = outcome
+                    # Only successful generations of a known model are worth remembering
+                    if model_hash is not None and outcome['error'] is None and outcome['response']:
+                        self.cache.put(EvalCache.key(model_hash, prompts[index]),
+                                       outcome['response'], outcome['tokens'])
+
+        self.cache.save()
+        return results
@@ -4,6 +4,7 @@ Expand New AAC Categories
 Add missing categories and more comprehensive examples
 """
 import json
+from tile_parser import parse_tiles
 
 def expand_new_categories():
     """Create new categories and add more examples"""
@@ -473,36 +474,8 @@ def create_spiritual_category():
     return examples
 
 def parse_output_to_tiles(output_text):
-    """Parse output into tile format"""
-    tiles = []
-    parts = output_text.split(', ')
-    
-    for i, part in enumerate(parts[:4]):  # Max 4 tiles
-        part = part.strip()
-        if not part:
-            continue
-            
-        # Find emoji and words
-        emoji = ""
-        words = part
-        
-        # Extract emoji if present
-        for char in part:
-            if ord(char) > 127:  # Non-ASCII character (likely emoji)
-                emoji = char
-                words = part.replace(char, '').strip()
-                break
-        
-        if not emoji:
-            emoji = "💬"  # Default emoji
-        
-        tiles.append({
-            "emoji": emoji,
-            "words": words,
-            "tile_id": f"tile_{i+1}"
-        })
-    
-    return tiles
+    """Parse output into tile format (max 4 tiles)"""
+    return parse_tiles(output_text, limit=4, default_emoji="💬")
 
 def generate_workplace_sentence(tiles, input_text):
     """Generate workplace-appropriate sentences"""
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Generator Runner
+Registry and parallel runner for the create_*, generate_* and *_trainer.py
+data producers. Each script is scanned once: the JSON/JSONL files it opens
+for writing (or hands to write_examples / write_scenarios / compile_corpus)
+are its outputs, every other file name it mentions is an input. A script
+waits only for the scripts that produce its inputs; everything else runs at
+once in a process pool.
+
+Each worker sorts its script's JSONL outputs into a run keyed by example
+digest, and the runs are combined with a streaming k-way merge that drops
+duplicates across generators. Scripts that call Ollama or a model backend
+build models rather than data and only run when named with --only.
+"""
+import argparse
+import ast
+import contextlib
+import glob
+import heapq
+import json
+import os
+import re
+import runpy
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from corpus_compiler import EXAMPLE_FIELDS, example_key
+
+TRAINING_DIR = os.path.dirname(os.path.abspath(__file__))
+GENERATOR_PATTERNS = ('create_*.py', 'generate_*.py', '*_trainer.py')
+MERGED_OUTPUT = 'tinkybink_generated_merged.jsonl'
+RUN_DIR = 'generator_runs'
+
+# Functions that write their (position, keyword) argument as an output file
+WRITERS = {
+    'write_examples': (1, 'output_path'),
+    'write_scenarios': (1, 'output_path'),
+    'compile_corpus': (1, 'output_path'),
+}
+DATA_FILE = re.compile(r'^[A-Za-z0-9][\w.-]*\.jsonl?$')
+MODEL_CALLS = re.compile(r'\bollama\b|model_backend|^import (?:subprocess|requests)\b', re.MULTILINE)
+
+def _string_assignments(tree: ast.AST) -> Dict[str, set]:
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) \
+                and isinstance(node.value.value, str):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names.setdefault(target.id, set()).add(node.value.value)
+    return names
+
+def _call_name(call: ast.Call) -> Optional[str]:
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return None
+
+def _written_argument(call: ast.Call) -> Optional[ast.AST]:
+    """The argument node a call writes to, if it writes a file at all"""
+    name = _call_name(call)
+    if name == 'open' and call.args:
+        mode = call.args[1] if len(call.args) > 1 else None
+        for keyword in call.keywords:
+            if keyword.arg == 'mode':
+                mode = keyword.value
+        if isinstance(mode, ast.Constant) and set(str(mode.value)) & set('wax'):
+            return call.args[0]
+        return None
+    if name in WRITERS:
+        position, keyword_name = WRITERS[name]
+        for keyword in call.keywords:
+            if keyword.arg == keyword_name:
+                return keyword.value
+        if len(call.args) > position:
+            return call.args[position]
+    return None
+
+class Generator:
+    """One data-producing script and the files it reads and writes"""
+
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        with open(self.path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        tree = ast.parse(source, filename=self.path)
+
+        names = _string_assignments(tree)
+        self.outputs = set()
+        mentioned = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and DATA_FILE.match(node.value):
+                mentioned.add(node.value)
+            if isinstance(node, ast.Call):
+                target = _written_argument(node)
+                if isinstance(target, ast.Constant) and isinstance(target.value, str):
+                    self.outputs.add(target.value)
+                elif isinstance(target, ast.Name):
+                    self.outputs.update(names.get(target.id, ()))
+        self.outputs = sorted(path for path in self.outputs if DATA_FILE.match(path))
+        self.inputs = sorted(mentioned - set(self.outputs))
+
+        self.runnable = any(isinstance(node, ast.If) and "__main__" in ast.dump(node.test)
+                            for node in tree.body)
+        self.uses_model = MODEL_CALLS.search(source) is not None
+
+    def __repr__(self) -> str:
+        return f"Generator({self.name!r}, outputs={self.outputs}, inputs={self.inputs})"
+
+def discover(directory: str = TRAINING_DIR, patterns: Sequence[str] = GENERATOR_PATTERNS) -> Dict[str, Generator]:
+    """Registry of runnable generators in directory, by name"""
+    paths = sorted({path for pattern in patterns for path in glob.glob(os.path.join(directory, pattern))})
+    registry = {}
+    for path in paths:
+        generator = Generator(path)
+        if generator.runnable:
+            registry[generator.name] = generator
+    return registry
+
+def dependencies(generators: Dict[str, Generator]) -> Dict[str, set]:
+    """name -> names that must finish first.
+
+    A generator waits for every other generator that writes one of its
+    inputs; generators writing the same file run in name order.
+    """
+    producers = {}
+    for name in sorted(generators):
+        for output in generators[name].outputs:
+            producers.setdefault(output, []).append(name)
+
+    depends = {name: set() for name in generators}
+    for name, generator in generators.items():
+        for path in generator.inputs:
+            depends[name].update(producer for producer in producers.get(path, ()) if producer != name)
+    for writers in producers.values():
+        for earlier, later in zip(writers, writers[1:]):
+            depends[later].add(earlier)
+    return depends
+
+def levels(generators: Dict[str, Generator]) -> List[List[str]]:
+    """Generators grouped into waves that can each run concurrently"""
+    depends = dependencies(generators)
+    done = set()
+    waves = []
+    while len(done) < len(depends):
+        wave = sorted(name for name, needs in depends.items() if name not in done and needs <= done)
+        if not wave:
+            cycle = sorted(set(depends) - done)
+            raise ValueError(f"Generators depend on each other in a cycle: {', '.join(cycle)}")
+        waves.append(wave)
+        done.update(wave)
+    return waves
+
+def select(generators: Dict[str, Generator], only: Optional[Iterable[str]] = None,
+           include_model: bool = False) -> Dict[str, Generator]:
+    """Generators to run; --only names are run even if they call a model"""
+    if only:
+        missing = sorted(set(only) - set(generators))
+        if missing:
+            raise KeyError(f"Unknown generators: {', '.join(missing)}")
+        return {name: generators[name] for name in only}
+    return {name: generator for name, generator in generators.items()
+            if include_model or not generator.uses_model}
+
+def _sorted_run(path: str, run_path: str) -> int:
+    """Write path's examples to run_path as 'key<TAB>json' lines sorted by key"""
+    lines = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                example = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            lines.append(f"{example_key(example, EXAMPLE_FIELDS).hex()}\t{line}\n")
+    lines.sort()
+    with open(run_path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+    return len(lines)
+
+def run_generator(generator: Generator, workdir: str, run_dir: str) -> Dict:
+    """Run one script as __main__ in workdir; returns its timing and output stats.
+
+    Executed in a worker process. The script's prints go to run_dir/<name>.log.
+    """
+    os.chdir(workdir)
+    if TRAINING_DIR not in sys.path:
+        sys.path.insert(0, TRAINING_DIR)
+    result = {'name': generator.name, 'status': 'ok', 'examples': 0, 'bytes': 0, 'runs': []}
+
+    log_path = os.path.join(run_dir, f"{generator.name}.log")
+    argv = sys.argv
+    # Whole seconds, so coarse filesystem timestamps still count as this run
+    started = int(time.time())
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log, \
+            contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        sys.argv = [generator.path]
+        try:
+            runpy.run_path(generator.path, run_name='__main__')
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                result.update(status='failed', error=f"exit code {e.code}")
+        except Exception as e:
+            result.update(status='failed', error=f"{type(e).__name__}: {e}")
+        finally:
+            sys.argv = argv
+    result['seconds'] = time.perf_counter() - start
+
+    if result['status'] != 'ok':
+        return result
+    for output in generator.outputs:
+        # A file left over from an earlier run is not this run's output
+        if not os.path.exists(output) or os.path.getmtime(output) < started:
+            continue
+        result['bytes'] += os.path.getsize(output)
+        if output.endswith('.jsonl'):
+            run_path = os.path.join(run_dir, f"{generator.name}.{output}.run")
+            result['examples'] += _sorted_run(output, run_path)
+            result['runs'].append(run_path)
+    return result
+
+def _run_lines(path: str) -> Iterable[str]:
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from f
+
+def merge_runs(run_paths: Sequence[str], output_path: str) -> Dict:
+    """k-way merge of sorted runs into output_path, keeping the first example per key"""
+    stats = {'read': 0, 'duplicates': 0, 'written': 0}
+    previous = None
+    temp_path = output_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as out:
+        for line in heapq.merge(*(_run_lines(path) for path in run_paths)):
+            stats['read'] += 1
+            key, _, example = line.partition('\t')
+            if key == previous:
+                stats['duplicates'] += 1
+                continue
+            previous = key
+            out.write(example)
+            stats['written'] += 1
+    os.replace(temp_path, output_path)
+    return stats
+
+def run_all(generators: Dict[str, Generator], workdir: str = TRAINING_DIR,
+            workers: Optional[int] = None, merge_output: Optional[str] = MERGED_OUTPUT) -> Dict:
+    """Run generators as their inputs become ready; returns per-generator results and merge stats"""
+    workdir = os.path.abspath(workdir)
+    run_dir = os.path.join(workdir, RUN_DIR)
+    os.makedirs(run_dir, exist_ok=True)
+    depends = dependencies(generators)
+    levels(generators)  # fail fast on cycles
+
+    results = {}
+    pending = set(generators)
+    running = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            for name in sorted(pending):
+                needs = depends[name]
+                blocked = [need for need in needs if results.get(need, {}).get('status') not in (None, 'ok')]
+                if blocked:
+                    results[name] = {'name': name, 'status': 'skipped', 'examples': 0, 'bytes': 0,
+                                     'seconds': 0.0, 'runs': [], 'error': f"needs {', '.join(sorted(blocked))}"}
+                    pending.discard(name)
+                elif all(need in results for need in needs):
+                    running[pool.submit(run_generator, generators[name], workdir, run_dir)] = name
+                    pending.discard(name)
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = {'name': name, 'status': 'failed', 'examples': 0, 'bytes': 0,
+                                     'seconds': 0.0, 'runs': [], 'error': f"{type(e).__name__}: {e}"}
+                print(_report_line(results[name]))
+
+    report = {'generators': [results[name] for name in sorted(results)],
+              'seconds': time.perf_counter() - start}
+    if merge_output:
+        runs = [path for result in report['generators'] for path in result['runs']]
+        merge_start = time.perf_counter()
+        report['merge'] = merge_runs(runs, os.path.join(workdir, merge_output))
+        report['merge'].update(output=merge_output, seconds=time.perf_counter() - merge_start)
+    return report
+
+def _report_line(result: Dict) -> str:
+    icon = {'ok': '✅', 'failed': '❌', 'skipped': '⏭️'}[result['status']]
+    seconds = result['seconds']
+    rate = result['examples'] / seconds if seconds else 0.0
+    line = (f"{icon} {result['name']:<38} {seconds:7.2f}s {result['examples']:>8,} ex "
+            f"{rate:>10,.0f} ex/s {result['bytes'] / 1024:>9,.1f} KB")
+    if result.get('error'):
+        line += f"  ({result['error']})"
+    return line
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the dataset generators in parallel and merge their outputs")
+    parser.add_argument('--only', action='append', help="Run just this generator (repeatable)")
+    parser.add_argument('--include-model', action='store_true',
+                        help="Also run generators that call Ollama or a model backend")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument('--workdir', default=TRAINING_DIR, help="Directory the scripts read and write in")
+    parser.add_argument('--output', default=MERGED_OUTPUT, help="Merged JSONL, relative to --workdir")
+    parser.add_argument('--no-merge', action='store_true', help="Skip merging outputs")
+    parser.add_argument('--report', default='generator_run_report.json', help="Report JSON, relative to --workdir")
+    parser.add_argument('--list', action='store_true', help="List generators and their waves, then exit")
+    args = parser.parse_args()
+
+    generators = select(discover(), args.only, args.include_model)
+
+    print("🏭 TinkyBink Generator Runner")
+    print("=" * 70)
+    if args.list:
+        for number, wave in enumerate(levels(generators), 1):
+            print(f"\n🌊 Wave {number}:")
+            for name in wave:
+                generator = generators[name]
+                model = " 🤖" if generator.uses_model else ""
+                print(f"   {name}{model} -> {', '.join(generator.outputs) or '-'}")
+        return
+
+    print(f"🚀 {len(generators)} generators in {len(levels(generators))} waves\n")
+    report = run_all(generators, args.workdir, args.workers, None if args.no_merge else args.output)
+
+    results = report['generators']
+    total = sum(result['examples'] for result in results)
+    failed = [result['name'] for result in results if result['status'] != 'ok']
+    print(f"\n⏱️ {len(results)} generators in {report['seconds']:.2f}s wall "
+          f"(sum of generator time {sum(result['seconds'] for result in results):.2f}s)")
+    print(f"📊 {total:,} examples, {sum(result['bytes'] for result in results) / 1024:,.1f} KB of output")
+    if 'merge' in report:
+        merge = report['merge']
+        print(f"🔀 Merged {merge['read']:,} -> {merge['written']:,} examples "
+              f"({merge['duplicates']:,} duplicates) into {merge['output']} in {merge['seconds']:.2f}s")
+    if failed:
+        print(f"⚠️ Not completed: {', '.join(failed)} (logs in {RUN_DIR}/)")
+
+    with open(os.path.join(args.workdir, args.report), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"📋 Report: {args.report}")
+
+if __name__ == "__main__":
+    main()
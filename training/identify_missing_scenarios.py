@@ -3,7 +3,17 @@
 Identify Missing AAC Scenarios
 Comprehensive analysis to find any gaps in coverage
 """
+import glob
 import json
+from corpus_columns import CORPUS_FILE, convert, is_current, read_corpus, texts_matching_all
+
+def load_corpus_inputs():
+    """Only the input column of the columnar corpus, rebuilt whenever a source JSONL changes"""
+    sources = sorted(glob.glob('*.jsonl'))
+    if not is_current(sources):
+        print(f"🗃️ Building {CORPUS_FILE}...")
+        convert(sources)
+    return read_corpus(CORPUS_FILE, columns=['input'])['input']
 
 def identify_missing_scenarios():
     """Analyze for any missing AAC communication scenarios"""
@@ -123,6 +133,8 @@ def identify_missing_scenarios():
     
     # Check for missing scenarios
     missing_scenarios = []
+    corpus_inputs = load_corpus_inputs()
+    print(f"🗃️ Checking against {len(corpus_inputs):,} corpus inputs")
     
     for category, scenarios in essential_scenarios.items():
         print(f"\n🔍 Analyzing {category}:")
@@ -138,7 +150,12 @@ def identify_missing_scenarios():
             elif any(keyword in scenario.lower() for keyword in ['religious', 'prayer', 'spiritual']):
                 missing_in_category.append(f"🙏 {scenario} - Religious/spiritual")
             else:
-                print(f"   ✅ {scenario} - Likely covered")
+                words = [word for word in scenario.lower().split() if len(word) > 3] or scenario.lower().split()
+                matches = texts_matching_all(corpus_inputs, words)
+                if matches:
+                    print(f"   ✅ {scenario} - Covered ({matches} examples)")
+                else:
+                    missing_in_category.append(f"📭 {scenario} - Not in corpus")
         
         if missing_in_category:
             missing_scenarios.extend(missing_in_category)
@@ -184,6 +201,7 @@ def identify_missing_scenarios():
     print(f"   ⚠️  Sensitive scenarios: {len([s for s in missing_scenarios if 'Sensitive' in s])}")
     print(f"   🏳️‍🌈 LGBTQ+ specific: {len([s for s in missing_scenarios if 'LGBTQ+' in s])}")
     print(f"   🙏 Religious/spiritual: {len([s for s in missing_scenarios if 'Religious' in s])}")
+    print(f"   📭 Not in corpus: {len([s for s in missing_scenarios if 'Not in corpus' in s])}")
     print(f"   🏥 Additional specialized: {len(additional_missing)}")
     print(f"   🎯 Total potentially missing: {total_missing}")
     
@@ -205,6 +223,7 @@ def identify_missing_scenarios():
         "sensitive_scenarios": [s for s in missing_scenarios if 'Sensitive' in s],
         "lgbtq_scenarios": [s for s in missing_scenarios if 'LGBTQ+' in s],
         "religious_scenarios": [s for s in missing_scenarios if 'Religious' in s],
+        "uncovered_scenarios": [s for s in missing_scenarios if 'Not in corpus' in s],
         "additional_specialized": additional_missing,
         "recommendations": [
             "Add sensitive scenarios with appropriate content warnings",
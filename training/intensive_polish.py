@@ -4,14 +4,18 @@ Intensive TinkyBink Polish System
 Addresses specific quality issues with targeted training
 """
 import json
-import subprocess
 import os
 import re
 from typing import Dict, List
+from eval_runner import EvalRunner
+from model_registry import ModelRegistry
+from response_scoring import production_score, response_metrics
 
 class IntensivePolish:
     def __init__(self):
         self.quality_fixes = []
+        self.eval_runner = EvalRunner()
+        self.registry = ModelRegistry()
         
     def create_intensive_training_data(self) -> List[Dict]:
         """Create intensive training data focused on quality issues"""
@@ -165,16 +169,14 @@ Output: """
             f.write(modelfile_content)
         
         # Create surgical precision model
-        subprocess.run(['ollama', 'rm', 'tinkybink_surgical'], capture_output=True)
+        ok, error = self.registry.ensure('tinkybink_surgical', 'Modelfile.tinkybink_surgical',
+                                         ['tinkybink_surgical_precision_train.jsonl'])
         
-        result = subprocess.run(['ollama', 'create', 'tinkybink_surgical', '-f', 'Modelfile.tinkybink_surgical'],
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        if ok:
             print("✅ Surgical Precision Model Created!")
             return 'tinkybink_surgical'
         else:
-            print(f"❌ Failed: {result.stderr}")
+            print(f"❌ Failed: {error}")
             return None
     
     def test_surgical_precision(self, model_name: str) -> bool:
@@ -191,43 +193,38 @@ Output: """
         ]
         
         all_passed = True
+        results = self.eval_runner.run(model_name, precision_tests)
         
-        for test_input in precision_tests:
+        for test_input, result in zip(precision_tests, results):
             print(f"\n🧪 Testing: '{test_input}'")
             
-            try:
-                result = subprocess.run(['ollama', 'run', model_name],
-                                      input=test_input, text=True,
-                                      capture_output=True, timeout=15)
+            if result['error']:
+                print(f"❌ Error: {result['error']}")
+                all_passed = False
+            elif result['response']:
+                response = result['response']
+                print(f"Response: {response}")
+                
+                # Check precision criteria
+                comma_count = response.count(',')
+                has_emojis = bool(re.search(r'[^\x00-\x7F]', response))
+                reasonable_length = 20 <= len(response) <= 100
+                no_rambling = 'i am' not in response.lower() and 'as an ai' not in response.lower()
                 
-                if result.stdout:
-                    response = result.stdout.strip()
-                    print(f"Response: {response}")
-                    
-                    # Check precision criteria
-                    comma_count = response.count(',')
-                    has_emojis = bool(re.search(r'[^\x00-\x7F]', response))
-                    reasonable_length = 20 <= len(response) <= 100
-                    no_rambling = 'i am' not in response.lower() and 'as an ai' not in response.lower()
-                    
-                    precision_score = sum([
-                        comma_count == 3,  # Exactly 4 responses
-                        has_emojis,       # Has emojis
-                        reasonable_length, # Reasonable length
-                        no_rambling       # No AI speak
-                    ])
-                    
-                    if precision_score >= 3:
-                        print(f"✅ PRECISION PASS: {precision_score}/4")
-                    else:
-                        print(f"❌ PRECISION FAIL: {precision_score}/4")
-                        all_passed = False
+                precision_score = sum([
+                    comma_count == 3,  # Exactly 4 responses
+                    has_emojis,       # Has emojis
+                    reasonable_length, # Reasonable length
+                    no_rambling       # No AI speak
+                ])
+                
+                if precision_score >= 3:
+                    print(f"✅ PRECISION PASS: {precision_score}/4")
                 else:
-                    print("❌ No response")
+                    print(f"❌ PRECISION FAIL: {precision_score}/4")
                     all_passed = False
-                    
-            except Exception as e:
-                print(f"❌ Error: {e}")
+            else:
+                print("❌ No response")
                 all_passed = False
         
         return all_passed
@@ -296,22 +293,18 @@ Output: """
             f.write(production_modelfile)
         
         # Create production model
-        subprocess.run(['ollama', 'rm', 'tinkybink'], capture_output=True)
-        subprocess.run(['ollama', 'rm', 'tinkybink_production'], capture_output=True)
-        
-        result = subprocess.run(['ollama', 'create', 'tinkybink_production', '-f', 'Modelfile.tinkybink_production'],
-                              capture_output=True, text=True)
+        ok, error = self.registry.ensure('tinkybink_production', 'Modelfile.tinkybink_production')
         
-        if result.returncode == 0:
+        if ok:
             print("✅ Production Model Created!")
             
             # Update main tinkybink model
-            subprocess.run(['ollama', 'create', 'tinkybink', '-f', 'Modelfile.tinkybink_production'])
+            self.registry.promote('tinkybink', 'tinkybink_production')
             print("✅ Updated main 'tinkybink' model")
             
             return 'tinkybink_production'
         else:
-            print(f"❌ Failed: {result.stderr}")
+            print(f"❌ Failed: {error}")
             return None
     
     def production_validation_suite(self, model_name: str):
@@ -357,41 +350,38 @@ Output: """
         total_score = 0
         perfect_responses = 0
         
-        for i, test in enumerate(validation_tests, 1):
+        results = self.eval_runner.run(model_name, [test['input'] for test in validation_tests])
+        
+        for i, (test, result) in enumerate(zip(validation_tests, results), 1):
             print(f"🧪 Test {i}: {test['category']}")
             print(f"Input: '{test['input']}'")
             
-            try:
-                result = subprocess.run(['ollama', 'run', model_name],
-                                      input=test['input'], text=True,
-                                      capture_output=True, timeout=15)
+            if result['error']:
+                print(f"❌ Error: {result['error']}")
+            elif result['response']:
+                response = result['response']
+                print(f"Response: {response}")
+                
+                # Production quality scoring
+                score = self.score_production_quality(response)
+                total_score += score
                 
-                if result.stdout:
-                    response = result.stdout.strip()
-                    print(f"Response: {response}")
-                    
-                    # Production quality scoring
-                    score = self.score_production_quality(response)
-                    total_score += score
-                    
-                    if score >= 9:
-                        perfect_responses += 1
-                        print(f"✨ PRODUCTION PERFECT: {score}/10")
-                    elif score >= 7:
-                        print(f"✅ PRODUCTION READY: {score}/10")
-                    else:
-                        print(f"🔧 NEEDS IMPROVEMENT: {score}/10")
+                if score >= 9:
+                    perfect_responses += 1
+                    print(f"✨ PRODUCTION PERFECT: {score}/10")
+                elif score >= 7:
+                    print(f"✅ PRODUCTION READY: {score}/10")
                 else:
-                    print("❌ No response generated")
-                    
-            except Exception as e:
-                print(f"❌ Error: {e}")
+                    print(f"🔧 NEEDS IMPROVEMENT: {score}/10")
+            else:
+                print("❌ No response generated")
             
             print()  # Empty line between tests
         
         # Final production assessment
         avg_score = total_score / len(validation_tests)
         success_rate = (perfect_responses / len(validation_tests)) * 100
+        self.registry.record_score(model_name, avg_score)
         
         print(f"🏭 PRODUCTION VALIDATION RESULTS")
         print("=" * 40)
@@ -409,36 +399,7 @@ Output: """
     
     def score_production_quality(self, response: str) -> int:
         """Score response for production readiness"""
-        score = 0
-        
-        # Format requirements (4 points)
-        comma_count = response.count(',')
-        if comma_count == 3:  # Exactly 4 responses
-            score += 2
-        elif comma_count >= 1:
-            score += 1
-            
-        if re.search(r'^[^\x00-\x7F]', response):  # Starts with emoji
-            score += 2
-        
-        # Quality requirements (4 points)
-        if 25 <= len(response) <= 80:  # Optimal length
-            score += 2
-        elif 15 <= len(response) <= 120:
-            score += 1
-            
-        # No AI speak
-        if not any(phrase in response.lower() for phrase in ['i am', 'as an ai', 'i can help', 'i understand that']):
-            score += 2
-        
-        # Emoji usage (2 points)
-        emoji_count = len(re.findall(r'[^\x00-\x7F]', response))
-        if emoji_count >= 4:
-            score += 2
-        elif emoji_count >= 2:
-            score += 1
-        
-        return min(10, score)
+        return production_score(response_metrics(response))
     
     def run_intensive_polish(self):
         """Run the complete intensive polish process"""
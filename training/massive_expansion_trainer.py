@@ -7,6 +7,7 @@ import json
 import subprocess
 import os
 from typing import Dict, List
+from corpus_compiler import compile_corpus
 
 class MassiveExpansionTrainer:
     def __init__(self):
@@ -621,8 +622,6 @@ class MassiveExpansionTrainer:
         print("\n🚀 Compiling Massive Training Dataset")
         print("=" * 60)
         
-        all_examples = []
-        
         # Add existing training data
         existing_files = [
             'tinkybink_ultimate_fusion_train.jsonl',
@@ -631,51 +630,29 @@ class MassiveExpansionTrainer:
             'tinkybink_adult_train.jsonl'
         ]
         
-        existing_count = 0
-        for file in existing_files:
-            if os.path.exists(file):
-                with open(file, 'r') as f:
-                    for line in f:
-                        if line.strip():
-                            all_examples.append(json.loads(line))
-                            existing_count += 1
-        
-        print(f"📊 Loaded {existing_count} existing examples")
-        
-        # Add new comprehensive training
-        new_examples = []
-        
-        # Generate multiple categories
-        emotional_examples = self.create_advanced_emotional_training()
-        medical_examples = self.create_medical_healthcare_expansion()
-        social_examples = self.create_advanced_social_scenarios()
-        life_skills_examples = self.create_specialized_life_skills()
-        cultural_examples = self.create_cultural_accessibility_training()
-        crisis_examples = self.create_emergency_crisis_training()
-        
-        new_examples.extend(emotional_examples)
-        new_examples.extend(medical_examples)
-        new_examples.extend(social_examples)
-        new_examples.extend(life_skills_examples)
-        new_examples.extend(cultural_examples)
-        new_examples.extend(crisis_examples)
-        
-        # Add all new examples
-        all_examples.extend(new_examples)
-        
-        # Save massive dataset
+        # Add new comprehensive training, generated when the compiler reaches it
+        generated_sources = [
+            ('emotional', self.create_advanced_emotional_training),
+            ('medical', self.create_medical_healthcare_expansion),
+            ('social', self.create_advanced_social_scenarios),
+            ('life_skills', self.create_specialized_life_skills),
+            ('cultural', self.create_cultural_accessibility_training),
+            ('crisis', self.create_emergency_crisis_training),
+        ]
+        
+        # Stream everything into the massive dataset
         filename = 'tinkybink_massive_expansion_train.jsonl'
-        with open(filename, 'w') as f:
-            for example in all_examples:
-                f.write(json.dumps(example) + '\n')
+        stats = compile_corpus(existing_files + generated_sources, filename)
         
-        total_count = len(all_examples)
-        new_count = len(new_examples)
+        existing_count = sum(stats['sources'].get(file, 0) for file in existing_files)
+        new_count = sum(stats['sources'].get(name, 0) for name, _ in generated_sources)
+        total_count = stats['written']
         
         print(f"\n🎉 MASSIVE DATASET CREATED!")
         print("=" * 40)
         print(f"📊 Existing examples: {existing_count}")
         print(f"🆕 New examples: {new_count}")
+        print(f"♻️ Duplicates dropped: {stats['duplicates']}")
         print(f"🚀 Total examples: {total_count}")
         print(f"📁 Saved to: {filename}")
         
@@ -4,6 +4,7 @@ Final Merge: Combine original + new categories
 Create the ultimate comprehensive AAC dataset
 """
 import json
+from corpus_columns import category_counts, convert
 
 def merge_all_final():
     """Merge original dataset with new categories"""
@@ -58,22 +59,21 @@ def merge_all_final():
     print(f"🗑️  Duplicates removed: {duplicates}")
     print(f"✅ Final unique: {final_count:,} examples")
     
-    # Analyze categories in final dataset
-    categories = {}
-    for example in unique_examples:
-        cat = example['aac_response']['usage_data']['category']
-        categories[cat] = categories.get(cat, 0) + 1
-    
-    print(f"\n📊 FINAL CATEGORY BREAKDOWN:")
-    for cat, count in sorted(categories.items()):
-        print(f"   {cat}: {count:,} examples")
-    
     # Save final master dataset
     output_file = "tinkybink_ultimate_master_final.jsonl"
     with open(output_file, 'w', encoding='utf-8') as f:
         for example in unique_examples:
             f.write(json.dumps(example, ensure_ascii=False) + '\n')
     
+    # Columnar copy; the category breakdown reads just that column
+    columnar_file = "tinkybink_ultimate_master_final.parquet"
+    convert([output_file], columnar_file)
+    categories = category_counts(columnar_file)
+    
+    print(f"\n📊 FINAL CATEGORY BREAKDOWN:")
+    for cat, count in sorted(categories.items(), key=lambda item: item[0] or ''):
+        print(f"   {cat}: {count:,} examples")
+    
     print(f"\n🏆 ULTIMATE SUCCESS!")
     print(f"✅ Created: {output_file}")
     print(f"🌟 Contains: {final_count:,} unique AAC examples")
@@ -88,7 +88,8 @@ def merge_all_final():
         "original_dataset_size": original_count,
         "new_categories_added": new_count,
         "duplicates_removed": duplicates,
-        "output_file": output_file
+        "output_file": output_file,
+        "columnar_file": columnar_file
     }
     
     with open("ultimate_final_summary.json", 'w', encoding='utf-8') as f:
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Model Backends
+create/run/rm/cp for the trainers, either through the ollama CLI or through a
+server speaking the Ollama HTTP API (a real one or model_server.py).
+TINKYBINK_MODEL_BACKEND picks the default: cli or http.
+"""
+import json
+import os
+import subprocess
+import urllib.error
+import urllib.request
+from typing import Dict, Optional, Tuple
+
+from eval_runner import DEFAULT_HOST
+
+MODELFILE_COMMANDS = ('FROM', 'PARAMETER', 'SYSTEM', 'TEMPLATE', 'MESSAGE', 'ADAPTER', 'LICENSE')
+
+def _parameter_value(value: str):
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value.strip('"')
+
+def parse_modelfile(text: str) -> Dict:
+    """Modelfile text -> the fields /api/create accepts"""
+    fields = {'parameters': {}, 'messages': []}
+    lines = text.splitlines()
+    i = 0
+    while i < len(lines):
+        command, _, rest = lines[i].strip().partition(' ')
+        command = command.upper()
+        i += 1
+        if command not in MODELFILE_COMMANDS:
+            continue
+
+        rest = rest.strip()
+        if command == 'MESSAGE':
+            role, _, rest = rest.partition(' ')
+            rest = rest.strip()
+        if rest.startswith('"""'):
+            # Triple-quoted values run until the next closing """
+            body = rest[3:]
+            while '"""' not in body and i < len(lines):
+                body += '\n' + lines[i]
+                i += 1
+            rest = body.split('"""', 1)[0]
+
+        if command == 'FROM':
+            fields['from'] = rest
+        elif command == 'PARAMETER':
+            key, _, value = rest.partition(' ')
+            value = _parameter_value(value.strip())
+            if key == 'stop':
+                fields['parameters'].setdefault('stop', []).append(value)
+            else:
+                fields['parameters'][key] = value
+        elif command == 'MESSAGE':
+            fields['messages'].append({'role': role, 'content': rest})
+        else:
+            fields[command.lower()] = rest
+    return fields
+
+class CLIModelBackend:
+    """Shells out to the ollama binary"""
+
+    name = 'cli'
+
+    def create(self, model: str, modelfile_path: str) -> Tuple[bool, str]:
+        result = subprocess.run(['ollama', 'create', model, '-f', modelfile_path],
+                                capture_output=True, text=True)
+        return result.returncode == 0, result.stderr
+
+    def remove(self, model: str):
+        subprocess.run(['ollama', 'rm', model], capture_output=True)
+
+    def copy(self, source: str, destination: str) -> bool:
+        return subprocess.run(['ollama', 'cp', source, destination], capture_output=True).returncode == 0
+
+    def exists(self, model: str) -> bool:
+        return subprocess.run(['ollama', 'show', model], capture_output=True).returncode == 0
+
+    def run(self, model: str, prompt: str, timeout: float = 20) -> str:
+        result = subprocess.run(['ollama', 'run', model],
+                                input=prompt, text=True,
+                                capture_output=True, timeout=timeout)
+        return result.stdout
+
+class HTTPModelBackend:
+    """Uses the Ollama HTTP API directly, so no ollama binary is needed"""
+
+    name = 'http'
+
+    def __init__(self, host: str = DEFAULT_HOST):
+        self.host = host.rstrip('/')
+
+    def _request(self, method: str, path: str, payload: Dict, timeout: float) -> Dict:
+        request = urllib.request.Request(
+            f"{self.host}{path}",
+            data=json.dumps(payload).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            method=method,
+        )
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read().decode('utf-8')
+        return json.loads(body) if body else {}
+
+    def create(self, model: str, modelfile_path: str) -> Tuple[bool, str]:
+        with open(modelfile_path, 'r', encoding='utf-8') as f:
+            payload = parse_modelfile(f.read())
+        payload.update({'model': model, 'stream': False})
+        try:
+            self._request('POST', '/api/create', payload, timeout=600)
+            return True, ''
+        except urllib.error.HTTPError as e:
+            return False, e.read().decode('utf-8', 'replace')
+        except (urllib.error.URLError, OSError) as e:
+            return False, str(e)
+
+    def remove(self, model: str):
+        try:
+            self._request('DELETE', '/api/delete', {'model': model}, timeout=30)
+        except (urllib.error.URLError, OSError):
+            pass  # Same as `ollama rm` on a missing model: nothing to do
+
+    def copy(self, source: str, destination: str) -> bool:
+        try:
+            self._request('POST', '/api/copy', {'source': source, 'destination': destination}, timeout=60)
+            return True
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def exists(self, model: str) -> bool:
+        try:
+            self._request('POST', '/api/show', {'model': model}, timeout=30)
+            return True
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def run(self, model: str, prompt: str, timeout: float = 20) -> str:
+        reply = self._request('POST', '/api/generate',
+                              {'model': model, 'prompt': prompt, 'stream': False}, timeout)
+        return reply.get('response', '')
+
+def make_model_backend(name: Optional[str] = None, **kwargs):
+    """Build a backend by name; TINKYBINK_MODEL_BACKEND picks the default"""
+    name = name or os.environ.get('TINKYBINK_MODEL_BACKEND', 'cli')
+    if name == 'cli':
+        return CLIModelBackend()
+    if name == 'http':
+        return HTTPModelBackend(**kwargs)
+    raise ValueError(f"Unknown model backend: {name}")
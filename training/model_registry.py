@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Model Registry
+Content-hashes each Modelfile plus the datasets it was built from, so an
+unchanged model is never rebuilt. Aliases such as 'tinkybink' are promoted
+by copying the winning model instead of recreating it. Every version and
+score is recorded in model_registry.json.
+"""
+import hashlib
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from model_backend import make_model_backend
+
+REGISTRY_FILE = 'model_registry.json'
+# Runs against the stub model server keep their own record, apart from real models
+OFFLINE_REGISTRY_FILE = 'model_registry.offline.json'
+
+def content_hash(modelfile_path: str, datasets: List[str] = ()) -> str:
+    """sha256 over the Modelfile and every dataset file, in order"""
+    digest = hashlib.sha256()
+    for path in [modelfile_path, *datasets]:
+        digest.update(os.path.basename(path).encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+class ModelRegistry:
+    """Tracks built models, their content hashes, scores and aliases"""
+
+    def __init__(self, models=None, path: str = REGISTRY_FILE):
+        self.models = models or make_model_backend()
+        self.path = path
+        self.data = {'models': {}, 'aliases': {}, 'history': []}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.data.update(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ Ignoring unreadable model registry {path}: {e}")
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def ensure(self, name: str, modelfile_path: str, datasets: List[str] = ()) -> Tuple[bool, str]:
+        """Build name from modelfile_path unless the same content is already built"""
+        datasets = [path for path in datasets if os.path.exists(path)]
+        version = content_hash(modelfile_path, datasets)
+        entry = self.data['models'].get(name)
+
+        if entry and entry['hash'] == version and self.models.exists(name):
+            print(f"♻️ {name} unchanged ({version[:12]}), skipping rebuild")
+            return True, ''
+
+        ok, error = self.models.create(name, modelfile_path)
+        if not ok:
+            return False, error
+
+        now = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.data['models'][name] = {
+            'hash': version,
+            'modelfile': modelfile_path,
+            'datasets': datasets,
+            'created_at': now,
+            'score': None,
+        }
+        self.data['history'].append({'model': name, 'hash': version, 'created_at': now})
+        self.save()
+        return True, ''
+
+    def record_score(self, name: str, score: float):
+        entry = self.data['models'].get(name)
+        if entry is None:
+            return
+        entry['score'] = score
+        for version in reversed(self.data['history']):
+            if version['model'] == name and version['hash'] == entry['hash']:
+                version['score'] = score
+                break
+        self.save()
+
+    def promote(self, alias: str, name: str) -> bool:
+        """Point alias at name; a no-op when it already serves the same content"""
+        entry = self.data['models'].get(name)
+        current = self.data['aliases'].get(alias)
+        if entry and current and current['hash'] == entry['hash'] and self.models.exists(alias):
+            print(f"♻️ '{alias}' already serves {name}")
+            return True
+
+        if not self.models.copy(name, alias):
+            print(f"❌ Failed to promote {name} to '{alias}'")
+            return False
+
+        self.data['aliases'][alias] = {
+            'model': name,
+            'hash': entry['hash'] if entry else None,
+            'score': entry['score'] if entry else None,
+            'promoted_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        self.save()
+        return True
+
+    def alias(self, alias: str) -> Optional[Dict]:
+        return self.data['aliases'].get(alias)
+
+    def best(self) -> Optional[str]:
+        """Highest-scoring model recorded so far"""
+        scored = [(entry['score'], name) for name, entry in self.data['models'].items()
+                  if entry.get('score') is not None]
+        return max(scored)[1] if scored else None
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Stub Model Server
+Deterministic stand-in for an Ollama server so training and evaluation
+loops run on machines without a model. Implements the parts of the HTTP
+API the project uses: /api/create, /api/copy, /api/delete, /api/generate,
+/api/show, /api/tags and /api/version.
+
+Responses come from, in order: a scripted prompt -> response table, the
+Input:/Output: examples and MESSAGE pairs of the model's Modelfile, the
+training corpora, and finally a corpus output chosen by hashing the prompt.
+"""
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+DEFAULT_CORPUS = ['tinkybink_master_unique_final.jsonl']
+DEFAULT_RESPONSE = "😊 Yes, ❌ No, 🤔 Maybe, 💭 Let me think"
+
+_EXAMPLE_PATTERN = re.compile(r'^Input:\s*(.+?)\s*\nOutput:\s*(.+?)\s*$', re.MULTILINE)
+
+def normalize_prompt(prompt: str) -> str:
+    return ' '.join(prompt.lower().split())
+
+def load_corpus(paths: List[str]) -> Dict[str, str]:
+    """input -> output from JSONL corpora; the first occurrence wins"""
+    table = {}
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    example = json.loads(line)
+                    if example.get('input') and example.get('output'):
+                        table.setdefault(normalize_prompt(example['input']), example['output'].strip())
+        except FileNotFoundError:
+            print(f"⚠️ Corpus not found: {path}")
+    return table
+
+def modelfile_examples(fields: Dict) -> Dict[str, str]:
+    """Prompt -> response pairs embedded in a created model's definition"""
+    examples = {}
+    for prompt, response in _EXAMPLE_PATTERN.findall(fields.get('system', '')):
+        examples.setdefault(normalize_prompt(prompt), response)
+    messages = fields.get('messages', [])
+    for message, reply in zip(messages, messages[1:]):
+        if message.get('role') == 'user' and reply.get('role') == 'assistant':
+            examples.setdefault(normalize_prompt(message['content']), reply['content'].strip())
+    return examples
+
+class StubModelStore:
+    """Created models and the lookup tables that answer for them"""
+
+    def __init__(self, corpus: Optional[Dict[str, str]] = None, script: Optional[Dict[str, str]] = None,
+                 default: str = DEFAULT_RESPONSE):
+        self.corpus = corpus or {}
+        self.script = {normalize_prompt(k): v for k, v in (script or {}).items()}
+        self.default = default
+        self.models = {}
+        self._fallbacks = sorted(set(self.corpus.values()))
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def canonical(name: str) -> str:
+        return name if ':' in name else f"{name}:latest"
+
+    def create(self, name: str, fields: Dict):
+        definition = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+        with self._lock:
+            self.models[self.canonical(name)] = {
+                'digest': hashlib.sha256(definition.encode('utf-8')).hexdigest(),
+                'size': len(definition),
+                'modified_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'examples': modelfile_examples(fields),
+            }
+
+    def copy(self, source: str, destination: str) -> bool:
+        with self._lock:
+            model = self.models.get(self.canonical(source))
+            if model is None:
+                return False
+            self.models[self.canonical(destination)] = dict(model)
+            return True
+
+    def delete(self, name: str) -> bool:
+        with self._lock:
+            return self.models.pop(self.canonical(name), None) is not None
+
+    def get(self, name: str) -> Optional[Dict]:
+        return self.models.get(self.canonical(name))
+
+    def tags(self) -> List[Dict]:
+        return [{'name': name, 'model': name, 'digest': model['digest'],
+                 'size': model['size'], 'modified_at': model['modified_at']}
+                for name, model in sorted(self.models.items())]
+
+    def respond(self, model: Dict, prompt: str, options: Optional[Dict] = None) -> str:
+        key = normalize_prompt(prompt)
+        for table in (self.script, model['examples'], self.corpus):
+            if key in table:
+                return table[key]
+        if not self._fallbacks:
+            return self.default
+        # Same model + prompt + options always lands on the same corpus output
+        seed = f"{model['digest']}\0{key}\0{json.dumps(options or {}, sort_keys=True)}"
+        digest = hashlib.sha256(seed.encode('utf-8')).digest()
+        return self._fallbacks[int.from_bytes(digest[:8], 'big') % len(self._fallbacks)]
+
+def make_handler(store: StubModelStore, latency: float = 0.0):
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _body(self) -> Dict:
+            length = int(self.headers.get('Content-Length') or 0)
+            return json.loads(self.rfile.read(length) or b'{}')
+
+        def _reply(self, status: int, payload: Optional[Dict] = None):
+            body = json.dumps(payload or {}, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/api/tags':
+                self._reply(200, {'models': store.tags()})
+            elif self.path == '/api/version':
+                self._reply(200, {'version': '0.0.0-stub'})
+            else:
+                self._reply(404, {'error': 'not found'})
+
+        def do_POST(self):
+            body = self._body()
+            name = body.get('model') or body.get('name', '')
+
+            if self.path == '/api/create':
+                if not name:
+                    self._reply(400, {'error': 'model is required'})
+                    return
+                fields = {key: value for key, value in body.items() if key not in ('model', 'name', 'stream')}
+                store.create(name, fields)
+                self._reply(200, {'status': 'success'})
+
+            elif self.path == '/api/copy':
+                if store.copy(body.get('source', ''), body.get('destination', '')):
+                    self._reply(200)
+                else:
+                    self._reply(404, {'error': f"model '{body.get('source', '')}' not found"})
+
+            elif self.path == '/api/show':
+                model = store.get(name)
+                if model is None:
+                    self._reply(404, {'error': f"model '{name}' not found"})
+                else:
+                    self._reply(200, {'digest': model['digest'], 'modified_at': model['modified_at']})
+
+            elif self.path == '/api/generate':
+                model = store.get(name)
+                if model is None:
+                    self._reply(404, {'error': f"model '{name}' not found"})
+                    return
+                start = time.perf_counter()
+                if latency:
+                    time.sleep(latency)
+                response = store.respond(model, body.get('prompt', ''), body.get('options'))
+                elapsed_ns = int((time.perf_counter() - start) * 1e9)
+                self._reply(200, {
+                    'model': name,
+                    'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                    'response': response,
+                    'done': True,
+                    'eval_count': len(response.split()),
+                    'eval_duration': elapsed_ns,
+                    'total_duration': elapsed_ns,
+                })
+
+            else:
+                self._reply(404, {'error': 'not found'})
+
+        def do_DELETE(self):
+            if self.path != '/api/delete':
+                self._reply(404, {'error': 'not found'})
+                return
+            name = self._body().get('model', '')
+            if store.delete(name):
+                self._reply(200)
+            else:
+                self._reply(404, {'error': f"model '{name}' not found"})
+
+    return StubHandler
+
+def start_server(store: StubModelStore, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0) -> ThreadingHTTPServer:
+    """Serve in a background thread; port 0 picks a free port"""
+    server = ThreadingHTTPServer((host, port), make_handler(store, latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Deterministic stand-in for the Ollama HTTP API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--corpus', nargs='*', default=DEFAULT_CORPUS, help="JSONL files with input/output pairs")
+    parser.add_argument('--script', help="JSON file mapping prompt -> response, checked first")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every generate call")
+    args = parser.parse_args()
+
+    script = None
+    if args.script:
+        with open(args.script, 'r', encoding='utf-8') as f:
+            script = json.load(f)
+
+    store = StubModelStore(load_corpus(args.corpus), script)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(store, args.latency))
+
+    print("🧪 TinkyBink Stub Model Server")
+    print("=" * 50)
+    print(f"📚 {len(store.corpus):,} corpus prompts | {len(store.script):,} scripted")
+    print(f"🌐 Listening on {server_url(server)}")
+    print(f"   export OLLAMA_HOST={server_url(server)} TINKYBINK_MODEL_BACKEND=http")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Multilingual Suggestion Index
+One inverted index per language, built once from the training_es,
+training_zh and training_ru node files. A lookup only touches the index
+of the requested language.
+"""
+import glob
+import json
+import math
+import os
+import time
+from collections import Counter
+from typing import Dict, List
+
+from text_normalizer import tokenize
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LANGUAGE_DIRS = {
+    'es': 'training_es',
+    'zh': 'training_zh',
+    'ru': 'training_ru',
+}
+
+# Where a term came from decides how much a match on it counts
+FIELD_WEIGHTS = {
+    'text': 2.0,
+    'context_tags': 1.5,
+    'pinyin': 1.5,
+    'transliteration': 1.5,
+    'category': 1.0,
+    'responses': 0.5,
+}
+
+def index_terms(text: str, lang: str) -> List[str]:
+    """Stemmed words for space-separated languages; characters, bigrams and pinyin for Chinese"""
+    return tokenize(text, lang)
+
+def load_nodes(directory: str) -> List[Dict]:
+    """Every node in a language directory, tagged with its file's category"""
+    nodes = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for node in data.get('nodes', []):
+            nodes.append(dict(node, category=data.get('category', '')))
+    return nodes
+
+class LanguageIndex:
+    """Inverted index over one language's nodes"""
+
+    def __init__(self, lang: str, nodes: List[Dict]):
+        self.lang = lang
+        self.nodes = nodes
+        weights = {}
+        for position, node in enumerate(nodes):
+            node_weights = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                value = node.get(field) or ''
+                texts = value if isinstance(value, list) else [value]
+                for text in texts:
+                    for term in index_terms(text, lang):
+                        node_weights[term] = max(node_weights.get(term, 0.0), weight)
+            for term, weight in node_weights.items():
+                weights.setdefault(term, {})[position] = weight
+
+        # Rare terms say more about a node than ones every category shares
+        total = len(nodes)
+        self.postings = {
+            term: [(position, weight * math.log(1 + total / len(entries)))
+                   for position, weight in entries.items()]
+            for term, entries in weights.items()
+        }
+
+    @classmethod
+    def from_directory(cls, lang: str, directory: str) -> 'LanguageIndex':
+        return cls(lang, load_nodes(directory))
+
+    def search(self, question: str, limit: int = 6) -> List[Dict]:
+        """Best-matching nodes for the question, highest score first"""
+        scores = Counter()
+        for term in set(index_terms(question, self.lang)):
+            for position, weight in self.postings.get(term, ()):
+                scores[position] += weight
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [dict(self.nodes[position], score=score) for position, score in ranked]
+
+    def suggest(self, question: str, limit: int = 6) -> List[Dict]:
+        """Tiles in the shape /api/suggest returns"""
+        matches = self.search(question, limit)
+        if not matches:
+            # Nothing matched: offer the first node of each category
+            firsts = {}
+            for node in self.nodes:
+                firsts.setdefault(node['category'], node)
+            matches = [dict(node, score=1.0) for node in list(firsts.values())[:limit]]
+        top = matches[0]['score']
+        return [{
+            'emoji': node['emoji'],
+            'text': node['text'],
+            'confidence': round(0.6 + 0.35 * node['score'] / top, 2),
+            'category': node['category'],
+        } for node in matches]
+
+def load_language_indexes(root: str = ROOT_DIR) -> Dict[str, LanguageIndex]:
+    """Build every available language index; languages without files are skipped"""
+    indexes = {}
+    for lang, dirname in LANGUAGE_DIRS.items():
+        directory = os.path.join(root, dirname)
+        if os.path.isdir(directory):
+            indexes[lang] = LanguageIndex.from_directory(lang, directory)
+    return indexes
+
+def main():
+    print("🌍 TinkyBink Multilingual Index Benchmark")
+    print("=" * 50)
+
+    for lang, dirname in LANGUAGE_DIRS.items():
+        directory = os.path.join(ROOT_DIR, dirname)
+        if not os.path.isdir(directory):
+            print(f"⚠️ {lang}: {directory} not found")
+            continue
+
+        start = time.perf_counter()
+        index = LanguageIndex.from_directory(lang, directory)
+        load_ms = 1000 * (time.perf_counter() - start)
+
+        # Every node's own text and tags make a realistic query set
+        queries = [node['text'] for node in index.nodes] + \
+                  [' '.join(node['context_tags']) for node in index.nodes]
+        start = time.perf_counter()
+        for query in queries:
+            index.suggest(query)
+        lookup_us = 1e6 * (time.perf_counter() - start) / len(queries)
+        hits = sum(1 for query in queries if index.search(query, 1))
+
+        print(f"{lang}: {len(index.nodes)} nodes, {len(index.postings):,} terms | "
+              f"load {load_ms:.1f} ms | lookup {lookup_us:.0f} µs | {hits}/{len(queries)} answered")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Modelfile Parameter Sweep
+Grid or random search over sampling parameters, evaluated concurrently on
+the benchmark question set. Parameters are passed as per-request options,
+so one model serves every candidate and nothing is rebuilt. Candidates are
+scored in rungs of questions; after each rung, configs clearly behind the
+leader are dropped.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from eval_matrix import BENCHMARK_QUESTIONS
+from eval_runner import EvalCache, EvalRunner, HTTPBackend, make_backend
+from response_scoring import production_score, response_metrics
+
+RESULTS_FILE = 'param_sweep_results.json'
+
+SEARCH_SPACE = {
+    'temperature': [0.2, 0.4, 0.6, 0.8],
+    'top_p': [0.6, 0.8, 0.9, 0.95],
+    'repeat_penalty': [1.0, 1.1, 1.2],
+    'top_k': [20, 40, 60],
+    'num_predict': [30, 40, 60],
+}
+
+# Questions answered before each pruning decision
+RUNGS = [3, 6, len(BENCHMARK_QUESTIONS)]
+
+def grid_candidates(space: Dict[str, List]) -> List[Dict]:
+    keys = sorted(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[k] for k in keys))]
+
+def random_candidates(space: Dict[str, List], count: int, seed: int = 42) -> List[Dict]:
+    """Distinct random picks from the grid, reproducible for a given seed"""
+    grid = grid_candidates(space)
+    return random.Random(seed).sample(grid, min(count, len(grid)))
+
+def resolve_backend_name(backend_name: Optional[str] = None) -> str:
+    return backend_name or os.environ.get('TINKYBINK_EVAL_BACKEND', 'http')
+
+def make_candidate_backend(backend_name: Optional[str], params: Dict):
+    name = resolve_backend_name(backend_name)
+    if name == 'http':
+        return HTTPBackend(options=params)
+    return make_backend(name)
+
+def evaluate_rung(runner: EvalRunner, model: str, questions: List[str]) -> List[Dict]:
+    outcomes = runner.run(model, questions)
+    for outcome in outcomes:
+        outcome['score'] = production_score(response_metrics(outcome['response']))
+    return outcomes
+
+def run_sweep(model: str, candidates: List[Dict], backend_name: Optional[str] = None,
+              concurrency: int = 4, margin: float = 1.5) -> List[Dict]:
+    """Evaluate candidates rung by rung, pruning those more than margin behind the best"""
+    cache = EvalCache()
+    states = []
+    for params in candidates:
+        runner = EvalRunner(make_candidate_backend(backend_name, params), concurrency=1, cache=cache)
+        states.append({'params': params, 'runner': runner, 'outcomes': [], 'pruned_at': None})
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for rung in RUNGS:
+            questions = BENCHMARK_QUESTIONS[done:rung]
+            alive = [state for state in states if state['pruned_at'] is None]
+            futures = [(state, pool.submit(evaluate_rung, state['runner'], model, questions))
+                       for state in alive]
+            for state, future in futures:
+                state['outcomes'].extend(future.result())
+            done = rung
+
+            means = {id(state): sum(o['score'] for o in state['outcomes']) / len(state['outcomes'])
+                     for state in alive}
+            leader = max(means.values())
+            if rung < len(BENCHMARK_QUESTIONS):
+                for state in alive:
+                    if means[id(state)] < leader - margin:
+                        state['pruned_at'] = rung
+            print(f"   🪜 {rung} questions: {len(alive)} evaluated, leader {leader:.2f}, "
+                  f"{sum(1 for s in alive if s['pruned_at'] is None)} continue")
+
+    cache.save()
+
+    results = []
+    for state in states:
+        outcomes = state['outcomes']
+        generated = [o for o in outcomes if not o['cached'] and o['response']]
+        results.append({
+            'params': state['params'],
+            'score': sum(o['score'] for o in outcomes) / len(outcomes),
+            'questions': len(outcomes),
+            'pruned_at': state['pruned_at'],
+            'latency_ms': 1000 * sum(o['latency'] for o in generated) / len(generated) if generated else None,
+            'errors': sorted({o['error'] for o in outcomes if o['error']}),
+        })
+
+    # Survivors first, then by score
+    results.sort(key=lambda r: (r['pruned_at'] is not None, -r['score']))
+    return results
+
+def save_results(model: str, results: List[Dict], backend_name: Optional[str] = None,
+                 path: str = RESULTS_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'model': model, 'backend': resolve_backend_name(backend_name),
+                   'swept_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'results': results}, f, indent=2)
+
+def load_best_params(model: str = 'tinkybink', path: str = RESULTS_FILE) -> Optional[Dict]:
+    """Top-ranked parameters from the last sweep of model on a real server.
+
+    Sweeps against the stub (which ignores parameters), of another model, or
+    whose winner hit errors (say, Ollama was down) are not worth trusting.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        sweep = json.load(f)
+    results = sweep.get('results', [])
+    if sweep.get('backend') != 'http' or sweep.get('model') != model or not results or results[0].get('errors'):
+        return None
+    return results[0]['params']
+
+def print_results_table(results: List[Dict], limit: int = 15):
+    keys = sorted(SEARCH_SPACE)
+    header = ' '.join(f"{key:>14}" for key in keys)
+    print(f"\n{'Rank':<5} {header} {'Score':>6} {'Qs':>3} {'Status':>10}")
+    print("-" * (5 + 15 * len(keys) + 23))
+    for rank, result in enumerate(results[:limit], 1):
+        values = ' '.join(f"{result['params'][key]:>14}" for key in keys)
+        status = f"pruned@{result['pruned_at']}" if result['pruned_at'] else 'complete'
+        print(f"{rank:<5} {values} {result['score']:>6.2f} {result['questions']:>3} {status:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep Modelfile sampling parameters on the benchmark set")
+    parser.add_argument('--model', default='tinkybink', help="Model to evaluate with per-request options")
+    parser.add_argument('--mode', choices=['grid', 'random'], default='random')
+    parser.add_argument('--samples', type=int, default=24, help="Candidates for random search")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--backend', default=None, help="http or stub (default: TINKYBINK_EVAL_BACKEND or http)")
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--margin', type=float, default=1.5, help="Prune configs this far behind the leader")
+    args = parser.parse_args()
+
+    print("🎛️ TinkyBink Parameter Sweep")
+    print("=" * 50)
+
+    if args.mode == 'grid':
+        candidates = grid_candidates(SEARCH_SPACE)
+    else:
+        candidates = random_candidates(SEARCH_SPACE, args.samples, args.seed)
+    print(f"🔍 {len(candidates)} {args.mode} candidates on '{args.model}' | concurrency {args.concurrency}")
+
+    start = time.perf_counter()
+    results = run_sweep(args.model, candidates, args.backend, args.concurrency, args.margin)
+    print(f"⏱️ Sweep time: {time.perf_counter() - start:.1f}s")
+
+    print_results_table(results)
+    save_results(args.model, results, args.backend)
+    print(f"\n💾 Results saved: {RESULTS_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Phrase Trie
+Word-level longest-match phrase lookup shared by the emoji and text matchers
+"""
+import re
+from typing import Dict, List, Optional
+
+from text_normalizer import fold
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+def tokenize_words(text: str) -> List[str]:
+    """Fold case and width, then split text into word tokens"""
+    return WORD_PATTERN.findall(fold(text))
+
+class PhraseTrie:
+    """Trie over word tokens mapping phrases to values.
+
+    Phrases only match on whole-word boundaries. When several phrases occur
+    in the same text the longest one wins, then the one that occurs first,
+    then the one that was added first, so results never depend on dict order.
+    """
+
+    _VALUE = object()
+
+    def __init__(self, phrases: Optional[Dict[str, object]] = None):
+        self._root = {}
+        self._size = 0
+        if phrases:
+            for phrase, value in phrases.items():
+                self.add(phrase, value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, phrase: str, value) -> None:
+        """Add a phrase; re-adding a phrase replaces its value but keeps its rank"""
+        tokens = tokenize_words(phrase)
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if self._VALUE not in node:
+            node[self._VALUE] = (self._size, value)
+            self._size += 1
+        else:
+            node[self._VALUE] = (node[self._VALUE][0], value)
+
+    def best_match_tokens(self, tokens: List[str]):
+        """Value of the highest priority phrase in a token list, or None"""
+        best_key = None
+        best_value = None
+        for start in range(len(tokens)):
+            node = self._root
+            for offset in range(start, len(tokens)):
+                node = node.get(tokens[offset])
+                if node is None:
+                    break
+                entry = node.get(self._VALUE)
+                if entry is not None:
+                    key = (-(offset - start + 1), start, entry[0])
+                    if best_key is None or key < best_key:
+                        best_key = key
+                        best_value = entry[1]
+        return best_value
+
+    def best_match(self, text: str):
+        """Value of the highest priority phrase in text, or None"""
+        return self.best_match_tokens(tokenize_words(text))
+
@@ -4,17 +4,21 @@ TinkyBink Ultimate Polish Master
 Refines and perfects the AAC model to production-ready excellence
 """
 import json
-import subprocess
 import os
 import re
 from typing import Dict, List, Tuple
 from collections import defaultdict
 import random
+from eval_runner import EvalRunner
+from model_registry import ModelRegistry
+from response_scoring import polish_score, quality_score, response_metrics
 
 class PolishMaster:
     def __init__(self):
         self.quality_metrics = {}
         self.refinement_iterations = 0
+        self.eval_runner = EvalRunner()
+        self.registry = ModelRegistry()
         
     def analyze_current_model_quality(self) -> Dict:
         """Analyze current model quality and identify improvement areas"""
@@ -50,43 +54,38 @@ class PolishMaster:
         ]
         
         quality_analysis = {}
+        results = self.eval_runner.run('tinkybink', [test['input'] for test in quality_tests])
         
-        for test in quality_tests:
+        for test, result in zip(quality_tests, results):
             print(f"\n🧪 Testing: {test['category']}")
             print(f"Input: '{test['input']}'")
             
-            try:
-                result = subprocess.run(['ollama', 'run', 'tinkybink'],
-                                      input=test['input'], text=True,
-                                      capture_output=True, timeout=15)
-                
-                if result.stdout:
-                    response = result.stdout.strip()
-                    print(f"Response: {response[:80]}...")
-                    
-                    # Analyze quality patterns
-                    quality_score = self.evaluate_response_quality(response, test['expected_patterns'])
-                    quality_analysis[test['category']] = {
-                        'response': response,
-                        'score': quality_score,
-                        'improvements_needed': self.identify_improvements(response, test['expected_patterns'])
-                    }
-                    print(f"Quality Score: {quality_score}/10")
-                    
-                else:
-                    quality_analysis[test['category']] = {
-                        'response': '',
-                        'score': 0,
-                        'improvements_needed': ['no_response']
-                    }
-                    
-            except Exception as e:
-                print(f"Error: {e}")
+            if result['error']:
+                print(f"Error: {result['error']}")
                 quality_analysis[test['category']] = {
                     'response': '',
                     'score': 0,
                     'improvements_needed': ['test_failed']
                 }
+            elif result['response']:
+                response = result['response']
+                print(f"Response: {response[:80]}...")
+                
+                # Analyze quality patterns
+                quality_score = self.evaluate_response_quality(response, test['expected_patterns'])
+                quality_analysis[test['category']] = {
+                    'response': response,
+                    'score': quality_score,
+                    'improvements_needed': self.identify_improvements(response, test['expected_patterns'])
+                }
+                print(f"Quality Score: {quality_score}/10")
+                
+            else:
+                quality_analysis[test['category']] = {
+                    'response': '',
+                    'score': 0,
+                    'improvements_needed': ['no_response']
+                }
         
         # Calculate overall quality
         scores = [analysis['score'] for analysis in quality_analysis.values()]
@@ -98,44 +97,7 @@ class PolishMaster:
     
     def evaluate_response_quality(self, response: str, expected_patterns: List[str]) -> int:
         """Evaluate response quality against expected patterns"""
-        score = 0
-        max_score = 10
-        
-        # Check for emojis (2 points)
-        if re.search(r'[^\x00-\x7F]', response):
-            score += 2
-        
-        # Check for comma separation (2 points) 
-        if response.count(',') >= 3:
-            score += 2
-        elif response.count(',') >= 1:
-            score += 1
-        
-        # Check for appropriate length (2 points)
-        if 20 <= len(response) <= 200:
-            score += 2
-        elif 10 <= len(response) <= 300:
-            score += 1
-        
-        # Check for pattern-specific quality (4 points)
-        pattern_score = 0
-        for pattern in expected_patterns:
-            if pattern == 'emoji_present' and re.search(r'[^\x00-\x7F]', response):
-                pattern_score += 1
-            elif pattern == 'four_responses' and response.count(',') >= 3:
-                pattern_score += 1
-            elif pattern == 'emergency_emoji' and any(emoji in response for emoji in ['🚨', '🆘', '📞', '🏥']):
-                pattern_score += 1
-            elif pattern == 'medical_appropriate' and any(word in response.lower() for word in ['doctor', 'help', 'emergency', 'call']):
-                pattern_score += 1
-            elif pattern == 'choice_extraction' and any(word in response.lower() for word in ['apple', 'orange', 'juice']):
-                pattern_score += 1
-            elif pattern == 'therapeutic_language' and any(word in response.lower() for word in ['understand', 'progress', 'try', 'support']):
-                pattern_score += 1
-        
-        score += min(4, pattern_score)
-        
-        return min(max_score, score)
+        return quality_score(response_metrics(response), expected_patterns)
     
     def identify_improvements(self, response: str, expected_patterns: List[str]) -> List[str]:
         """Identify specific improvements needed"""
@@ -522,22 +484,18 @@ Output: \"\"\"
             f.write(modelfile_content)
         
         # Create the ultimate polished model
-        subprocess.run(['ollama', 'rm', 'tinkybink'], capture_output=True)
-        subprocess.run(['ollama', 'rm', 'tinkybink_polished'], capture_output=True)
-        
-        result = subprocess.run(['ollama', 'create', 'tinkybink_polished', '-f', modelfile_path],
-                              capture_output=True, text=True)
+        ok, error = self.registry.ensure('tinkybink_polished', modelfile_path, [polished_dataset])
         
-        if result.returncode == 0:
+        if ok:
             print("✅ Ultimate Polished Model Created!")
             
             # Update main tinkybink model
-            subprocess.run(['ollama', 'create', 'tinkybink', '-f', modelfile_path])
+            self.registry.promote('tinkybink', 'tinkybink_polished')
             print("✅ Updated main 'tinkybink' model with polished version")
             
             return 'tinkybink_polished'
         else:
-            print(f"❌ Failed to create polished model: {result.stderr}")
+            print(f"❌ Failed to create polished model: {error}")
             return None
     
     def comprehensive_polish_validation(self, model_name: str) -> Dict:
@@ -575,43 +533,39 @@ Output: \"\"\"
         
         validation_results = {}
         total_score = 0
+        results = self.eval_runner.run(model_name, [test['input'] for test in validation_tests])
         
-        for test in validation_tests:
+        for test, result in zip(validation_tests, results):
             print(f"\n💎 Validating: {test['category']}")
             print(f"Input: '{test['input']}'")
             
-            try:
-                result = subprocess.run(['ollama', 'run', model_name],
-                                      input=test['input'], text=True,
-                                      capture_output=True, timeout=20)
-                
-                if result.stdout:
-                    response = result.stdout.strip()
-                    print(f"Response: {response}")
-                    
-                    # Comprehensive quality evaluation
-                    quality_score = self.evaluate_polish_quality(response, test['quality_expectations'])
-                    validation_results[test['category']] = {
-                        'response': response,
-                        'quality_score': quality_score,
-                        'meets_expectations': quality_score >= 9
-                    }
-                    
-                    total_score += quality_score
-                    print(f"Polish Quality: {quality_score}/10 {'✨' if quality_score >= 9 else '🔧'}")
-                    
-            except Exception as e:
-                print(f"Error: {e}")
+            if result['error']:
+                print(f"Error: {result['error']}")
                 validation_results[test['category']] = {
                     'response': '',
                     'quality_score': 0,
                     'meets_expectations': False
                 }
+            elif result['response']:
+                response = result['response']
+                print(f"Response: {response}")
+                
+                # Comprehensive quality evaluation
+                quality_score = self.evaluate_polish_quality(response, test['quality_expectations'])
+                validation_results[test['category']] = {
+                    'response': response,
+                    'quality_score': quality_score,
+                    'meets_expectations': quality_score >= 9
+                }
+                
+                total_score += quality_score
+                print(f"Polish Quality: {quality_score}/10 {'✨' if quality_score >= 9 else '🔧'}")
         
         # Calculate overall polish quality
         overall_polish = total_score / len(validation_tests) if validation_tests else 0
         
         print(f"\n🏆 OVERALL POLISH QUALITY: {overall_polish:.1f}/10")
+        self.registry.record_score(model_name, overall_polish)
         
         if overall_polish >= 9.0:
             print("💎 EXCELLENCE ACHIEVED - Production Ready!")
@@ -626,47 +580,7 @@ Output: \"\"\"
     
     def evaluate_polish_quality(self, response: str, expectations: List[str]) -> int:
         """Evaluate polish quality against high standards"""
-        score = 0
-        max_score = 10
-        
-        # Format perfection (3 points)
-        if response.count(',') == 3:  # Exactly 4 responses
-            score += 2
-        if re.search(r'^[^\x00-\x7F]', response):  # Starts with emoji
-            score += 1
-        
-        # Emoji excellence (2 points)
-        emoji_count = len(re.findall(r'[^\x00-\x7F]', response))
-        if emoji_count >= 4:
-            score += 2
-        elif emoji_count >= 2:
-            score += 1
-        
-        # Response quality (3 points)
-        if 30 <= len(response) <= 120:  # Optimal length
-            score += 1
-        if not any(word in response.lower() for word in ['i am', 'i\'m a', 'as an ai']):  # No AI speak
-            score += 1
-        if response.count('.') <= 4:  # Not overly verbose
-            score += 1
-        
-        # Expectation-specific quality (2 points)
-        expectation_score = 0
-        for expectation in expectations:
-            if expectation == 'perfect_format' and response.count(',') == 3:
-                expectation_score += 0.5
-            elif expectation == 'emotional_range' and len(set(re.findall(r'[^\x00-\x7F]', response))) >= 3:
-                expectation_score += 0.5
-            elif expectation == 'medical_appropriate' and any(word in response.lower() for word in ['doctor', 'help', 'hospital', 'support']):
-                expectation_score += 0.5
-            elif expectation == 'emotional_intelligence' and any(word in response.lower() for word in ['understand', 'hear', 'feel', 'here']):
-                expectation_score += 0.5
-            elif expectation == 'achievement_celebration' and any(emoji in response for emoji in ['🎉', '💪', '🌟', '👏']):
-                expectation_score += 0.5
-        
-        score += min(2, int(expectation_score * 2))
-        
-        return min(max_score, score)
+        return polish_score(response_metrics(response), expectations)
     
     def run_complete_polish_process(self):
         """Run the complete polishing process"""
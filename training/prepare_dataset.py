@@ -4,9 +4,14 @@ TinkyBink AAC Dataset Preparation
 Creates training data for our custom small language model
 """
 
+import argparse
 import json
-import random
-from typing import List, Dict, Tuple
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 # Real AAC conversation patterns from nonverbal children
 AAC_CONVERSATIONS = [
@@ -53,39 +58,106 @@ RESPONSE_STYLES = [
     "shy", "confident", "silly", "serious", "creative", "literal"
 ]
 
-def generate_training_examples() -> List[Dict]:
-    """Generate diverse training examples with context"""
-    examples = []
-    
+# Every context a variant can be generated in, in a fixed order
+TIMES_OF_DAY = ["morning", "afternoon", "evening", "bedtime"]
+ENERGY_LEVELS = ["high", "medium", "low"]
+CONTEXTS = [
+    {"emotion": emotion, "style": style, "time_of_day": time_of_day, "energy_level": energy}
+    for emotion in EMOTIONAL_CONTEXTS
+    for style in RESPONSE_STYLES
+    for time_of_day in TIMES_OF_DAY
+    for energy in ENERGY_LEVELS
+]
+
+EMOTIONS_PER_CONVERSATION = 3
+STYLES_PER_EMOTION = 2
+DEFAULT_SEED = 42
+CHUNK_ROUNDS = 250
+
+@lru_cache(maxsize=None)
+def _fragment_tables() -> Tuple[List[str], List[str]]:
+    """Pre-serialized halves of every example line.
+
+    heads[(instruction * conversations + conversation) * emotions + emotion]
+    holds '{"instruction": ..., "input": ..., ' and
+    tails[conversation * contexts + context] holds '"output": ..., "metadata": ...}'.
+    Every response rewrite and emoji lookup happens here, once per combination.
+    """
+    instructions = create_instruction_variants()
+    heads = []
+    for instruction in instructions:
+        for parent_input, _ in AAC_CONVERSATIONS:
+            for emotional_state in EMOTIONAL_CONTEXTS:
+                head = json.dumps({
+                    "instruction": instruction,
+                    "input": f"Context: Child is feeling {emotional_state}. Parent says: \"{parent_input}\""
+                })
+                heads.append(head[:-1] + ", ")
+
+    tails = []
     for parent_input, child_responses in AAC_CONVERSATIONS:
-        # Generate multiple variants with different contexts
-        for emotional_state in random.sample(EMOTIONAL_CONTEXTS, 3):
-            for response_style in random.sample(RESPONSE_STYLES, 2):
-                # Create a training example
-                context = {
-                    "emotion": emotional_state,
-                    "style": response_style,
-                    "time_of_day": random.choice(["morning", "afternoon", "evening", "bedtime"]),
-                    "energy_level": random.choice(["high", "medium", "low"])
-                }
-                
-                # Adjust responses based on context
-                contextual_responses = adjust_responses_for_context(
-                    child_responses, context
-                )
-                
-                example = {
-                    "instruction": "You are a nonverbal child using an AAC device. Respond in a simple, child-like way.",
-                    "input": f"Context: Child is feeling {emotional_state}. Parent says: \"{parent_input}\"",
-                    "output": format_aac_responses(contextual_responses),
-                    "metadata": {
-                        "category": categorize_conversation(parent_input),
-                        "context": context
-                    }
-                }
-                examples.append(example)
-    
-    return examples
+        category = categorize_conversation(parent_input)
+        for context in CONTEXTS:
+            tail = json.dumps({
+                "output": format_aac_responses(adjust_responses_for_context(child_responses, context)),
+                "metadata": {"category": category, "context": context}
+            })
+            tails.append(tail[1:] + "\n")
+    return heads, tails
+
+def augment_chunk(seed: int, chunk: int, rounds: int) -> str:
+    """JSONL for `rounds` rounds of variants, from chunk's own RNG stream.
+
+    A round gives every conversation 3 distinct emotions x 2 distinct styles
+    with a random time of day, energy level and instruction each. Chunk n
+    always draws from SeedSequence(seed, spawn_key=(n,)), so the text depends
+    only on (seed, chunk, rounds), not on which worker produced it.
+    """
+    heads, tails = _fragment_tables()
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk,)))
+    conversations = len(AAC_CONVERSATIONS)
+    shape = (rounds, conversations, EMOTIONS_PER_CONVERSATION, STYLES_PER_EMOTION)
+
+    # random.sample without replacement, for all rounds at once
+    emotions = np.argsort(rng.random((rounds, conversations, len(EMOTIONAL_CONTEXTS))), axis=-1)
+    emotions = emotions[..., :EMOTIONS_PER_CONVERSATION, None]
+    styles = np.argsort(rng.random(shape[:3] + (len(RESPONSE_STYLES),)), axis=-1)[..., :STYLES_PER_EMOTION]
+    times = rng.integers(0, len(TIMES_OF_DAY), shape)
+    energies = rng.integers(0, len(ENERGY_LEVELS), shape)
+    instructions = rng.integers(0, len(heads) // (conversations * len(EMOTIONAL_CONTEXTS)), shape)
+
+    conversation = np.arange(conversations)[None, :, None, None]
+    context = ((emotions * len(RESPONSE_STYLES) + styles) * len(TIMES_OF_DAY) + times) * len(ENERGY_LEVELS) + energies
+    head_index = ((instructions * conversations + conversation) * len(EMOTIONAL_CONTEXTS) + emotions).ravel()
+    tail_index = (conversation * len(CONTEXTS) + context).ravel()
+    return ''.join([heads[h] + tails[t] for h, t in zip(head_index.tolist(), tail_index.tolist())])
+
+def augment(seed: int = DEFAULT_SEED, rounds: int = 1, workers: Optional[int] = None,
+            chunk_rounds: int = CHUNK_ROUNDS) -> Iterator[str]:
+    """Yield JSONL chunks in order; byte-identical for a given seed and rounds"""
+    chunks = [(seed, chunk, min(chunk_rounds, rounds - chunk * chunk_rounds))
+              for chunk in range((rounds + chunk_rounds - 1) // chunk_rounds)]
+    if workers == 1 or len(chunks) == 1:
+        _fragment_tables()
+        for args in chunks:
+            yield augment_chunk(*args)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_fragment_tables) as pool:
+        yield from pool.map(augment_chunk, *zip(*chunks))
+
+def generate_training_examples(seed: int = DEFAULT_SEED, rounds: int = 1) -> List[Dict]:
+    """Generate diverse training examples with context"""
+    return [json.loads(line) for text in augment(seed, rounds, workers=1) for line in text.splitlines()]
+
+def save_augmented(filename: str, seed: int = DEFAULT_SEED, rounds: int = 1,
+                   workers: Optional[int] = None) -> int:
+    """Stream augmented examples to filename; returns how many were written"""
+    written = 0
+    with open(filename, 'w') as f:
+        for text in augment(seed, rounds, workers):
+            f.write(text)
+            written += text.count('\n')
+    return written
 
 def adjust_responses_for_context(responses: List[str], context: Dict) -> List[str]:
     """Modify responses based on emotional context"""
@@ -193,28 +265,34 @@ def create_validation_set():
     ]
     return val_examples
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(description="Generate the TinkyBink AAC training set")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Same seed, same bytes")
+    parser.add_argument("--rounds", type=int, default=1,
+                        help=f"Rounds of variants ({len(AAC_CONVERSATIONS) * EMOTIONS_PER_CONVERSATION * STYLES_PER_EMOTION} examples each)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", default="tinkybink_train.jsonl")
+    args = parser.parse_args()
+    if args.rounds < 1:
+        parser.error("--rounds must be at least 1")
+
     print("🧠 TinkyBink AAC Dataset Generator")
     print("==================================\n")
     
     # Generate training data
-    train_examples = generate_training_examples()
-    print(f"Generated {len(train_examples)} training examples")
-    
-    # Add more variety with instruction variants
-    final_examples = []
-    instructions = create_instruction_variants()
-    
-    for example in train_examples:
-        example["instruction"] = random.choice(instructions)
-        final_examples.append(example)
-    
-    # Save datasets
-    save_dataset(final_examples, "tinkybink_train.jsonl")
+    start = time.perf_counter()
+    written = save_augmented(args.output, args.seed, args.rounds, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"✅ Saved {written:,} training examples to {args.output} "
+          f"(seed {args.seed}, {elapsed:.2f}s, {60 * written / elapsed:,.0f} variants/min)")
     save_dataset(create_validation_set(), "tinkybink_val.jsonl")
     
     # Show sample
-    print("\n📝 Sample training example:")
-    print(json.dumps(final_examples[0], indent=2))
+    with open(args.output) as f:
+        print("\n📝 Sample training example:")
+        print(json.dumps(json.loads(f.readline()), indent=2))
     
-    print("\n✨ Dataset ready for training custom TinkyBink SLM!")
\ No newline at end of file
+    print("\n✨ Dataset ready for training custom TinkyBink SLM!")
+
+if __name__ == "__main__":
+    main()
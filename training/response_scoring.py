@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Response Scoring Engine
+Parses model responses into tiles once and scores them from shared metrics.
+Every trainer's 0-10 score is a profile over the same metrics.
+"""
+import json
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+from tile_parser import is_emoji, parse_column, parse_tiles
+
+# Phrases that mean the model is talking about itself instead of giving tiles
+AI_SPEAK = ('i am', "i'm a", 'as an ai', 'i can help', 'i understand that')
+
+# Per-pattern checks used by the trainers' expectation lists
+PATTERN_EMOJIS = {
+    'emergency_emoji': {'🚨', '🆘', '📞', '🏥'},
+    'achievement_celebration': {'🎉', '💪', '🌟', '👏'},
+}
+PATTERN_WORDS = {
+    'medical_appropriate': ('doctor', 'help', 'emergency', 'call', 'hospital', 'support'),
+    'choice_extraction': ('apple', 'orange', 'juice'),
+    'therapeutic_language': ('understand', 'progress', 'try', 'support'),
+    'emotional_intelligence': ('understand', 'hear', 'feel', 'here'),
+}
+
+_WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+def parse_response(response: str) -> List[Dict]:
+    """Split 'emoji words, emoji words' into tiles; emoji is '' when a part has none"""
+    return parse_tiles(response, tile_ids=False)
+
+def _tile_words(tiles: List[Dict]) -> set:
+    words = set()
+    for tile in tiles:
+        words.update(_WORD_PATTERN.findall(tile['words'].lower()))
+    return words
+
+def response_metrics(response: str, reference_tiles: Optional[List[Dict]] = None,
+                     tiles: Optional[List[Dict]] = None) -> Dict:
+    """All scoring inputs for one response, computed in one pass"""
+    text = response.strip()
+    lower = text.lower()
+    if tiles is None:
+        tiles = parse_response(text)
+    emojis = [tile['emoji'] for tile in tiles if is_emoji(tile['emoji'])]
+    tile_keys = [tile['words'].lower() for tile in tiles]
+
+    metrics = {
+        'text': text,
+        'lower': lower,
+        'tiles': tiles,
+        'tile_count': len(tiles),
+        'emoji_count': len(emojis),
+        'emojis': set(emojis),
+        'starts_with_emoji': bool(tiles) and is_emoji(tiles[0]['emoji']),
+        'duplicate_tiles': len(tile_keys) - len(set(tile_keys)),
+        'length': len(text),
+        'sentence_marks': text.count('.'),
+        'ai_speak': any(phrase in lower for phrase in AI_SPEAK),
+        'reference_overlap': None,
+    }
+
+    if reference_tiles is not None:
+        ours, theirs = _tile_words(tiles), _tile_words(reference_tiles)
+        union = ours | theirs
+        metrics['reference_overlap'] = len(ours & theirs) / len(union) if union else 0.0
+
+    return metrics
+
+def metrics_batch(responses: List[str], references: Optional[List[List[Dict]]] = None) -> List[Dict]:
+    """Metrics for a whole column of responses, tiles parsed in one bulk pass"""
+    columns = parse_column(responses, tile_ids=False)
+    if references is None:
+        references = [None] * len(responses)
+    return [response_metrics(response, reference, tiles)
+            for response, reference, tiles in zip(responses, references, columns)]
+
+def pattern_matches(metrics: Dict, pattern: str) -> bool:
+    """Check one named expectation against a response's metrics"""
+    if pattern == 'emoji_present':
+        return metrics['emoji_count'] >= 1
+    if pattern == 'four_responses':
+        return metrics['tile_count'] >= 4
+    if pattern == 'perfect_format':
+        return metrics['tile_count'] == 4
+    if pattern == 'emotional_range':
+        return len(metrics['emojis']) >= 3
+    if pattern in PATTERN_EMOJIS:
+        return bool(metrics['emojis'] & PATTERN_EMOJIS[pattern])
+    if pattern in PATTERN_WORDS:
+        return any(word in metrics['lower'] for word in PATTERN_WORDS[pattern])
+    return False
+
+def basic_score(metrics: Dict) -> int:
+    """Quick sanity score used between continuous training iterations"""
+    if not metrics['text']:
+        return 0
+    score = 5
+    if metrics['emoji_count']:
+        score += 2
+    if 10 <= metrics['length'] <= 200:
+        score += 1
+    if metrics['tile_count'] >= 2:
+        score += 2
+    return min(score, 10)
+
+def quality_score(metrics: Dict, patterns: List[str]) -> int:
+    """Format plus up to four points for matched expectation patterns"""
+    if not metrics['text']:
+        return 0
+    score = 0
+    if metrics['emoji_count']:
+        score += 2
+    if metrics['tile_count'] >= 4:
+        score += 2
+    elif metrics['tile_count'] >= 2:
+        score += 1
+    if 20 <= metrics['length'] <= 200:
+        score += 2
+    elif 10 <= metrics['length'] <= 300:
+        score += 1
+    score += min(4, sum(pattern_matches(metrics, pattern) for pattern in patterns))
+    return min(10, score)
+
+def polish_score(metrics: Dict, expectations: List[str]) -> int:
+    """Strict score: exactly four emoji-led tiles, concise, no AI speak"""
+    if not metrics['text']:
+        return 0
+    score = 0
+    if metrics['tile_count'] == 4:
+        score += 2
+    if metrics['starts_with_emoji']:
+        score += 1
+    if metrics['emoji_count'] >= 4:
+        score += 2
+    elif metrics['emoji_count'] >= 2:
+        score += 1
+    if 30 <= metrics['length'] <= 120:
+        score += 1
+    if not metrics['ai_speak']:
+        score += 1
+    if metrics['sentence_marks'] <= 4:
+        score += 1
+    score += min(2, sum(pattern_matches(metrics, e) for e in expectations))
+    return min(10, score)
+
+def production_score(metrics: Dict) -> int:
+    """Production readiness: format, length, emoji usage, no AI speak"""
+    if not metrics['text']:
+        return 0
+    score = 0
+    if metrics['tile_count'] == 4:
+        score += 2
+    elif metrics['tile_count'] >= 2:
+        score += 1
+    if metrics['starts_with_emoji']:
+        score += 2
+    if 25 <= metrics['length'] <= 80:
+        score += 2
+    elif 15 <= metrics['length'] <= 120:
+        score += 1
+    if not metrics['ai_speak']:
+        score += 2
+    if metrics['emoji_count'] >= 4:
+        score += 2
+    elif metrics['emoji_count'] >= 2:
+        score += 1
+    return min(10, score)
+
+def score_batch(responses: List[str], profile=production_score, **kwargs) -> List[int]:
+    """Score a column of responses with one profile"""
+    return [profile(metrics, **kwargs) for metrics in metrics_batch(responses)]
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'tinkybink_master_unique_final.jsonl'
+
+    print("📏 TinkyBink Response Scoring Benchmark")
+    print("=" * 50)
+
+    responses = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                responses.append(json.loads(line).get('output', ''))
+
+    start = time.perf_counter()
+    scores = score_batch(responses)
+    elapsed = time.perf_counter() - start
+
+    print(f"📊 Scored {len(scores):,} responses from {path}")
+    print(f"⚡ {len(scores) / elapsed:,.0f} responses/second")
+    print(f"🎯 Mean production score: {sum(scores) / len(scores):.2f}/10")
+
+if __name__ == "__main__":
+    main()
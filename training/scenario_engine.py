@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Scenario Engine
+Streams AAC examples from declarative scenario files in training/scenarios.
+Each file is JSONL with three kinds of lines:
+
+  {"section": "sensory", "label": "Sensory & Accessibility",
+   "instruction": "AAC Sensory Accessibility", "emotion_level": "medium",
+   "spoken": "I need {first}."}
+  ["Sound is too loud", "🔊 Volume hurts ears, 🎧 Need headphones", "sensory"]
+  {"expand": {"fill_to": 20, "topics": ["repair", "parts"],
+              "input": "{Category} topic: {topic}", "output": "🔧 {Topic} work",
+              "spoken": "In {category}, I {first}."}}
+
+A section header applies to the rows after it. Rows are [input, output]
+or [input, output, category]. An expand line fills the section up to
+fill_to examples from topic templates, seeded by the section name.
+Templates may use {n} (row number in the section), {first} (first tile's
+words, lowercased), {category}, {Category}, {topic} and {Topic}. Sections
+without a spoken template or emotion level get them from the input text,
+the way enhance_aac_format does.
+
+Headers are compiled once; rows of unselected sections are skipped
+without being decoded.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from enhance_aac_format import generate_spoken_sentence
+from text_features import extract_features
+from tile_parser import parse_tiles
+
+SCENARIO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scenarios')
+
+def scenario_path(name: str) -> str:
+    """Path of a scenario file given its name or its own path"""
+    if os.path.exists(name):
+        return name
+    return os.path.join(SCENARIO_DIR, f"{name}.jsonl")
+
+class Section:
+    """A compiled section header"""
+
+    def __init__(self, header: Dict):
+        self.name = header['section']
+        self.label = header.get('label', self.name)
+        self.instruction = header.get('instruction', f"AAC {self.label}")
+        self.category = header.get('category')
+        self.emotion_level = header.get('emotion_level')
+        self.spoken = header.get('spoken')
+        self.count = 0
+        # Only templates that actually have fields go through str.format
+        self._instruction_template = '{' in self.instruction
+
+    def example(self, input_text: str, output_text: str, category: Optional[str] = None,
+                spoken: Optional[str] = None, **fields) -> Dict:
+        """One example in the aac_response schema"""
+        self.count += 1
+        tiles = parse_tiles(output_text, limit=4, default_emoji="💬")
+        features = None
+        if category is None:
+            category = self.category
+        if category is None or self.emotion_level is None:
+            features = extract_features(input_text)
+
+        fields.update(n=self.count, category=category or '', Category=(category or '').title(),
+                      first=tiles[0]['words'].lower() if tiles else '')
+        template = spoken or self.spoken
+        if template is None:
+            spoken_sentence = generate_spoken_sentence(tiles, input_text)
+        else:
+            spoken_sentence = template.format_map(fields)
+
+        return {
+            "instruction": self.instruction.format_map(fields) if self._instruction_template else self.instruction,
+            "input": input_text,
+            "aac_response": {
+                "tiles": tiles,
+                "spoken_sentence": spoken_sentence,
+                "usage_data": {
+                    "category": category if category is not None else features['category'],
+                    "emotion_level": self.emotion_level or features['emotion_level'],
+                    "complexity": len(tiles),
+                    "frequency_weight": 1.0
+                }
+            },
+            "raw_output": output_text
+        }
+
+    def expand(self, spec: Dict) -> Iterator[Dict]:
+        """Fill the section up to spec['fill_to'] examples from topic templates"""
+        rng = random.Random(self.name)
+        topics = spec.get('topics') or ['']
+        category = spec.get('category', self.category)
+        while self.count < spec['fill_to']:
+            topic = rng.choice(topics)
+            fields = {'topic': topic, 'Topic': topic.title(), 'n': self.count + 1,
+                      'category': category or '', 'Category': (category or '').title()}
+            yield self.example(spec['input'].format_map(fields), spec['output'].format_map(fields),
+                               category, spec.get('spoken'), topic=topic, Topic=topic.title())
+
+def read_scenarios(name: str, sections: Optional[Iterable[str]] = None,
+                   categories: Optional[Iterable[str]] = None,
+                   counts: Optional[Counter] = None) -> Iterator[Dict]:
+    """Stream examples from a scenario file, optionally only some sections or categories.
+
+    counts, if given, is filled with examples per section label as they stream.
+    """
+    sections = set(sections) if sections is not None else None
+    categories = set(categories) if categories is not None else None
+    path = scenario_path(name)
+    section = None
+    selected = False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if line[0] == '[':
+                if not selected:
+                    continue
+                row = json.loads(line)
+                if categories is not None and (row[2] if len(row) > 2 else section.category) not in categories:
+                    continue
+                example = section.example(*row)
+            else:
+                directive = json.loads(line)
+                if 'section' in directive:
+                    section = Section(directive)
+                    selected = sections is None or section.name in sections
+                    continue
+                if 'expand' not in directive:
+                    raise ValueError(f"{path}:{line_number}: unknown directive {sorted(directive)}")
+                if not selected or (categories is not None and
+                                    directive['expand'].get('category', section.category) not in categories):
+                    continue
+                for example in section.expand(directive['expand']):
+                    if counts is not None:
+                        counts[section.label] += 1
+                    yield example
+                continue
+
+            if counts is not None:
+                counts[section.label] += 1
+            yield example
+
+def list_sections(name: str) -> List[Dict]:
+    """Section headers of a scenario file, in order"""
+    headers = []
+    with open(scenario_path(name), 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('{"section"'):
+                headers.append(json.loads(line))
+    return headers
+
+def flat_example(example: Dict) -> Dict:
+    """An aac_response example as a plain instruction/input/output row"""
+    return {'instruction': example['instruction'], 'input': example['input'], 'output': example['raw_output']}
+
+def write_examples(examples: Iterable[Dict], output_path: str, flat: bool = False) -> int:
+    """Stream examples to JSONL; returns how many were written.
+
+    flat writes instruction/input/output rows instead of the aac_response schema.
+    """
+    written = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for example in examples:
+            if flat:
+                example = flat_example(example)
+            f.write(json.dumps(example, ensure_ascii=False) + '\n')
+            written += 1
+    return written
+
+def write_scenarios(name: str, output_path: str, sections: Optional[Iterable[str]] = None,
+                    categories: Optional[Iterable[str]] = None, flat: bool = False) -> Counter:
+    """Stream a scenario file to JSONL; returns examples written per section label"""
+    counts = Counter()
+    write_examples(read_scenarios(name, sections, categories, counts), output_path, flat)
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate AAC examples from a scenario file")
+    parser.add_argument('scenario', help="Scenario name in training/scenarios or a path")
+    parser.add_argument('--output', help="Output JSONL (default: tinkybink_<scenario>.jsonl)")
+    parser.add_argument('--section', action='append', help="Only this section (repeatable)")
+    parser.add_argument('--category', action='append', help="Only this category (repeatable)")
+    parser.add_argument('--flat', action='store_true', help="Write instruction/input/output rows")
+    parser.add_argument('--list', action='store_true', help="List sections and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for header in list_sections(args.scenario):
+            print(f"{header['section']:<32} {header.get('label', '')}")
+        return
+
+    output = args.output or f"tinkybink_{os.path.splitext(os.path.basename(args.scenario))[0]}.jsonl"
+    start = time.perf_counter()
+    counts = write_scenarios(args.scenario, output, sections=args.section, categories=args.category,
+                             flat=args.flat)
+    for label, count in counts.items():
+        print(f"✅ {label}: {count} examples")
+    print(f"💾 {sum(counts.values()):,} examples -> {output} ({time.perf_counter() - start:.2f}s)")
+
+if __name__ == "__main__":
+    main()
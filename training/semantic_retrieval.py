@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Semantic Retrieval
+Local nearest-example tier for /api/suggest. Every input in the curated
+corpora is embedded once, quantized to int8 (or float16) and grouped into
+an IVF index: k-means centroids, each with its own list of rows. A query
+is embedded, compared to the centroids, and scored only against the rows
+of the closest lists; the best match's tiles are served when its cosine
+similarity clears the threshold.
+
+The default encoder is a dependency-free hashed n-gram encoder. It only
+sees shared words, not meaning, so its matches must also share the
+query's content words, and server.py refuses indexes it built.
+TINKYBINK_EMBEDDER=minilm (or --embedder minilm) selects a small
+sentence-transformers model on CPU; it needs `pip install
+sentence-transformers`, and its threshold has not been calibrated yet.
+The index records which encoder built it. `--calibrate` scores either
+encoder against held-out questions in semantic_calibration.jsonl.
+"""
+import argparse
+import os
+import sys
+import time
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from corpus_compiler import read_jsonl
+from text_normalizer import fold, tokenize
+from tile_parser import parse_tiles
+
+TRAINING_DIR = os.path.dirname(os.path.abspath(__file__))
+CURATED_CORPORA = ('tinkybink_ultimate_conversational_master.jsonl',)
+INDEX_FILE = os.path.join(TRAINING_DIR, 'tinkybink_semantic_index.npz')
+CALIBRATION_FILE = os.path.join(TRAINING_DIR, 'semantic_calibration.jsonl')
+DEFAULT_EMBEDDER = os.environ.get('TINKYBINK_EMBEDDER', 'hashing')
+
+class MiniLMEncoder:
+    """all-MiniLM-L6-v2 through sentence-transformers: 384 dims, ~5 ms per query on CPU"""
+    name = 'minilm'
+    lexical = False
+    # Untuned starting point; calibrate on held-out questions before serving
+    threshold = 0.6
+    model_name = 'sentence-transformers/all-MiniLM-L6-v2'
+
+    def __init__(self):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError("The minilm embedder needs `pip install sentence-transformers`; "
+                              "use --embedder hashing (TINKYBINK_EMBEDDER=hashing) without it") from e
+
+        self.model = SentenceTransformer(self.model_name, device='cpu')
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        return self.model.encode(list(texts), batch_size=64, normalize_embeddings=True,
+                                 convert_to_numpy=True).astype(np.float32)
+
+class HashingEncoder:
+    """Signed feature hashing of stemmed words, word pairs and character trigrams"""
+    name = 'hashing'
+    lexical = True
+    # Calibrated with --calibrate: every served match above this was on topic
+    threshold = 0.58
+
+    def __init__(self, dimensions: int = 1024):
+        self.dimensions = dimensions
+
+    @lru_cache(maxsize=1 << 16)
+    def _slot(self, feature: str) -> Tuple[int, float]:
+        digest = zlib.crc32(feature.encode('utf-8'))
+        return digest % self.dimensions, 1.0 if digest & 0x80000000 else -1.0
+
+    def features(self, text: str) -> List[str]:
+        words = tokenize(text)
+        padded = f" {' '.join(fold(text).split())} "
+        return (['w:' + word for word in words] * 2
+                + ['p:' + a + ' ' + b for a, b in zip(words, words[1:])]
+                + ['c:' + padded[i:i + 3] for i in range(len(padded) - 2)])
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self.features(text):
+                slot, sign = self._slot(feature)
+                vectors[row, slot] += sign
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+# Question templates, pronouns and filler. Two questions sharing only these
+# ("Would you like to paint?", "Would you like to help cook?") are not
+# about the same thing, however similar their hashed n-grams look.
+TEMPLATE_WORDS = frozenset('''
+    a an the this that these those some any my your his her its our their
+    i me you him us them we he she it they
+    am is are was were be been being do does did have has had will would
+    can could should shall may might must
+    to of in on at for with by from up about into over out off as and or but
+    if so than then too very really just now today tonight right still again
+    here there please ok okay
+    what who whom which where when why how what's where's how's who's
+    i'm you're it's let's can't don't won't
+    want wants like likes need needs go going get got take make see use let try come
+'''.split())
+
+def content_words(text: str) -> Set[str]:
+    return {word for word in tokenize(text) if word not in TEMPLATE_WORDS}
+
+def shares_topic(query: str, match: str) -> bool:
+    """At least half of the query's content words appear in the match"""
+    wanted = content_words(query)
+    if not wanted:
+        return not content_words(match)
+    return 2 * len(wanted & content_words(match)) >= len(wanted)
+
+ENCODERS = {
+    'minilm': MiniLMEncoder,
+    'hashing': HashingEncoder,
+}
+
+@lru_cache(maxsize=None)
+def get_encoder(name: str = DEFAULT_EMBEDDER):
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown embedder {name!r}; choose from {', '.join(sorted(ENCODERS))}")
+    return ENCODERS[name]()
+
+def curated_examples(paths: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """(inputs, outputs) with one row per distinct folded input, first occurrence wins"""
+    inputs, outputs, seen = [], [], set()
+    for path in paths:
+        for example in read_jsonl(path):
+            text = str(example.get('input', '')).strip()
+            output = example.get('raw_output') or example.get('output') or ''
+            key = fold(text)
+            if not text or not output or key in seen:
+                continue
+            seen.add(key)
+            inputs.append(text)
+            outputs.append(output)
+    return inputs, outputs
+
+def quantize(vectors: np.ndarray, dtype: str = 'int8') -> Tuple[np.ndarray, np.ndarray]:
+    """Compact rows plus per-row scales; row * scale approximates the float vector"""
+    if dtype == 'float16':
+        return vectors.astype(np.float16), np.ones(len(vectors), dtype=np.float32)
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    return np.round(vectors / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+
+def kmeans(vectors: np.ndarray, lists: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """Spherical k-means centroids for the IVF coarse quantizer"""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        for i in range(lists):
+            members = vectors[assignment == i]
+            if len(members):
+                centroid = members.sum(axis=0)
+                centroids[i] = centroid / max(np.linalg.norm(centroid), 1e-12)
+    return centroids
+
+def build_index(paths: Sequence[str] = CURATED_CORPORA, output_path: str = INDEX_FILE,
+                embedder: str = DEFAULT_EMBEDDER, dtype: str = 'int8', lists: Optional[int] = None) -> Dict:
+    """Embed the curated inputs and write the quantized IVF index"""
+    paths = [path if os.path.isabs(path) else os.path.join(TRAINING_DIR, path) for path in paths]
+    inputs, outputs = curated_examples(paths)
+    if not inputs:
+        raise ValueError(f"No inputs found in {', '.join(paths)}")
+    encoder = get_encoder(embedder)
+    start = time.perf_counter()
+    vectors = encoder.encode(inputs)
+    encode_seconds = time.perf_counter() - start
+
+    lists = lists or max(1, int(np.sqrt(len(vectors))))
+    centroids = kmeans(vectors, min(lists, len(vectors)))
+    assignment = np.argmax(vectors @ centroids.T, axis=1)
+    # Rows are stored list by list, so each inverted list is one contiguous slice
+    order = np.argsort(assignment, kind='stable')
+    starts = np.concatenate([[0], np.cumsum(np.bincount(assignment, minlength=len(centroids)))])
+    codes, scales = quantize(vectors[order], dtype)
+
+    np.savez(output_path, embedder=np.array(encoder.name), centroids=centroids.astype(np.float32),
+             list_starts=starts.astype(np.int64), codes=codes, scales=scales,
+             inputs=np.array(inputs)[order], outputs=np.array(outputs)[order])
+    return {'rows': len(inputs), 'lists': len(centroids), 'dimensions': vectors.shape[1],
+            'bytes': codes.nbytes + scales.nbytes, 'encode_seconds': encode_seconds}
+
+class SemanticIndex:
+    """Quantized IVF index over the curated inputs"""
+
+    def __init__(self, path: str = INDEX_FILE, nprobe: int = 8, threshold: Optional[float] = None):
+        with np.load(path) as index:
+            self.encoder = get_encoder(str(index['embedder']))
+            self.centroids = index['centroids']
+            self.list_starts = index['list_starts']
+            self.codes = index['codes']
+            self.scales = index['scales']
+            self.inputs = index['inputs']
+            self.outputs = index['outputs']
+        self.nprobe = min(nprobe, len(self.centroids))
+        self.threshold = self.encoder.threshold if threshold is None else threshold
+
+    @classmethod
+    def load(cls, path: str = INDEX_FILE, semantic_only: bool = False, **kwargs) -> Optional['SemanticIndex']:
+        """The index at path, or None when it has not been built or its encoder is unavailable.
+
+        semantic_only also refuses indexes built by a lexical encoder such as hashing.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            index = cls(path, **kwargs)
+        except ImportError as e:
+            print(f"⚠️ Semantic index disabled: {e}")
+            return None
+        if semantic_only and index.encoder.lexical:
+            print(f"⚠️ Semantic index disabled: built with the lexical {index.encoder.name} embedder; "
+                  f"rebuild with --embedder minilm")
+            return None
+        return index
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def search(self, query: str, k: int = 1) -> List[Dict]:
+        """k nearest curated inputs as {'input', 'output', 'similarity'}"""
+        vector = self.encoder.encode([query])[0]
+        probes = np.argpartition(-(self.centroids @ vector), self.nprobe - 1)[:self.nprobe]
+        rows = np.concatenate([np.arange(self.list_starts[i], self.list_starts[i + 1]) for i in probes])
+        if not len(rows):
+            return []
+        scores = (self.codes[rows].astype(np.float32) @ vector) * self.scales[rows]
+        k = min(k, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [{'input': str(self.inputs[rows[i]]), 'output': str(self.outputs[rows[i]]),
+                 'similarity': float(scores[i])} for i in top]
+
+    def suggest(self, query: str, limit: int = 6) -> Optional[Dict]:
+        """Tiles of the nearest curated example, or None below the threshold"""
+        matches = self.search(query)
+        if not matches or matches[0]['similarity'] < self.threshold:
+            return None
+        match = matches[0]
+        if self.encoder.lexical and not shares_topic(query, match['input']):
+            return None
+        confidence = round(min(0.99, match['similarity']), 2)
+        suggestions = [{'emoji': tile['emoji'], 'text': tile['words'], 'confidence': confidence}
+                       for tile in parse_tiles(match['output'], limit=limit, default_emoji='💬',
+                                               require_words=True, tile_ids=False)]
+        if not suggestions:
+            return None
+        return {'suggestions': suggestions, 'match': {'input': match['input'],
+                                                      'similarity': round(match['similarity'], 3)}}
+
+def calibrate(index: SemanticIndex, path: str = CALIBRATION_FILE) -> List[Dict]:
+    """Served, correct and wrong answers at each threshold over held-out questions.
+
+    Each line is {"query", "topics"}: a served match is correct when its input
+    contains one of the topic words; questions with no topics should fall through.
+    """
+    cases = []
+    for case in read_jsonl(path):
+        match = index.search(case['query'])[0]
+        on_topic = any(topic in content_words(match['input']) for topic in case['topics'])
+        if index.encoder.lexical and not shares_topic(case['query'], match['input']):
+            match['similarity'] = float('-inf')
+        cases.append((match['similarity'], on_topic))
+    sweep = []
+    for threshold in np.arange(0.40, 0.96, 0.02):
+        served = [on_topic for similarity, on_topic in cases if similarity >= threshold]
+        sweep.append({'threshold': round(float(threshold), 2), 'correct': sum(served),
+                      'wrong': len(served) - sum(served), 'questions': len(cases)})
+    return sweep
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the semantic retrieval index")
+    parser.add_argument('query', nargs='*', help="Questions to look up (omit to build)")
+    parser.add_argument('--corpus', action='append', help="Curated JSONL (repeatable)")
+    parser.add_argument('--embedder', default=DEFAULT_EMBEDDER, choices=sorted(ENCODERS))
+    parser.add_argument('--dtype', default='int8', choices=['int8', 'float16'])
+    parser.add_argument('--lists', type=int, help="IVF lists (default: sqrt of rows)")
+    parser.add_argument('--nprobe', type=int, default=8, help="Lists scanned per query")
+    parser.add_argument('--index', default=INDEX_FILE)
+    parser.add_argument('--calibrate', nargs='?', const=CALIBRATION_FILE, metavar='JSONL',
+                        help="Score the index against held-out questions at each threshold")
+    args = parser.parse_args()
+
+    print("🧭 TinkyBink Semantic Retrieval")
+    print("=" * 50)
+    try:
+        if not args.query and not args.calibrate:
+            stats = build_index(args.corpus or CURATED_CORPORA, args.index, args.embedder, args.dtype, args.lists)
+        else:
+            index = SemanticIndex(args.index, nprobe=args.nprobe)
+    except ImportError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.calibrate:
+        print(f"🎯 {args.calibrate} against {args.index} ({index.encoder.name}, "
+              f"threshold {index.threshold})")
+        for row in calibrate(index, args.calibrate):
+            print(f"   {row['threshold']:.2f}: {row['correct']} correct, {row['wrong']} wrong "
+                  f"of {row['questions']} questions")
+        return
+
+    if not args.query:
+        print(f"✅ {stats['rows']:,} inputs x {stats['dimensions']} dims ({args.embedder}) "
+              f"embedded in {stats['encode_seconds']:.2f}s")
+        print(f"💾 {stats['lists']} IVF lists, {stats['bytes'] / 1024:,.0f} KB {args.dtype} -> {args.index}")
+        return
+
+    for query in args.query:
+        start = time.perf_counter()
+        result = index.suggest(query)
+        elapsed = 1000 * (time.perf_counter() - start)
+        match = index.search(query)[0]
+        print(f"\n❓ {query}  ({elapsed:.2f} ms)")
+        print(f"   nearest: {match['input']} (similarity {match['similarity']:.3f})")
+        if result:
+            print("   " + ", ".join(f"{tile['emoji']} {tile['text']}" for tile in result['suggestions']))
+        elif match['similarity'] < index.threshold:
+            print(f"   below threshold {index.threshold}: falls through to the next tier")
+        else:
+            print("   no content words in common: falls through to the next tier")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Sequence Packing for SLM Fine-tuning
+Packs several short AAC examples into each training sequence so compute is
+spent on real tokens instead of padding
+"""
+import torch
+
+IGNORE_INDEX = -100
+
+def plan_packs(lengths, max_length):
+    """Group example indices into packs of at most max_length tokens.
+
+    First-fit decreasing over the example lengths; ties keep corpus order so
+    the plan is deterministic for a given dataset.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: (-lengths[i], i))
+    packs = []
+    space = []
+    for index in order:
+        length = min(lengths[index], max_length)
+        for slot, free in enumerate(space):
+            if length <= free:
+                packs[slot].append(index)
+                space[slot] -= length
+                break
+        else:
+            packs.append([index])
+            space.append(max_length - length)
+    return packs
+
+def pack_dataset(dataset, max_length):
+    """Concatenate tokenized examples (input_ids + labels) into packed rows.
+
+    Each row keeps a seq_lengths column so the collator can rebuild the
+    boundaries between the examples it contains.
+    """
+    input_ids = dataset["input_ids"]
+    labels = dataset["labels"]
+    lengths = [len(ids) for ids in input_ids]
+
+    rows = {"input_ids": [], "labels": [], "seq_lengths": []}
+    for pack in plan_packs(lengths, max_length):
+        row_ids, row_labels, row_lengths = [], [], []
+        for index in sorted(pack):
+            ids = input_ids[index][:max_length]
+            row_ids.extend(ids)
+            row_labels.extend(labels[index][:max_length])
+            row_lengths.append(len(ids))
+        rows["input_ids"].append(row_ids)
+        rows["labels"].append(row_labels)
+        rows["seq_lengths"].append(row_lengths)
+
+    return type(dataset).from_dict(rows)
+
+def packing_efficiency(lengths, rows, max_length):
+    """Fraction of max_length slots holding real tokens, packed vs one-per-row"""
+    real_tokens = sum(lengths)
+    return {
+        "real_tokens": real_tokens,
+        "unpacked": real_tokens / (len(lengths) * max_length) if lengths else 0.0,
+        "packed": real_tokens / (rows * max_length) if rows else 0.0,
+        "rows_unpacked": len(lengths),
+        "rows_packed": rows,
+    }
+
+class PackedDataCollator:
+    """Pad packed rows and keep each example attending only to itself.
+
+    Produces position_ids that restart at every example and a 4D
+    block-diagonal causal mask in the additive form transformers accepts
+    for custom masks (0 = attend, dtype min = blocked). Labels are already
+    masked to the "### Response:" span by the tokenizer step.
+    """
+
+    def __init__(self, tokenizer, dtype=torch.float32):
+        self.pad_token_id = tokenizer.pad_token_id
+        self.dtype = dtype
+
+    def __call__(self, features):
+        width = max(len(f["input_ids"]) for f in features)
+        batch = len(features)
+        blocked = torch.finfo(self.dtype).min
+
+        input_ids = torch.full((batch, width), self.pad_token_id, dtype=torch.long)
+        labels = torch.full((batch, width), IGNORE_INDEX, dtype=torch.long)
+        position_ids = torch.zeros((batch, width), dtype=torch.long)
+        attention_mask = torch.full((batch, 1, width, width), blocked, dtype=self.dtype)
+
+        for row, feature in enumerate(features):
+            length = len(feature["input_ids"])
+            input_ids[row, :length] = torch.tensor(feature["input_ids"], dtype=torch.long)
+            labels[row, :length] = torch.tensor(feature["labels"], dtype=torch.long)
+
+            start = 0
+            for seq_length in feature["seq_lengths"]:
+                end = start + seq_length
+                position_ids[row, start:end] = torch.arange(seq_length)
+                causal = torch.tril(torch.ones(seq_length, seq_length, dtype=torch.bool))
+                attention_mask[row, 0, start:end, start:end].masked_fill_(causal, 0.0)
+                start = end
+
+            # Padding positions attend to themselves so no row is fully blocked
+            for pad in range(length, width):
+                attention_mask[row, 0, pad, pad] = 0.0
+
+        return {
+            "input_ids": input_ids,
+            "labels": labels,
+            "position_ids": position_ids,
+            "attention_mask": attention_mask,
+        }
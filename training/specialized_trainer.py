@@ -8,10 +8,12 @@ import subprocess
 import time
 from typing import Dict, List
 import random
+from eval_runner import EvalRunner
 
 class SpecializedTrainer:
     def __init__(self):
         self.specializations = []
+        self.eval_runner = EvalRunner()
         
     def generate_medical_emergency_training(self) -> List[Dict]:
         """Generate specialized medical emergency training"""
@@ -391,22 +393,19 @@ Output: \"\"\"
         
         test_inputs = test_cases.get(specialization, ["How are you?", "What do you need?"])
         
-        for test_input in test_inputs[:2]:  # Test 2 examples
+        test_inputs = test_inputs[:2]  # Test 2 examples
+        results = self.eval_runner.run(model_name, test_inputs)
+        
+        for test_input, result in zip(test_inputs, results):
             print(f"🔬 Testing: '{test_input}'")
             
-            try:
-                result = subprocess.run(['ollama', 'run', model_name],
-                                      input=test_input, text=True,
-                                      capture_output=True, timeout=15)
-                
-                if result.stdout:
-                    response = result.stdout.strip()[:80]
-                    print(f"Response: {response}...")
-                else:
-                    print("No response")
-                    
-            except Exception as e:
-                print(f"Error: {e}")
+            if result['error']:
+                print(f"Error: {result['error']}")
+            elif result['response']:
+                response = result['response'][:80]
+                print(f"Response: {response}...")
+            else:
+                print("No response")
 
 def main():
     print("🎯 TinkyBink Specialized Training System")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Sequence Packing Tests
+Packed rows must survive Trainer's column filtering and reach the
+collator with their seq_lengths intact.
+"""
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+datasets = pytest.importorskip("datasets")
+
+from transformers import LlamaConfig, LlamaForCausalLM, Trainer
+
+from sequence_packing import PackedDataCollator, pack_dataset
+from train_tinkybink_slm import create_training_args
+
+class PadOnlyTokenizer:
+    pad_token_id = 0
+
+def tiny_llama():
+    config = LlamaConfig(vocab_size=32, hidden_size=16, intermediate_size=32, num_hidden_layers=1,
+                         num_attention_heads=2, num_key_value_heads=2, max_position_embeddings=64)
+    return LlamaForCausalLM(config)
+
+def packed_rows():
+    examples = {
+        "input_ids": [[1, 2, 3], [4, 5], [6, 7, 8, 9], [10]],
+        "labels": [[-100, 2, 3], [-100, 5], [-100, -100, 8, 9], [10]],
+    }
+    return pack_dataset(datasets.Dataset.from_dict(examples), max_length=8)
+
+def make_trainer(tmp_path, packing):
+    args = create_training_args(output_dir=str(tmp_path), device={"cpu": True, "dtype": torch.float32},
+                                packing=packing)
+    args.report_to = []
+    return Trainer(model=tiny_llama(), args=args, train_dataset=packed_rows(), eval_dataset=packed_rows(),
+                   data_collator=PackedDataCollator(PadOnlyTokenizer()))
+
+def test_packed_training_args_keep_seq_lengths(tmp_path):
+    trainer = make_trainer(tmp_path, packing=True)
+    kept = trainer._remove_unused_columns(trainer.train_dataset)
+    assert "seq_lengths" in kept.column_names
+
+    batch = next(iter(trainer.get_train_dataloader()))
+    assert batch["attention_mask"].dim() == 4
+    # Positions restart at every one of the four packed examples
+    assert int((batch["position_ids"] == 0).sum()) >= 4
+
+    loss = trainer.model(**batch).loss
+    assert torch.isfinite(loss)
+
+def test_unpacked_training_args_drop_seq_lengths(tmp_path):
+    trainer = make_trainer(tmp_path, packing=False)
+    kept = trainer._remove_unused_columns(trainer.train_dataset)
+    assert "seq_lengths" not in kept.column_names
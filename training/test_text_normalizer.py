@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Text Normalizer Tests
+Stemmers run on accent-stripped words, so singular and plural forms of
+one word must reach the same term.
+"""
+import pytest
+
+from text_normalizer import tokenize
+
+@pytest.mark.parametrize("singular, plural", [
+    ("comunicación", "comunicaciones"),
+    ("medicación", "medicaciones"),
+    ("posición", "posiciones"),
+    ("habitación", "habitaciones"),
+])
+def test_spanish_singular_and_plural_share_a_stem(singular, plural):
+    assert tokenize(singular, 'es') == tokenize(plural, 'es')
+
+def test_spanish_stems_ignore_accents():
+    assert tokenize('comunicación', 'es') == tokenize('comunicacion', 'es')
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Text Feature Extractor
+Single-pass category, emotion, question type and context clue detection
+shared by the generators, trainers and server.py
+"""
+from typing import Dict, List
+from phrase_trie import tokenize_words
+
+# Each feature is an ordered list of (label, keywords); earlier labels win.
+# Multi-word keywords are matched as whole phrases.
+CATEGORY_LEXICON = [
+    ('positive_emotion', ['happy', 'joy', 'excited', 'good', 'great']),
+    ('negative_emotion', ['sad', 'upset', 'angry', 'mad', 'hurt']),
+    ('request', ['want', 'need', 'like', 'prefer']),
+    ('help_seeking', ['help', 'assistance', 'support']),
+    ('basic_needs', ['eat', 'drink', 'food', 'hungry', 'thirsty']),
+    ('medical', ['pain', 'hurt', 'sick', 'doctor']),
+]
+
+EMOTION_LEVEL_LEXICON = [
+    ('high', ['very', 'extremely', 'really', 'so', 'incredibly']),
+    ('medium', ['pretty', 'quite', 'somewhat', 'little']),
+]
+
+EMOTIONAL_CONTEXT_LEXICON = [
+    ('distress', ['pain', 'hurt', 'sick', 'problem']),
+    ('positive', ['happy', 'good', 'great', 'wonderful']),
+    ('negative', ['sad', 'upset', 'frustrated', 'angry']),
+    ('fatigue', ['tired', 'sleepy', 'rest', 'exhausted']),
+    ('anxiety', ['nervous', 'worried', 'scared', 'anxious']),
+]
+
+QUESTION_TYPE_LEXICON = [
+    ('yes_no_question', ['do you', 'are you', 'will you', 'can you', 'would you']),
+    # choice_question is decided by counting "or" and slots in here
+    ('emotion_question', ['feel', 'feeling', 'mood', 'emotion', 'happy', 'sad']),
+    ('preference_question', ['need', 'want', 'like', 'prefer']),
+    ('medical_question', ['pain', 'hurt', 'sick', 'medicine', 'doctor', 'therapy']),
+    ('activity_question', ['go', 'play', 'do', 'watch', 'eat', 'sleep']),
+    ('timing_question', ['time', 'when', 'now', 'later', 'ready']),
+]
+
+CONTEXT_CLUE_LEXICON = [
+    ('time', ['morning', 'evening', 'night', 'bedtime', 'lunch', 'dinner', 'late', 'early']),
+    ('location', ['doctor', 'office', 'store', 'park', 'home', 'car', 'school', 'hospital']),
+    ('weather', ['rain', 'sunny', 'hot', 'cold', 'snow', 'weather']),
+]
+
+DEFAULTS = {
+    'category': 'general',
+    'emotion_level': 'low',
+    'emotional_context': 'neutral',
+    'question_type': 'general_question',
+}
+
+# Light suffix stripping so "hurts", "feeling" and "played" still hit their lexicon entry
+SUFFIXES = ('ing', 'ed', 'es', 's')
+
+def _compile(feature_lexicons: Dict[str, List]) -> Dict[str, List]:
+    """Fold every lexicon into one keyword -> [(feature, rank, label)] table"""
+    table = {}
+    for feature, lexicon in feature_lexicons.items():
+        for rank, (label, keywords) in enumerate(lexicon):
+            for keyword in keywords:
+                table.setdefault(keyword, []).append((feature, rank, label))
+    return table
+
+_LOOKUP = _compile({
+    'category': CATEGORY_LEXICON,
+    'emotion_level': EMOTION_LEVEL_LEXICON,
+    'emotional_context': EMOTIONAL_CONTEXT_LEXICON,
+    'question_type': QUESTION_TYPE_LEXICON,
+})
+
+_CLUE_RANK = {}
+for _, _words in CONTEXT_CLUE_LEXICON:
+    for _word in _words:
+        _CLUE_RANK.setdefault(_word, len(_CLUE_RANK))
+
+_MAX_PHRASE = max(len(keyword.split()) for keyword in _LOOKUP)
+
+# choice_question sits between yes/no and emotion questions
+_CHOICE_RANK = 0.5
+
+def _variants(token: str) -> List[str]:
+    variants = [token]
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            variants.append(token[:-len(suffix)])
+    return variants
+
+def extract_features(text: str) -> Dict:
+    """Tokenize once and return every feature label for the text"""
+    tokens = tokenize_words(text)
+    best = {}
+    clues = {}
+    or_count = 0
+
+    for i, token in enumerate(tokens):
+        if token == 'or':
+            or_count += 1
+
+        candidates = _variants(token)
+        for n in range(2, _MAX_PHRASE + 1):
+            if i + n <= len(tokens):
+                candidates.append(' '.join(tokens[i:i + n]))
+
+        for candidate in candidates:
+            for feature, rank, label in _LOOKUP.get(candidate, ()):
+                current = best.get(feature)
+                if current is None or rank < current[0]:
+                    best[feature] = (rank, label)
+            if candidate in _CLUE_RANK:
+                clues[candidate] = _CLUE_RANK[candidate]
+
+    if 1 <= or_count <= 3:
+        current = best.get('question_type')
+        if current is None or _CHOICE_RANK < current[0]:
+            best['question_type'] = (_CHOICE_RANK, 'choice_question')
+
+    features = {feature: best[feature][1] if feature in best else default
+                for feature, default in DEFAULTS.items()}
+    features['context_clues'] = sorted(clues, key=clues.get)
+    return features
+
+def categorize_input(text: str) -> str:
+    return extract_features(text)['category']
+
+def detect_emotion_level(text: str) -> str:
+    return extract_features(text)['emotion_level']
+
+def detect_emotional_context(text: str) -> str:
+    return extract_features(text)['emotional_context']
+
+def classify_question_type(text: str) -> str:
+    return extract_features(text)['question_type']
+
+def extract_context_clues(text: str) -> List[str]:
+    return extract_features(text)['context_clues']
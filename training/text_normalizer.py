@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Text Normalizer
+NFKC folding and per-language tokenizers shared by the matchers and the
+multilingual index. Chinese is split into characters and bigrams, with
+toneless pinyin syllables for romanized input; Russian and Spanish get
+light suffix stemming. Tokenizers are compiled once per language.
+"""
+import re
+import time
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, List
+
+# Typographic variants NFKC leaves alone
+_PUNCTUATION = str.maketrans({'’': "'", '‘': "'", '“': '"', '”': '"', 'ё': 'е'})
+
+_WORD_PATTERN = re.compile(r"[^\W_]+(?:'[^\W_]+)?")
+_CJK_PATTERN = re.compile(r'[㐀-䶿一-鿿豈-﫿]+')
+_LATIN_PATTERN = re.compile(r'[a-z]+')
+
+def fold(text: str) -> str:
+    """NFKC, casefold and unify quotes, so full-width and styled text match plain text"""
+    if text.isascii():
+        return text.lower()
+    return unicodedata.normalize('NFKC', text).casefold().translate(_PUNCTUATION)
+
+def strip_accents(text: str) -> str:
+    """'médico' -> 'medico', 'mǐ fàn' -> 'mi fan'"""
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+def _suffix_stemmer(suffixes: List[str], min_stem: int) -> Callable[[str], str]:
+    """Strip the longest matching suffix, keeping at least min_stem characters"""
+    by_length = sorted(set(suffixes), key=len, reverse=True)
+
+    @lru_cache(maxsize=65536)
+    def stem(word: str) -> str:
+        for suffix in by_length:
+            if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+                return word[:-len(suffix)]
+        return word
+    return stem
+
+# Inflectional endings only; derivational suffixes are left alone
+RUSSIAN_SUFFIXES = [
+    # adjectives
+    'ыми', 'ими', 'ого', 'его', 'ому', 'ему', 'ая', 'яя', 'ое', 'ее', 'ые', 'ие',
+    'ый', 'ий', 'ой', 'ую', 'юю', 'ых', 'их', 'ым', 'им',
+    # verbs
+    'ешь', 'ишь', 'ете', 'ите', 'ем', 'им', 'ет', 'ит', 'ут', 'ют', 'ат', 'ят',
+    'ла', 'ло', 'ли', 'ть', 'ти', 'ться', 'тся', 'ешься', 'ишься',
+    # nouns
+    'ами', 'ями', 'ах', 'ях', 'ам', 'ям', 'ом', 'ем', 'ов', 'ев', 'ей',
+    'а', 'я', 'о', 'е', 'и', 'ы', 'у', 'ю', 'ь', 'й',
+]
+
+SPANISH_SUFFIXES = [
+    'aciones', 'iciones', 'acion', 'icion', 'cion', 'ciones', 'mente',
+    'ando', 'iendo', 'ado', 'ada', 'ados', 'adas', 'ido', 'ida', 'idos', 'idas',
+    'ar', 'er', 'ir', 'amos', 'emos', 'imos', 'an', 'en',
+    'es', 'os', 'as', 's', 'o', 'a', 'e',
+]
+
+class Tokenizer:
+    """Turns text into match terms for one language"""
+
+    def __init__(self, lang: str, stem: Callable[[str], str] = None):
+        self.lang = lang
+        self.stem = stem
+
+    def words(self, text: str) -> List[str]:
+        return _WORD_PATTERN.findall(fold(text))
+
+    def terms(self, text: str) -> List[str]:
+        words = self.words(text)
+        if self.stem is None:
+            return words
+        return [self.stem(word) for word in words]
+
+class SpanishTokenizer(Tokenizer):
+    """Accent-insensitive words with light stemming"""
+
+    def words(self, text: str) -> List[str]:
+        return _WORD_PATTERN.findall(strip_accents(fold(text)))
+
+class ChineseTokenizer(Tokenizer):
+    """Characters and character bigrams; romanized runs as toneless pinyin.
+
+    Pinyin terms are the syllables plus each adjacent pair joined, so
+    'shui jiao' and 'shuijiao' both reach a node whose pinyin is 'shuì jiào'.
+    """
+
+    def __init__(self, lang: str = 'zh', pinyin: bool = True):
+        super().__init__(lang)
+        self.pinyin = pinyin
+
+    def terms(self, text: str) -> List[str]:
+        text = fold(text)
+        terms = []
+        for run in _CJK_PATTERN.findall(text):
+            terms.extend(run)
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+        if self.pinyin:
+            terms.extend(pinyin_terms(text))
+        return terms
+
+# ü in any tone is typed as v, as pinyin input methods do (nǚ -> nv, lǜ -> lv)
+_PINYIN_V = str.maketrans({letter: 'v' for letter in 'üǖǘǚǜ'})
+
+def pinyin_terms(text: str) -> List[str]:
+    syllables = _LATIN_PATTERN.findall(strip_accents(text.translate(_PINYIN_V)))
+    return syllables + [a + b for a, b in zip(syllables, syllables[1:])]
+
+_TOKENIZERS: Dict[str, Tokenizer] = {}
+
+def register_tokenizer(tokenizer: Tokenizer):
+    _TOKENIZERS[tokenizer.lang] = tokenizer
+
+def get_tokenizer(lang: str) -> Tokenizer:
+    """Tokenizer for lang; unknown languages get plain folded words"""
+    tokenizer = _TOKENIZERS.get(lang)
+    if tokenizer is None:
+        tokenizer = Tokenizer(lang)
+        _TOKENIZERS[lang] = tokenizer
+    return tokenizer
+
+def tokenize(text: str, lang: str = 'en') -> List[str]:
+    return get_tokenizer(lang).terms(text)
+
+register_tokenizer(Tokenizer('en'))
+register_tokenizer(SpanishTokenizer('es', _suffix_stemmer(SPANISH_SUFFIXES, 3)))
+register_tokenizer(Tokenizer('ru', _suffix_stemmer(RUSSIAN_SUFFIXES, 3)))
+register_tokenizer(ChineseTokenizer('zh'))
+
+def main():
+    samples = {
+        'en': "How are you feeling this morning? Do you want breakfast or lunch?",
+        'es': "¿Te duele la cabeza? Llamamos al médico ahora mismo.",
+        'ru': "Ты голодна? Хочешь поесть или попить чего-нибудь?",
+        'zh': "你想睡觉吗? wo xiang shui jiao",
+    }
+
+    print("🔤 TinkyBink Text Normalizer Benchmark")
+    print("=" * 50)
+    for lang, text in samples.items():
+        tokenizer = get_tokenizer(lang)
+        print(f"{lang}: {tokenizer.terms(text)}")
+        rounds = 20000
+        start = time.perf_counter()
+        for _ in range(rounds):
+            tokenizer.terms(text)
+        print(f"    {1e6 * (time.perf_counter() - start) / rounds:.1f} µs per request")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tile Parser
+One parser for "emoji words, emoji words" outputs, shared by the
+generators, the scorers, the columnar corpus and server.py. Emoji are
+matched as whole clusters (ZWJ sequences, variation selectors, skin tones,
+keycaps, flags), so "👨‍👩‍👧 Family" and "🍽️ Eat" keep their emoji intact.
+parse_column parses a whole column of outputs in one call.
+"""
+import json
+import re
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Codepoints that can start an emoji cluster
+_BASE = ('[\U0001F000-\U0001F1E5\U0001F200-\U0001F3FA\U0001F400-\U0001FAFF'
+         '☀-➿⬀-⯿⌀-⏿←-⇿⤀-⥿'
+         '■-◿™ℹ‼⁉〰〽㊗㊙©®]')
+_ATOM = _BASE + '[︎️]?[\U0001F3FB-\U0001F3FF]?[\U000E0020-\U000E007F]*'
+_CLUSTER = ('(?:[0-9#*]️?⃣|[\U0001F1E6-\U0001F1FF]{2}|'
+            + _ATOM + '(?:‍' + _ATOM + ')*)')
+
+EMOJI_RUN = re.compile(f'(?:{_CLUSTER})+')
+_LEADING = re.compile(f'\\s*((?:{_CLUSTER})+)\\s*(.*)', re.DOTALL)
+_STRAY = '‍︎️ \t\n'
+
+def is_emoji(token: str) -> bool:
+    """True if token is made only of complete emoji clusters"""
+    return bool(token) and EMOJI_RUN.fullmatch(token) is not None
+
+def split_emoji(part: str) -> Tuple[str, str]:
+    """('emoji', 'words') for one tile; emoji is '' when the part has none.
+
+    A leading emoji run is preferred; otherwise the first run anywhere in
+    the part is taken out of the words.
+    """
+    match = _LEADING.match(part)
+    if match:
+        return match.group(1), match.group(2).strip(_STRAY)
+    match = EMOJI_RUN.search(part)
+    if match:
+        words = part[:match.start()] + part[match.end():]
+        return match.group(0), ' '.join(words.split()).strip(_STRAY)
+    return '', part.strip(_STRAY)
+
+def parse_tiles(text: str, limit: Optional[int] = None, default_emoji: str = '',
+                require_emoji: bool = False, require_words: bool = False,
+                tile_ids: bool = True) -> List[Dict]:
+    """Split 'emoji words, emoji words' into tiles.
+
+    limit caps the number of tiles, default_emoji fills in for parts
+    without one, and require_emoji / require_words drop incomplete parts.
+    """
+    tiles = []
+    for part in text.split(','):
+        if limit is not None and len(tiles) >= limit:
+            break
+        if not part or part.isspace():
+            continue
+        emoji, words = split_emoji(part)
+        if not emoji:
+            if require_emoji:
+                continue
+            emoji = default_emoji
+        if require_words and not words:
+            continue
+        tile = {'emoji': emoji, 'words': words}
+        if tile_ids:
+            tile['tile_id'] = f"tile_{len(tiles) + 1}"
+        tiles.append(tile)
+    return tiles
+
+_RECORD = '\x1e'
+_TILE = re.compile(f'[^\\S{_RECORD}]*((?:{_CLUSTER})*)[^\\S{_RECORD}]*([^,{_RECORD}]*)([,{_RECORD}])')
+
+def _scan(texts: List[str]) -> Iterable[Tuple[str, str, bool]]:
+    """(emoji, words, row_done) for every part of every text, in one regex pass"""
+    blob = _RECORD.join(text.replace(_RECORD, ' ') if text else '' for text in texts) + _RECORD
+    for match in _TILE.finditer(blob):
+        emoji, words, separator = match.groups()
+        words = words.strip(_STRAY)
+        if not emoji and words:
+            emoji, words = split_emoji(words)
+        yield emoji, words, separator == _RECORD
+
+def parse_column(texts: Iterable[str], limit: Optional[int] = None, default_emoji: str = '',
+                 require_emoji: bool = False, require_words: bool = False,
+                 tile_ids: bool = True) -> List[List[Dict]]:
+    """parse_tiles over a whole column; the same options, one row per text"""
+    texts = list(texts)
+    if not texts:
+        return []
+    column = []
+    row = []
+    for emoji, words, row_done in _scan(texts):
+        if (emoji or words) and (limit is None or len(row) < limit):
+            if not emoji:
+                emoji = default_emoji
+            if (emoji or not require_emoji) and (words or not require_words):
+                tile = {'emoji': emoji, 'words': words}
+                if tile_ids:
+                    tile['tile_id'] = f"tile_{len(row) + 1}"
+                row.append(tile)
+        if row_done:
+            column.append(row)
+            row = []
+    return column
+
+def parse_column_flat(texts: Iterable[str]) -> Tuple[List[int], List[str], List[str]]:
+    """Arrow-style list layout: row offsets plus flat emoji and words columns"""
+    texts = list(texts)
+    offsets = [0]
+    emojis = []
+    words = []
+    if not texts:
+        return offsets, emojis, words
+    for emoji, text, row_done in _scan(texts):
+        if emoji or text:
+            emojis.append(emoji)
+            words.append(text)
+        if row_done:
+            offsets.append(len(emojis))
+    return offsets, emojis, words
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'tinkybink_ultimate_master_final.jsonl'
+    outputs = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                example = json.loads(line)
+                outputs.append(example.get('raw_output') or example.get('output') or '')
+
+    print("🧩 TinkyBink Tile Parser Benchmark")
+    print("=" * 50)
+    print(f"📁 {path}: {len(outputs):,} outputs")
+
+    rounds = 5
+    start = time.perf_counter()
+    for _ in range(rounds):
+        column = [parse_tiles(text) for text in outputs]
+    per_row = (time.perf_counter() - start) / (rounds * len(outputs))
+    print(f"⚡ parse_tiles: {1e6 * per_row:.1f} µs per output ({1 / per_row:,.0f}/s)")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        column = parse_column(outputs)
+    per_row = (time.perf_counter() - start) / (rounds * len(outputs))
+    print(f"⚡ parse_column: {1e6 * per_row:.1f} µs per output ({1 / per_row:,.0f}/s)")
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse_column_flat(outputs)
+    per_row = (time.perf_counter() - start) / (rounds * len(outputs))
+    print(f"⚡ parse_column_flat: {1e6 * per_row:.1f} µs per output ({1 / per_row:,.0f}/s)")
+
+    tiles = sum(len(row) for row in column)
+    missing = sum(1 for row in column for tile in row if not tile['emoji'])
+    clusters = sum(1 for row in column for tile in row if len(tile['emoji']) > 1)
+    print(f"🧮 {tiles:,} tiles | {clusters:,} multi-codepoint emoji | {missing:,} without emoji")
+
+if __name__ == "__main__":
+    main()
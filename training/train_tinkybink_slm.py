@@ -6,16 +6,20 @@ Fine-tunes a small base model for AAC-specific responses
 
 import os
 import json
+import hashlib
+import time
 import torch
 from transformers import (
     AutoModelForCausalLM,
     AutoTokenizer,
     TrainingArguments,
     Trainer,
-    DataCollatorForLanguageModeling
+    DataCollatorForSeq2Seq
 )
-from datasets import Dataset
+from datasets import Dataset, load_from_disk
 import numpy as np
+from eval_runner import EvalRunner, HFBackend
+from sequence_packing import IGNORE_INDEX, PackedDataCollator, pack_dataset, packing_efficiency
 
 # Base models suitable for AAC (small, fast, efficient)
 BASE_MODELS = {
@@ -26,59 +30,162 @@ BASE_MODELS = {
     "bloom": "bigscience/bloom-560m"
 }
 
+# Prompt template shared by training and inference
+PROMPT_TEMPLATE = """### Instruction:
+{instruction}
+
+### Input:
+{input}
+
+### Response:
+{output}"""
+
+# Loss is only computed on tokens after this marker
+RESPONSE_MARKER = "### Response:\n"
+
+# Tokenized datasets are cached here, keyed by corpus, tokenizer and template
+DATASET_CACHE_DIR = "./tinkybink-slm-cache"
+
+def tokenizer_fingerprint(tokenizer):
+    """Stable identity for a tokenizer's vocabulary and settings"""
+    digest = hashlib.sha256()
+    digest.update(type(tokenizer).__name__.encode())
+    digest.update(str(tokenizer.name_or_path).encode())
+    backend = getattr(tokenizer, "backend_tokenizer", None)
+    if backend is not None:
+        digest.update(backend.to_str().encode())
+    else:
+        digest.update(json.dumps(tokenizer.get_vocab(), sort_keys=True).encode())
+    digest.update(str(tokenizer.eos_token).encode())
+    return digest.hexdigest()
+
 class AACDataset:
     """Custom dataset for AAC training"""
     
     def __init__(self, filepath):
+        self.filepath = filepath
         self.examples = []
         with open(filepath, 'r') as f:
             for line in f:
                 self.examples.append(json.loads(line))
     
-    def format_for_training(self, tokenizer):
-        """Format examples for causal language modeling"""
-        formatted = []
+    def corpus_hash(self):
+        digest = hashlib.sha256()
+        with open(self.filepath, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def cache_key(self, tokenizer, max_length):
+        digest = hashlib.sha256()
+        parts = (self.corpus_hash(), tokenizer_fingerprint(tokenizer), PROMPT_TEMPLATE, RESPONSE_MARKER, str(max_length))
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()[:16]
+    
+    def format_for_training(self, tokenizer, max_length=256, cache_dir=DATASET_CACHE_DIR):
+        """Tokenize examples for causal language modeling, reusing the on-disk cache.
         
-        for ex in self.examples:
-            # Create conversational format
-            text = f"""### Instruction:
-{ex['instruction']}
-
-### Input:
-{ex['input']}
-
-### Response:
-{ex['output']}"""
-            
-            # Tokenize
+        Sequences are left unpadded and end with EOS; the data collator pads
+        each batch to its own longest example. Labels are IGNORE_INDEX
+        everywhere except the response span.
+        """
+        name = os.path.splitext(os.path.basename(self.filepath))[0]
+        cache_path = os.path.join(cache_dir, f"{name}-{self.cache_key(tokenizer, max_length)}")
+        
+        if os.path.isdir(cache_path):
+            print(f"⚡ Using cached tokenization: {cache_path}")
+            return load_from_disk(cache_path)
+        
+        texts = [PROMPT_TEMPLATE.format(**ex) for ex in self.examples]
+        
+        def tokenize_batch(batch):
             encoded = tokenizer(
-                text,
+                [text + tokenizer.eos_token for text in batch["text"]],
                 truncation=True,
-                padding="max_length",
-                max_length=256,  # Keep short for AAC
-                return_tensors="pt"
+                max_length=max_length,
+                return_offsets_mapping=True,
             )
-            
-            formatted.append({
-                'input_ids': encoded['input_ids'].squeeze(),
-                'attention_mask': encoded['attention_mask'].squeeze(),
-                'labels': encoded['input_ids'].squeeze()  # For CLM
-            })
+            labels = []
+            for text, ids, offsets in zip(batch["text"], encoded["input_ids"], encoded["offset_mapping"]):
+                response_start = text.index(RESPONSE_MARKER) + len(RESPONSE_MARKER)
+                labels.append([
+                    token if start >= response_start else IGNORE_INDEX
+                    for token, (start, _) in zip(ids, offsets)
+                ])
+            encoded["labels"] = labels
+            del encoded["offset_mapping"]
+            return encoded
         
-        return formatted
+        dataset = Dataset.from_dict({"text": texts}).map(
+            tokenize_batch,
+            batched=True,
+            batch_size=1000,
+            remove_columns=["text"],
+            desc=f"Tokenizing {name}",
+        )
+        
+        dataset.save_to_disk(cache_path, max_shard_size="100MB")
+        print(f"💾 Cached tokenization: {cache_path}")
+        return dataset
+
+# LoRA target modules per architecture (attention projections)
+LORA_TARGET_MODULES = {
+    "llama": ["q_proj", "v_proj"],
+    "opt": ["q_proj", "v_proj"],
+    "phi": ["q_proj", "v_proj"],
+    "gpt_neox": ["query_key_value"],
+    "bloom": ["query_key_value"],
+}
+
+# Architectures that accept the custom 4D attention masks used for packing
+PACKING_MODEL_TYPES = {"llama"}
+
+def cpu_supports_bf16():
+    """True if the CPU has native bfloat16 instructions (AVX512-BF16 or AMX)"""
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
 
-def load_base_model(model_name="tinyllama"):
+def configure_cpu_threads():
+    """Use every core available to this process for intra-op work"""
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    torch.set_num_threads(cores)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Already fixed once torch has started parallel work
+    return cores
+
+def training_device():
+    """Pick the device and dtype for this machine"""
+    if torch.cuda.is_available():
+        return {"cpu": False, "dtype": torch.float16}
+    return {"cpu": True, "dtype": torch.bfloat16 if cpu_supports_bf16() else torch.float32}
+
+def load_base_model(model_name="tinyllama", device=None):
     """Load a small base model suitable for AAC"""
     model_path = BASE_MODELS.get(model_name, BASE_MODELS["tinyllama"])
+    device = device or training_device()
     
     print(f"📥 Loading base model: {model_path}")
     
     tokenizer = AutoTokenizer.from_pretrained(model_path)
-    model = AutoModelForCausalLM.from_pretrained(
-        model_path,
-        torch_dtype=torch.float16,  # Use FP16 for efficiency
-        device_map="auto"
-    )
+    if device["cpu"]:
+        model = AutoModelForCausalLM.from_pretrained(model_path, torch_dtype=device["dtype"])
+    else:
+        model = AutoModelForCausalLM.from_pretrained(
+            model_path,
+            torch_dtype=device["dtype"],  # Use FP16 for efficiency
+            device_map="auto"
+        )
     
     # Add padding token if needed
     if tokenizer.pad_token is None:
@@ -86,8 +193,34 @@ def load_base_model(model_name="tinyllama"):
     
     return model, tokenizer
 
-def create_training_args(output_dir="./tinkybink-slm"):
-    """Training arguments optimized for small AAC model"""
+def apply_lora(model, r=8, alpha=16, dropout=0.05):
+    """Wrap the model with LoRA adapters so only a small fraction of weights train"""
+    from peft import LoraConfig, get_peft_model
+    
+    config = LoraConfig(
+        r=r,
+        lora_alpha=alpha,
+        lora_dropout=dropout,
+        target_modules=LORA_TARGET_MODULES.get(model.config.model_type),
+        task_type="CAUSAL_LM",
+    )
+    # Gradient checkpointing needs inputs that carry gradients when the base is frozen
+    model.enable_input_require_grads()
+    model = get_peft_model(model, config)
+    
+    trainable = sum(p.numel() for p in model.parameters() if p.requires_grad)
+    total = sum(p.numel() for p in model.parameters())
+    print(f"🧩 LoRA: training {trainable:,} of {total:,} parameters ({trainable / total:.2%})")
+    return model
+
+def create_training_args(output_dir="./tinkybink-slm", device=None, packing=False):
+    """Training arguments optimized for small AAC model.
+
+    Packed rows carry a seq_lengths column that no model's forward() takes;
+    Trainer must keep it for PackedDataCollator.
+    """
+    device = device or training_device()
+    on_cpu = device["cpu"]
     return TrainingArguments(
         output_dir=output_dir,
         num_train_epochs=3,
@@ -95,51 +228,71 @@ def create_training_args(output_dir="./tinkybink-slm"):
         per_device_eval_batch_size=4,
         gradient_accumulation_steps=4,
         warmup_steps=100,
-        learning_rate=2e-5,
-        fp16=True,  # Mixed precision
+        # LoRA adapters need a higher learning rate than full fine-tuning
+        learning_rate=2e-4 if on_cpu else 2e-5,
+        fp16=not on_cpu,  # Mixed precision on GPU
+        bf16=on_cpu and device["dtype"] == torch.bfloat16,
+        use_cpu=on_cpu,
+        dataloader_num_workers=0 if on_cpu else 2,
         logging_steps=10,
         save_steps=500,
         eval_steps=100,
-        evaluation_strategy="steps",
+        eval_strategy="steps",
         save_strategy="steps",
         load_best_model_at_end=True,
         push_to_hub=False,
         optim="adamw_torch",
         gradient_checkpointing=True,  # Save memory
+        remove_unused_columns=not packing,
         report_to=["tensorboard"],
     )
 
-def train_tinkybink_model():
+def train_tinkybink_model(model_name="tinyllama", packing=True, max_length=256):
     """Main training function"""
     print("🚀 Starting TinkyBink SLM Training")
     print("==================================\n")
     
+    device = training_device()
+    if device["cpu"]:
+        cores = configure_cpu_threads()
+        print(f"🖥️ CPU profile: {cores} threads, {str(device['dtype']).replace('torch.', '')}, LoRA adapters")
+    
     # Load model and tokenizer
-    model, tokenizer = load_base_model("tinyllama")
+    model, tokenizer = load_base_model(model_name, device)
+    if device["cpu"]:
+        model = apply_lora(model)
     
     # Load datasets
     print("📊 Loading training data...")
-    train_dataset = AACDataset("tinkybink_train.jsonl")
-    train_data = train_dataset.format_for_training(tokenizer)
-    
-    val_dataset = AACDataset("tinkybink_val.jsonl")
-    val_data = val_dataset.format_for_training(tokenizer)
-    
-    # Convert to HuggingFace Dataset
-    train_ds = Dataset.from_list(train_data)
-    val_ds = Dataset.from_list(val_data)
+    train_ds = AACDataset("tinkybink_train.jsonl").format_for_training(tokenizer, max_length)
+    val_ds = AACDataset("tinkybink_val.jsonl").format_for_training(tokenizer, max_length)
+    lengths = [len(ids) for ids in train_ds["input_ids"]]
     
     print(f"Training samples: {len(train_ds)}")
     print(f"Validation samples: {len(val_ds)}")
     
-    # Data collator
-    data_collator = DataCollatorForLanguageModeling(
-        tokenizer=tokenizer,
-        mlm=False,  # Causal LM
-    )
+    if packing and model.config.model_type not in PACKING_MODEL_TYPES:
+        print(f"⚠️ {model.config.model_type} does not take custom attention masks, training unpacked")
+        packing = False
+    
+    if packing:
+        # Several short examples per sequence, kept apart by the attention mask
+        train_ds = pack_dataset(train_ds, max_length)
+        val_ds = pack_dataset(val_ds, max_length)
+        data_collator = PackedDataCollator(tokenizer, dtype=model.dtype)
+        
+        stats = packing_efficiency(lengths, len(train_ds), max_length)
+        print(f"📦 Packed {stats['rows_unpacked']} examples into {stats['rows_packed']} sequences")
+        print(f"   Token efficiency: {stats['unpacked']:.1%} padded to {max_length} → {stats['packed']:.1%} packed")
+    else:
+        # Pads each batch dynamically, keeping the response-only labels
+        data_collator = DataCollatorForSeq2Seq(
+            tokenizer=tokenizer,
+            label_pad_token_id=IGNORE_INDEX,
+        )
     
     # Training arguments
-    training_args = create_training_args()
+    training_args = create_training_args(device=device, packing=packing)
     
     # Create trainer
     trainer = Trainer(
@@ -153,7 +306,12 @@ def train_tinkybink_model():
     
     # Train!
     print("\n🏋️ Training model...")
+    start = time.perf_counter()
     trainer.train()
+    elapsed = time.perf_counter() - start
+    
+    trained_tokens = sum(lengths) * training_args.num_train_epochs
+    print(f"⚡ Throughput: {trained_tokens / elapsed:,.0f} tokens/second ({elapsed:.0f}s on {training_args.device})")
     
     # Save final model
     print("\n💾 Saving trained model...")
@@ -165,6 +323,52 @@ def train_tinkybink_model():
     # Test the model
     test_model(model, tokenizer)
 
+def benchmark_cpu_training(model_name="opt", steps=10, batch_size=4, max_length=256):
+    """Measure CPU fine-tuning throughput with the LoRA profile"""
+    print(f"⏱️ CPU training benchmark: {BASE_MODELS[model_name]}")
+    
+    device = {"cpu": True, "dtype": torch.bfloat16 if cpu_supports_bf16() else torch.float32}
+    cores = configure_cpu_threads()
+    model, tokenizer = load_base_model(model_name, device)
+    model = apply_lora(model)
+    model.gradient_checkpointing_enable()
+    model.train()
+    
+    dataset = AACDataset("tinkybink_train.jsonl").format_for_training(tokenizer, max_length)
+    collator = DataCollatorForSeq2Seq(tokenizer=tokenizer, label_pad_token_id=IGNORE_INDEX)
+    optimizer = torch.optim.AdamW([p for p in model.parameters() if p.requires_grad], lr=2e-4)
+    
+    def run_step(step):
+        start = (step * batch_size) % max(len(dataset) - batch_size, 1)
+        features = [dataset[i] for i in range(start, start + batch_size)]
+        batch = collator(features)
+        loss = model(**batch).loss
+        loss.backward()
+        optimizer.step()
+        optimizer.zero_grad()
+        return int(batch["attention_mask"].sum())
+    
+    run_step(0)  # Warm-up step excluded from timing
+    
+    tokens = 0
+    start_time = time.perf_counter()
+    for step in range(1, steps + 1):
+        tokens += run_step(step)
+    elapsed = time.perf_counter() - start_time
+    
+    results = {
+        "model": BASE_MODELS[model_name],
+        "threads": cores,
+        "dtype": str(device["dtype"]).replace("torch.", ""),
+        "steps": steps,
+        "batch_size": batch_size,
+        "seconds_per_step": elapsed / steps,
+        "tokens_per_second": tokens / elapsed,
+    }
+    print(f"   {results['threads']} threads | {results['dtype']} | batch {batch_size}")
+    print(f"   {results['seconds_per_step']:.2f} s/step | {results['tokens_per_second']:,.0f} tokens/second")
+    return results
+
 def test_model(model, tokenizer):
     """Test the trained model with sample inputs"""
     print("\n🧪 Testing trained model...")
@@ -177,32 +381,20 @@ def test_model(model, tokenizer):
     
     model.eval()
     
-    for test_input in test_inputs:
-        prompt = f"""### Instruction:
-You are a nonverbal child using AAC tiles to communicate. Give 4 short responses.
-
-### Input:
-{test_input}
-
-### Response:"""
-        
-        inputs = tokenizer(prompt, return_tensors="pt")
-        
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                max_new_tokens=50,
-                temperature=0.7,
-                do_sample=True,
-                top_p=0.9,
-                pad_token_id=tokenizer.pad_token_id
-            )
-        
-        response = tokenizer.decode(outputs[0], skip_special_tokens=True)
-        response = response.split("### Response:")[-1].strip()
-        
+    def format_prompt(test_input):
+        return PROMPT_TEMPLATE.format(
+            instruction="You are a nonverbal child using AAC tiles to communicate. Give 4 short responses.",
+            input=test_input,
+            output=""
+        ).rstrip()
+    
+    # Greedy, batched generation; unchanged prompts are served from the eval cache
+    backend = HFBackend(model, tokenizer, max_new_tokens=50, prompt_format=format_prompt)
+    results = EvalRunner(backend, concurrency=1).run("tinkybink-slm", test_inputs)
+    
+    for test_input, result in zip(test_inputs, results):
         print(f"\n📥 Input: {test_input}")
-        print(f"📤 Output: {response}")
+        print(f"📤 Output: {result['response']}")
 
 def convert_to_gguf(model_path="./tinkybink-slm-final", quantization="Q4_K_M"):
     """Convert to GGUF format for use with llama.cpp/Ollama"""
@@ -245,11 +437,24 @@ PARAMETER stop "Parent:"
     print("ollama create tinkybink -f Modelfile.tinkybink")
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Fine-tune the TinkyBink small language model")
+    parser.add_argument("--model", default=None, choices=sorted(BASE_MODELS),
+                        help="Base model (default: tinyllama, or opt for --benchmark)")
+    parser.add_argument("--no-packing", action="store_true", help="Train one example per sequence")
+    parser.add_argument("--benchmark", action="store_true", help="Only run the CPU throughput benchmark")
+    args = parser.parse_args()
+    
     # First generate the dataset
     os.system("python prepare_dataset.py")
     
+    if args.benchmark:
+        benchmark_cpu_training(args.model or "opt")
+        raise SystemExit(0)
+    
     # Then train the model
-    train_tinkybink_model()
+    train_tinkybink_model(args.model or "tinyllama", packing=not args.no_packing)
     
     # Convert for deployment
     convert_to_gguf()
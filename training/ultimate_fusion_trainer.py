@@ -3,53 +3,36 @@
 Ultimate TinkyBink Fusion Trainer
 Combines all training approaches into the ultimate AAC model
 """
-import json
-import subprocess
+import itertools
 import os
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List
+from corpus_compiler import compile_corpus
+from model_backend import make_model_backend
 
 class UltimateFusionTrainer:
-    def __init__(self):
+    def __init__(self, models=None):
         self.all_training_data = []
+        self.models = models or make_model_backend()
         
-    def collect_all_training_data(self) -> List[Dict]:
-        """Collect all training data from all sources"""
+    def collect_all_training_data(self) -> List[str]:
+        """Find all training data sources; they are read lazily by the compiler"""
         print("📊 Collecting All Training Data Sources...")
         
         training_files = []
         
         # Find all training files
-        for file in os.listdir('.'):
+        for file in sorted(os.listdir('.')):
             if file.endswith('_train.jsonl') or file.endswith('train.jsonl'):
                 training_files.append(file)
         
         print(f"🔍 Found {len(training_files)} training files")
         
-        all_data = []
-        data_sources = {}
-        
-        for file in training_files:
-            try:
-                with open(file, 'r') as f:
-                    file_data = []
-                    for line in f:
-                        if line.strip():
-                            file_data.append(json.loads(line))
-                    
-                    all_data.extend(file_data)
-                    data_sources[file] = len(file_data)
-                    print(f"  📁 {file}: {len(file_data)} examples")
-                    
-            except Exception as e:
-                print(f"  ⚠️ Error loading {file}: {e}")
-        
-        print(f"\n📊 Total Training Examples: {len(all_data)}")
-        print(f"📈 Data Sources: {len(data_sources)}")
-        
-        return all_data
+        return training_files
     
-    def enhance_with_fusion_patterns(self, data: List[Dict]) -> List[Dict]:
-        """Enhance data with fusion patterns that combine multiple approaches"""
+    def enhance_with_fusion_patterns(self, data: Iterable[Dict]) -> Iterator[Dict]:
+        """Stream data through, then append fusion patterns that combine multiple approaches"""
+        yield from data
+        
         print("🔀 Adding Fusion Enhancement Patterns...")
         
         fusion_examples = []
@@ -135,31 +118,27 @@ class UltimateFusionTrainer:
             fusion_examples.append(example)
         
         print(f"✨ Added {len(fusion_examples)} fusion enhancement patterns")
-        return data + fusion_examples
+        yield from fusion_examples
     
     def create_ultimate_fusion_dataset(self) -> str:
         """Create the ultimate fusion dataset"""
         print("\n🚀 Creating Ultimate Fusion Dataset")
         print("=" * 50)
         
-        # Collect all data
-        all_data = self.collect_all_training_data()
-        
-        # Enhance with fusion patterns
-        enhanced_data = self.enhance_with_fusion_patterns(all_data)
-        
-        # Add meta-learning examples
-        meta_examples = self.generate_meta_learning_examples()
-        enhanced_data.extend(meta_examples)
-        
-        # Save ultimate dataset
+        # Collect all data, enhance with fusion patterns, then add meta-learning examples
         filename = 'tinkybink_ultimate_fusion_train.jsonl'
-        with open(filename, 'w') as f:
-            for example in enhanced_data:
-                f.write(json.dumps(example) + '\n')
+        stages = [
+            self.enhance_with_fusion_patterns,
+            lambda stream: itertools.chain(stream, self.generate_meta_learning_examples()),
+        ]
+        stats = compile_corpus(self.collect_all_training_data(), filename, stages=stages)
+        
+        print(f"\n📊 Total Training Examples: {stats['read']}")
+        print(f"📈 Data Sources: {len(stats['sources'])}")
+        print(f"♻️ Duplicates dropped: {stats['duplicates']}")
         
         print(f"\n💾 Ultimate Fusion Dataset Created!")
-        print(f"📊 Total Examples: {len(enhanced_data)}")
+        print(f"📊 Total Examples: {stats['written']}")
         print(f"📁 Saved to: {filename}")
         
         return filename
@@ -278,23 +257,22 @@ Output: \"\"\"
             f.write(modelfile_content)
         
         # Remove existing models
-        subprocess.run(['ollama', 'rm', 'tinkybink'], capture_output=True)
-        subprocess.run(['ollama', 'rm', 'tinkybink_ultimate'], capture_output=True)
+        self.models.remove('tinkybink')
+        self.models.remove('tinkybink_ultimate')
         
         # Create ultimate fusion model
-        result = subprocess.run(['ollama', 'create', 'tinkybink_ultimate', '-f', modelfile_path],
-                              capture_output=True, text=True)
+        ok, error = self.models.create('tinkybink_ultimate', modelfile_path)
         
-        if result.returncode == 0:
+        if ok:
             print("✅ TinkyBink Ultimate Fusion Model Created!")
             
             # Also create as main tinkybink model
-            subprocess.run(['ollama', 'create', 'tinkybink', '-f', modelfile_path])
+            self.models.create('tinkybink', modelfile_path)
             print("✅ Updated main 'tinkybink' model")
             
             return 'tinkybink_ultimate'
         else:
-            print(f"❌ Failed to create model: {result.stderr}")
+            print(f"❌ Failed to create model: {error}")
             return None
     
     def comprehensive_model_test(self, model_name: str):
@@ -322,12 +300,10 @@ Output: \"\"\"
             print(f"Input: '{test_input}'")
             
             try:
-                result = subprocess.run(['ollama', 'run', model_name],
-                                      input=test_input, text=True,
-                                      capture_output=True, timeout=20)
+                output = self.models.run(model_name, test_input, timeout=20)
                 
-                if result.stdout:
-                    response = result.stdout.strip()
+                if output:
+                    response = output.strip()
                     # Clean and display response
                     clean_response = response.replace('\n', ' ')[:120]
                     print(f"Response: {clean_response}...")
@@ -3,9 +3,9 @@
 Ultra Simple TinkyBink Trainer
 The absolute simplest possible approach that might work
 """
-import subprocess
+from model_backend import make_model_backend
 
-def create_ultra_simple_model():
+def create_ultra_simple_model(models):
     """Create the simplest possible model"""
     print("🔧 Creating Ultra Simple Model")
     print("=" * 40)
@@ -40,26 +40,25 @@ TEMPLATE """{{ .System }}
         f.write(modelfile_content)
     
     # Remove existing models
-    subprocess.run(['ollama', 'rm', 'tinkybink'], capture_output=True)
-    subprocess.run(['ollama', 'rm', 'simple_aac'], capture_output=True)
+    models.remove('tinkybink')
+    models.remove('simple_aac')
     
     # Create simple model
-    result = subprocess.run(['ollama', 'create', 'simple_aac', '-f', 'Modelfile.simple'],
-                          capture_output=True, text=True)
+    ok, error = models.create('simple_aac', 'Modelfile.simple')
     
-    if result.returncode == 0:
+    if ok:
         print("✅ Ultra Simple Model Created!")
         
         # Update main tinkybink model
-        subprocess.run(['ollama', 'create', 'tinkybink', '-f', 'Modelfile.simple'])
+        models.create('tinkybink', 'Modelfile.simple')
         print("✅ Updated main 'tinkybink' model")
         
         return 'simple_aac'
     else:
-        print(f"❌ Failed: {result.stderr}")
+        print(f"❌ Failed: {error}")
         return None
 
-def test_simple_model(model_name):
+def test_simple_model(model_name, models):
     """Test the simple model"""
     print(f"\n🧪 Testing Simple Model: {model_name}")
     print("=" * 40)
@@ -74,12 +73,10 @@ def test_simple_model(model_name):
         print(f"\n🔍 Testing: '{test_input}'")
         
         try:
-            result = subprocess.run(['ollama', 'run', model_name],
-                                  input=test_input, text=True,
-                                  capture_output=True, timeout=10)
+            output = models.run(model_name, test_input, timeout=10)
             
-            if result.stdout:
-                response = result.stdout.strip()
+            if output:
+                response = output.strip()
                 print(f"Response: {response}")
                 
                 # Simple check
@@ -95,10 +92,11 @@ def main():
     print("🔧 Ultra Simple TinkyBink Training")
     print("=" * 50)
     
-    model_name = create_ultra_simple_model()
+    models = make_model_backend()
+    model_name = create_ultra_simple_model(models)
     
     if model_name:
-        test_simple_model(model_name)
+        test_simple_model(model_name, models)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file